@@ -2,8 +2,10 @@ from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
     Account,
+    AccountPrefixSearchParams,
     AccountSearchByIdParams,
     AccountSearchParams,
+    AccountSegmentPageParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     AccountDeletionResult,
@@ -17,6 +19,8 @@ from modules.notification.notification_service import NotificationService
 from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
     AccountNotificationPreferences,
+    DeviceToken,
+    RegisterDeviceTokenParams,
 )
 
 
@@ -67,6 +71,7 @@ class AccountService:
         )
 
         AuthenticationService.set_password_reset_token_as_used_by_id(password_reset_token_id=password_reset_token.id)
+        AuthenticationService.revoke_tokens_by_account_id(account_id=params.account_id)
 
         return updated_account
 
@@ -78,6 +83,14 @@ class AccountService:
     def get_account_by_username(*, username: str) -> Account:
         return AccountReader.get_account_by_username(username=username)
 
+    @staticmethod
+    def search_accounts_by_prefix(*, params: AccountPrefixSearchParams) -> list[Account]:
+        return AccountReader.search_accounts_by_prefix(params=params)
+
+    @staticmethod
+    def get_accounts_in_segment(*, params: AccountSegmentPageParams) -> list[Account]:
+        return AccountReader.get_accounts_in_segment(params=params)
+
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
         return AccountReader.get_account_by_username_and_password(params=params)
@@ -98,6 +111,18 @@ class AccountService:
     def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
         return NotificationService.get_account_notification_preferences_by_account_id(account_id=account_id)
 
+    @staticmethod
+    def register_device_token(*, account_id: str, params: RegisterDeviceTokenParams) -> DeviceToken:
+        return NotificationService.register_device_token(account_id=account_id, params=params)
+
+    @staticmethod
+    def remove_device_token(*, account_id: str, token: str) -> None:
+        return NotificationService.remove_device_token(account_id=account_id, token=token)
+
     @staticmethod
     def delete_account(*, account_id: str) -> AccountDeletionResult:
-        return AccountWriter.delete_account(account_id=account_id)
+        account_deletion_result = AccountWriter.delete_account(account_id=account_id)
+        AuthenticationService.revoke_tokens_by_account_id(account_id=account_id)
+        NotificationService.remove_device_tokens_by_account_id(account_id=account_id)
+
+        return account_deletion_result
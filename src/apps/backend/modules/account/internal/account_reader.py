@@ -1,7 +1,8 @@
 from dataclasses import asdict
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from bson.objectid import ObjectId
+from pymongo import ASCENDING
 
 from modules.account.errors import (
     AccountInvalidPasswordError,
@@ -12,20 +13,29 @@ from modules.account.errors import (
     AccountWithUsernameNotFoundError,
 )
 from modules.account.internal.account_util import AccountUtil
-from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.internal.store.account_repository import ACCOUNT_NAME_COLLATION, AccountRepository
 from modules.account.types import (
     Account,
+    AccountPrefixSearchLimit,
+    AccountPrefixSearchParams,
     AccountSearchByIdParams,
     AccountSearchParams,
+    AccountSegmentPageParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
 
 
 class AccountReader:
+    # Upper bound for collated prefix ranges, U+FFFF sorts after every other character
+    PREFIX_RANGE_END = "\uffff"
+    PREFIX_SEARCH_FIELDS = ("username", "first_name", "last_name")
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
-        account_bson = AccountRepository.collection().find_one({"username": username, "active": True})
+        account_bson = AccountRepository.collection().find_one(
+            {"username": username, "active": True}, collation=ACCOUNT_NAME_COLLATION
+        )
         if account_bson is None:
             raise AccountWithUsernameNotFoundError(username=username)
 
@@ -49,11 +59,70 @@ class AccountReader:
 
     @staticmethod
     def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
-        account_bson = AccountRepository.collection().find_one({"active": True, "username": params.username})
+        account_bson = AccountRepository.collection().find_one(
+            {"active": True, "username": params.username}, collation=ACCOUNT_NAME_COLLATION
+        )
 
         if account_bson:
             raise AccountWithUserNameExistsError(username=params.username)
 
+    @staticmethod
+    def search_accounts_by_prefix(*, params: AccountPrefixSearchParams) -> list[Account]:
+        limit = min(params.limit, AccountPrefixSearchLimit.MAX)
+        prefix_range = {"$gte": params.prefix, "$lt": params.prefix + AccountReader.PREFIX_RANGE_END}
+
+        # One query per field, each sorted by the field its own index covers. A single $or sorted by username would
+        # make every name match sort in memory. The first `limit` matches of each field are merged by username.
+        accounts_by_id: Dict[str, Account] = {}
+        for field in AccountReader.PREFIX_SEARCH_FIELDS:
+            cursor = (
+                AccountRepository.collection()
+                .find(
+                    {field: prefix_range, "active": True},
+                    projection={"hashed_password": False},
+                    collation=ACCOUNT_NAME_COLLATION,
+                )
+                .sort(field, ASCENDING)
+                .limit(limit)
+            )
+            for account_bson in cursor:
+                account = AccountUtil.convert_account_bson_to_account(account_bson)
+                accounts_by_id[account.id] = account
+
+        accounts = sorted(accounts_by_id.values(), key=lambda account: (account.username.casefold(), account.id))
+        return accounts[:limit]
+
+    @staticmethod
+    def get_accounts_in_segment(*, params: AccountSegmentPageParams) -> list[Account]:
+        # Accounts created with a phone number have no username, so there is no address to reach them by email
+        query: Dict[str, Any] = {"active": True, "username": {"$ne": ""}}
+
+        account_id_query: Dict[str, Any] = {}
+        if params.segment.account_ids is not None:
+            account_id_query["$in"] = [ObjectId(account_id) for account_id in params.segment.account_ids]
+        if params.after_account_id is not None:
+            account_id_query["$gt"] = ObjectId(params.after_account_id)
+        if account_id_query:
+            query["_id"] = account_id_query
+
+        created_at_query: Dict[str, Any] = {}
+        if params.segment.created_after is not None:
+            created_at_query["$gte"] = params.segment.created_after
+        if params.segment.created_before is not None:
+            created_at_query["$lt"] = params.segment.created_before
+        if created_at_query:
+            query["created_at"] = created_at_query
+
+        # Paged in _id order, so each page is a range scan on _id and the last _id is a stable resume point
+        cursor = (
+            AccountRepository.collection()
+            .find(query, projection={"hashed_password": False})
+            .sort("_id", ASCENDING)
+            .limit(params.limit)
+        )
+
+        return [AccountUtil.convert_account_bson_to_account(account_bson) for account_bson in cursor]
+
     @staticmethod
     def get_account_by_phone_number_optional(*, phone_number: PhoneNumber) -> Optional[Account]:
         phone_number_dict = asdict(phone_number)
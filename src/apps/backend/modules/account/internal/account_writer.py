@@ -4,8 +4,9 @@ from datetime import datetime
 from bson.objectid import ObjectId
 from phonenumbers import is_valid_number, parse
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.errors import AccountWithIdNotFoundError, AccountWithUserNameExistsError
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_model import AccountModel
@@ -36,7 +37,11 @@ class AccountWriter:
             phone_number=None,
             username=params.username,
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
+        try:
+            query = AccountRepository.collection().insert_one(account_bson)
+        except DuplicateKeyError:
+            # A concurrent signup won the race for the same case-insensitive username
+            raise AccountWithUserNameExistsError(username=params.username)
         account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
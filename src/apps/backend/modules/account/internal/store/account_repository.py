@@ -1,3 +1,4 @@
+from pymongo.collation import Collation, CollationStrength
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
@@ -20,6 +21,16 @@ ACCOUNT_VALIDATION_SCHEMA = {
                 "description": "must be an object with country_code and phone_number",
             },
             "username": {"bsonType": "string", "description": "must be a string"},
+            "notification_preferences": {
+                "bsonType": "object",
+                "properties": {
+                    "email_enabled": {"bsonType": "bool"},
+                    "push_enabled": {"bsonType": "bool"},
+                    "sms_enabled": {"bsonType": "bool"},
+                    "updated_at": {"bsonType": "date"},
+                },
+                "description": "must be an object with notification channel flags",
+            },
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
         },
@@ -27,6 +38,9 @@ ACCOUNT_VALIDATION_SCHEMA = {
     }
 }
 
+# Case-insensitive comparison for usernames and names. Queries must pass the same collation to use the indexes below.
+ACCOUNT_NAME_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
 
 class AccountRepository(ApplicationRepository):
     collection_name = AccountModel.get_collection_name()
@@ -36,6 +50,32 @@ class AccountRepository(ApplicationRepository):
         collection.create_index("username")
         collection.create_index([("active", 1), ("username", 1)], name="active_username_index")
         collection.create_index([("active", 1), ("phone_number", 1)], name="active_phone_number_index")
+        collection.create_index(
+            [("first_name", 1)],
+            collation=ACCOUNT_NAME_COLLATION,
+            partialFilterExpression={"active": True},
+            name="active_first_name_ci_index",
+        )
+        collection.create_index(
+            [("last_name", 1)],
+            collation=ACCOUNT_NAME_COLLATION,
+            partialFilterExpression={"active": True},
+            name="active_last_name_ci_index",
+        )
+
+        try:
+            # Phone number accounts have an empty username, so they are left out of the unique index
+            collection.create_index(
+                [("username", 1)],
+                collation=ACCOUNT_NAME_COLLATION,
+                unique=True,
+                partialFilterExpression={"active": True, "username": {"$gt": ""}},
+                name="active_username_ci_unique",
+            )
+        except OperationFailure as e:
+            Logger.error(
+                message=f"Could not create case-insensitive username index for collection accounts: {e.details}"
+            )
 
         add_validation_command = {
             "collMod": cls.collection_name,
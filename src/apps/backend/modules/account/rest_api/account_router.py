@@ -9,6 +9,7 @@ class AccountRouter:
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
         blueprint.add_url_rule("/accounts", view_func=AccountView.as_view("account_view"))
+        blueprint.add_url_rule("/accounts/search", view_func=AccountView.search_accounts, methods=["GET"])
         blueprint.add_url_rule(
             AccountRouter.ACCOUNT_BY_ID_URL, view_func=AccountView.as_view("account_view_by_id"), methods=["GET"]
         )
@@ -25,4 +26,13 @@ class AccountRouter:
             methods=["PATCH"],
         )
 
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/device-tokens", view_func=AccountView.register_device_token, methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/device-tokens/<token>",
+            view_func=AccountView.remove_device_token,
+            methods=["DELETE"],
+        )
+
         return blueprint
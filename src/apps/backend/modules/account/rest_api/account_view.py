@@ -7,6 +7,8 @@ from flask.views import MethodView
 from modules.account.account_service import AccountService
 from modules.account.errors import AccountBadRequestError
 from modules.account.types import (
+    AccountPrefixSearchLimit,
+    AccountPrefixSearchParams,
     AccountSearchByIdParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
@@ -15,9 +17,12 @@ from modules.account.types import (
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.errors import UnauthorizedAccessError
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
-from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams, RegisterDeviceTokenParams
 
 
 class AccountView(MethodView):
@@ -28,6 +33,9 @@ class AccountView(MethodView):
             phone_number_data = request_data["phone_number"]
             phone_number_obj = PhoneNumber(**phone_number_data)
             account_params = CreateAccountByPhoneNumberParams(phone_number=phone_number_obj)
+            AuthenticationService.check_otp_request_rate_limit(
+                client_ip=request.remote_addr, phone_number=phone_number_obj
+            )
             account = AccountService.get_or_create_account_by_phone_number(params=account_params)
         elif "username" in request_data and "password" in request_data:
             account_params = CreateAccountByUsernameAndPasswordParams(**request_data)
@@ -112,3 +120,52 @@ class AccountView(MethodView):
         )
 
         return jsonify(asdict(updated_preferences)), 200
+
+    @staticmethod
+    @access_auth_middleware
+    def register_device_token(account_id: str) -> ResponseReturnValue:
+        request_data = request.get_json(silent=True)
+
+        if request_data is None:
+            raise AccountBadRequestError("Request body is required")
+
+        device_token_params = RegisterDeviceTokenParams(
+            platform=request_data.get("platform", ""), token=request_data.get("token", "")
+        )
+        device_token = AccountService.register_device_token(account_id=account_id, params=device_token_params)
+
+        return jsonify(asdict(device_token)), 201
+
+    @staticmethod
+    @access_auth_middleware
+    def remove_device_token(account_id: str, token: str) -> ResponseReturnValue:
+        AccountService.remove_device_token(account_id=account_id, token=token)
+        return "", 204
+
+    @staticmethod
+    @access_auth_middleware
+    def search_accounts() -> ResponseReturnValue:
+        admin_account_ids = ConfigService.get_list(key="accounts.admin_account_ids", default=[])
+        if getattr(request, "account_id") not in admin_account_ids:
+            raise UnauthorizedAccessError("Account search is restricted to admin accounts.")
+
+        prefix = request.args.get("q", "").strip()
+        if not prefix:
+            raise AccountBadRequestError("Search prefix (q) is required")
+
+        limit = request.args.get("limit", default=AccountPrefixSearchLimit.DEFAULT, type=int)
+        if limit < 1 or limit > AccountPrefixSearchLimit.MAX:
+            raise AccountBadRequestError(f"Limit must be between 1 and {AccountPrefixSearchLimit.MAX}")
+
+        accounts = AccountService.search_accounts_by_prefix(
+            params=AccountPrefixSearchParams(prefix=prefix, limit=limit)
+        )
+
+        items = []
+        for account in accounts:
+            account_dict = asdict(account)
+            # Never sent to clients, even blank
+            account_dict.pop("hashed_password", None)
+            items.append(account_dict)
+
+        return jsonify({"items": items}), 200
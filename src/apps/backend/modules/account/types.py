@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 
 @dataclass(frozen=True)
@@ -9,6 +9,32 @@ class AccountSearchParams:
     username: str
 
 
+@dataclass(frozen=True)
+class AccountPrefixSearchParams:
+    prefix: str
+    limit: int
+
+
+@dataclass(frozen=True)
+class AccountPrefixSearchLimit:
+    DEFAULT: int = 10
+    MAX: int = 20
+
+
+@dataclass(frozen=True)
+class AccountSegment:
+    account_ids: Optional[List[str]] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class AccountSegmentPageParams:
+    limit: int
+    segment: AccountSegment
+    after_account_id: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class AccountSearchByIdParams:
     id: str
@@ -0,0 +1,93 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, List, Optional, Tuple, TypeVar, Union, cast
+
+from modules.application.common.types import UNSET, CacheStats
+
+CacheKey = TypeVar("CacheKey")
+CacheValue = TypeVar("CacheValue")
+
+
+class BoundedTTLCache(Generic[CacheKey, CacheValue]):
+    """
+    Thread-safe LRU cache with a fixed number of entries. Every entry expires at an absolute unix timestamp,
+    either given on `set` or derived from the default TTL.
+    """
+
+    def __init__(self, *, max_size: int, ttl_in_seconds: Optional[float] = None) -> None:
+        self._entries: OrderedDict[CacheKey, Tuple[CacheValue, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl_in_seconds = ttl_in_seconds
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: CacheKey, value: CacheValue, *, expires_at: Optional[float] = None) -> None:
+        if expires_at is None and self._ttl_in_seconds is not None:
+            expires_at = time.time() + self._ttl_in_seconds
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+
+    def get_expired_keys(self, *, scan_limit: int) -> List[CacheKey]:
+        # Only the least recently used entries are scanned, so the cost stays bounded however large the cache is
+        now = time.time()
+        with self._lock:
+            return [
+                key
+                for key, (_, expires_at) in itertools.islice(self._entries.items(), scan_limit)
+                if expires_at is not None and expires_at <= now
+            ]
+
+    def delete(self, key: CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, *, max_size: int, ttl_in_seconds: Union[Optional[float], object] = UNSET) -> None:
+        # The default TTL is kept unless a new one is passed, None removes it
+        with self._lock:
+            self._max_size = max_size
+            if ttl_in_seconds is not UNSET:
+                self._ttl_in_seconds = cast(Optional[float], ttl_in_seconds)
+            self._evict_overflow()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                evictions=self._evictions,
+                hits=self._hits,
+                max_size=self._max_size,
+                misses=self._misses,
+                size=len(self._entries),
+            )
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
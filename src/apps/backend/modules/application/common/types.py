@@ -43,3 +43,17 @@ class PaginationResult(Generic[T]):
 
 
 UNSET = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    evictions: int
+    hits: int
+    max_size: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -1,13 +1,22 @@
 import urllib.parse
 from dataclasses import asdict
+from typing import Optional
 
 from modules.account.types import Account, PhoneNumber
+from modules.application.common.types import CacheStats
+from modules.authentication.errors import AccessTokenInvalidError
 from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
 from modules.authentication.internals.otp.otp_util import OTPUtil
 from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.stateless_otp_util import StatelessOTPUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_reader import PasswordResetTokenReader
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.rate_limit.rate_limit_util import RateLimitUtil
+from modules.authentication.internals.rate_limit.rate_limit_writer import RateLimitWriter
+from modules.authentication.internals.refresh_token.refresh_token_writer import RefreshTokenWriter
+from modules.authentication.internals.token_epoch.token_epoch_reader import TokenEpochReader
+from modules.authentication.internals.token_epoch.token_epoch_writer import TokenEpochWriter
 from modules.authentication.types import (
     OTP,
     AccessToken,
@@ -15,18 +24,20 @@ from modules.authentication.types import (
     CreateOTPParams,
     OTPBasedAuthAccessTokenRequestParams,
     PasswordResetToken,
+    RateLimitRuleName,
+    RefreshTokenBasedAuthAccessTokenRequestParams,
     VerifyOTPParams,
 )
 from modules.config.config_service import ConfigService
 from modules.notification.email_service import EmailService
 from modules.notification.sms_service import SMSService
-from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
+from modules.notification.types import EmailRecipient, EmailSender, EmailTemplateType, SendEmailParams, SendSMSParams
 
 
 class AuthenticationService:
     @staticmethod
     def create_access_token_by_username_and_password(*, account: Account) -> AccessToken:
-        return AccessTokenUtil.generate_access_token(account=account)
+        return AuthenticationService._create_access_token_for_account_id(account_id=account.id)
 
     @staticmethod
     def create_access_token_by_phone_number(
@@ -37,11 +48,36 @@ class AuthenticationService:
         )
         AccessTokenUtil.validate_otp_for_access_token(otp=otp)
 
-        return AccessTokenUtil.generate_access_token(account=account)
+        return AuthenticationService._create_access_token_for_account_id(account_id=account.id)
+
+    @staticmethod
+    def create_access_token_by_refresh_token(*, params: RefreshTokenBasedAuthAccessTokenRequestParams) -> AccessToken:
+        refresh_token = RefreshTokenWriter.rotate_refresh_token(token=params.refresh_token)
+        return AccessTokenUtil.generate_access_token(
+            account_id=refresh_token.account_id,
+            refresh_token=refresh_token,
+            token_epoch=TokenEpochReader.get_token_epoch(account_id=refresh_token.account_id),
+        )
+
+    @staticmethod
+    def revoke_tokens_by_account_id(*, account_id: str) -> None:
+        TokenEpochWriter.increment_token_epoch(account_id=account_id)
+        RefreshTokenWriter.revoke_refresh_tokens_by_account_id(account_id=account_id)
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        return AccessTokenUtil.verify_access_token(token=token)
+        access_token_payload = AccessTokenUtil.verify_access_token(token=token)
+
+        if not TokenEpochReader.is_token_epoch_current(
+            account_id=access_token_payload.account_id, token_epoch=access_token_payload.token_epoch
+        ):
+            raise AccessTokenInvalidError("Access token has been revoked. Please login again.")
+
+        return access_token_payload
+
+    @staticmethod
+    def get_verified_access_token_cache_stats() -> CacheStats:
+        return AccessTokenUtil.get_verified_token_cache_stats()
 
     @staticmethod
     def create_password_reset_token(params: Account) -> PasswordResetToken:
@@ -69,7 +105,10 @@ class AuthenticationService:
         web_app_host = ConfigService[str].get_value(key="web_app_host")
         default_email = ConfigService[str].get_value(key="mailer.default_email")
         default_email_name = ConfigService[str].get_value(key="mailer.default_email_name")
-        forgot_password_mail_template_id = ConfigService[str].get_value(key="mailer.forgot_password_mail_template_id")
+        forgot_password_mail_template_id = EmailService.get_template_id(
+            sendgrid_template_id_key="mailer.forgot_password_mail_template_id",
+            template_type=EmailTemplateType.FORGOT_PASSWORD,
+        )
 
         template_data = {
             "first_name": first_name,
@@ -105,3 +144,45 @@ class AuthenticationService:
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         return OTPWriter.verify_otp(params=params)
+
+    @staticmethod
+    def validate_otp_config() -> None:
+        StatelessOTPUtil.validate_signing_key()
+
+    @staticmethod
+    def check_otp_request_rate_limit(*, client_ip: Optional[str], phone_number: PhoneNumber) -> None:
+        if not RateLimitUtil.is_rate_limit_enabled():
+            return
+
+        if client_ip:
+            RateLimitWriter.consume(rule_name=RateLimitRuleName.OTP_BY_IP, identifier=client_ip)
+        RateLimitWriter.consume(
+            rule_name=RateLimitRuleName.OTP_BY_PHONE_NUMBER,
+            identifier=f"{phone_number.country_code}{phone_number.phone_number}",
+        )
+
+    @staticmethod
+    def check_access_token_request_rate_limit(
+        *, client_ip: Optional[str], phone_number: Optional[PhoneNumber] = None, username: Optional[str] = None
+    ) -> None:
+        if not RateLimitUtil.is_rate_limit_enabled():
+            return
+
+        if client_ip:
+            RateLimitWriter.consume(rule_name=RateLimitRuleName.LOGIN_BY_IP, identifier=client_ip)
+        if phone_number:
+            RateLimitWriter.consume(
+                rule_name=RateLimitRuleName.LOGIN_BY_PHONE_NUMBER,
+                identifier=f"{phone_number.country_code}{phone_number.phone_number}",
+            )
+        if username:
+            RateLimitWriter.consume(rule_name=RateLimitRuleName.LOGIN_BY_USERNAME, identifier=username.lower())
+
+    @staticmethod
+    def _create_access_token_for_account_id(*, account_id: str) -> AccessToken:
+        refresh_token = RefreshTokenWriter.create_refresh_token(account_id=account_id)
+        return AccessTokenUtil.generate_access_token(
+            account_id=account_id,
+            refresh_token=refresh_token,
+            token_epoch=TokenEpochReader.get_token_epoch(account_id=account_id),
+        )
@@ -1,5 +1,10 @@
 from modules.application.errors import AppError
-from modules.authentication.types import AccessTokenErrorCode, OTPErrorCode, PasswordResetTokenErrorCode
+from modules.authentication.types import (
+    AccessTokenErrorCode,
+    OTPErrorCode,
+    PasswordResetTokenErrorCode,
+    RateLimitErrorCode,
+)
 
 
 class AccessTokenInvalidError(AppError):
@@ -29,6 +34,15 @@ class InvalidAuthorizationHeaderError(AppError):
         super().__init__(code=AccessTokenErrorCode.INVALID_AUTHORIZATION_HEADER, http_status_code=401, message=message)
 
 
+class RefreshTokenInvalidError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=AccessTokenErrorCode.REFRESH_TOKEN_INVALID,
+            http_status_code=401,
+            message="Refresh token is invalid or has expired. Please login again.",
+        )
+
+
 class PasswordResetTokenNotFoundError(AppError):
 
     def __init__(self) -> None:
@@ -60,3 +74,13 @@ class OTPRequestFailedError(AppError):
         super().__init__(
             code=OTPErrorCode.REQUEST_FAILED, http_status_code=400, message="Please provide a valid phone number."
         )
+
+
+class RateLimitExceededError(AppError):
+    def __init__(self, *, retry_after_in_seconds: int) -> None:
+        super().__init__(
+            code=RateLimitErrorCode.RATE_LIMIT_EXCEEDED,
+            http_status_code=429,
+            message=f"Too many requests. Please try again in {retry_after_in_seconds} seconds.",
+        )
+        self.retry_after_in_seconds = retry_after_in_seconds
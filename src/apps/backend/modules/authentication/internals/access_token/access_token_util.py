@@ -1,39 +1,104 @@
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Set
 
 import jwt
+from jwt.algorithms import HMACAlgorithm
 
-from modules.account.types import Account
+from modules.application.common.bounded_cache import BoundedTTLCache
+from modules.application.common.types import CacheStats
 from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError, OTPIncorrectError
-from modules.authentication.types import AccessToken, AccessTokenPayload, OTP, OTPStatus
+from modules.authentication.types import OTP, AccessToken, AccessTokenPayload, OTPStatus, RefreshToken
 from modules.config.config_service import ConfigService
 
 
 class AccessTokenUtil:
+    _signing_key: Optional[bytes] = None
+    _verified_token_cache: Optional[BoundedTTLCache[str, AccessTokenPayload]] = None
+
     @staticmethod
-    def generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
-        expiry_time = datetime.now() + jwt_expiry
+    def generate_access_token(*, account_id: str, refresh_token: RefreshToken, token_epoch: int) -> AccessToken:
+        jwt_expiry = timedelta(seconds=ConfigService.get_int(key="accounts.access_token_expiry_in_seconds"))
+        # Timezone-aware, so the serialized expiry carries its offset instead of the server's local time
+        expiry_time = datetime.now(timezone.utc) + jwt_expiry
 
-        payload = {"account_id": account.id, "exp": expiry_time.timestamp()}
-        jwt_token = jwt.encode(payload, jwt_signing_key, algorithm="HS256")
+        payload = {"account_id": account_id, "exp": expiry_time.timestamp(), "token_epoch": token_epoch}
+        jwt_token = jwt.encode(payload, AccessTokenUtil._get_signing_key(), algorithm="HS256")
 
-        return AccessToken(token=jwt_token, account_id=account.id, expires_at=expiry_time.isoformat())
+        return AccessToken(
+            token=jwt_token,
+            account_id=account_id,
+            expires_at=expiry_time.isoformat(),
+            refresh_token=refresh_token.token,
+            refresh_token_expires_at=refresh_token.expires_at,
+        )
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        # Tokens are cached by digest so the raw bearer token is never kept in memory
+        token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        verified_token_cache = AccessTokenUtil._get_verified_token_cache()
+
+        cached_payload = verified_token_cache.get(token_digest)
+        if cached_payload is not None:
+            return cached_payload
 
         try:
-            verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
+            verified_token = jwt.decode(token, AccessTokenUtil._get_signing_key(), algorithms=["HS256"])
         except jwt.exceptions.DecodeError:
             raise AccessTokenInvalidError("Invalid access token")
         except jwt.ExpiredSignatureError:
             raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
 
-        return AccessTokenPayload(account_id=verified_token.get("account_id"))
+        payload = AccessTokenPayload(
+            account_id=verified_token.get("account_id"), token_epoch=verified_token.get("token_epoch", 0)
+        )
+
+        expires_at = verified_token.get("exp")
+        if expires_at is not None:
+            verified_token_cache.set(token_digest, payload, expires_at=float(expires_at))
+
+        return payload
+
+    @staticmethod
+    def get_verified_token_cache_stats() -> CacheStats:
+        return AccessTokenUtil._get_verified_token_cache().stats()
 
     @staticmethod
     def validate_otp_for_access_token(*, otp: OTP) -> None:
         if otp.status != OTPStatus.SUCCESS:
             raise OTPIncorrectError()
+
+    @staticmethod
+    def _get_signing_key() -> bytes:
+        if AccessTokenUtil._signing_key is None:
+            jwt_signing_key = ConfigService.get_str(key="accounts.token_signing_key")
+            AccessTokenUtil._signing_key = HMACAlgorithm(HMACAlgorithm.SHA256).prepare_key(jwt_signing_key)
+            ConfigService.subscribe(AccessTokenUtil._on_config_change)
+
+        return AccessTokenUtil._signing_key
+
+    @staticmethod
+    def _get_verified_token_cache() -> BoundedTTLCache[str, AccessTokenPayload]:
+        if AccessTokenUtil._verified_token_cache is None:
+            max_size = ConfigService.get_int(key="accounts.verified_token_cache_max_size", default=10000)
+            AccessTokenUtil._verified_token_cache = BoundedTTLCache(max_size=max_size)
+            ConfigService.subscribe(AccessTokenUtil._on_config_change)
+
+        return AccessTokenUtil._verified_token_cache
+
+    @staticmethod
+    def _on_config_change(changed_keys: Set[str]) -> None:
+        if "accounts.token_signing_key" in changed_keys:
+            # Tokens verified under the previous key must be checked again against the new one
+            AccessTokenUtil._signing_key = None
+            if AccessTokenUtil._verified_token_cache is not None:
+                AccessTokenUtil._verified_token_cache.clear()
+
+        if (
+            AccessTokenUtil._verified_token_cache is not None
+            and "accounts.verified_token_cache_max_size" in changed_keys
+        ):
+            AccessTokenUtil._verified_token_cache.resize(
+                max_size=ConfigService.get_int(key="accounts.verified_token_cache_max_size", default=10000)
+            )
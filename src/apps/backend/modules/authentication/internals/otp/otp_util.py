@@ -3,7 +3,7 @@ import string
 from typing import Any
 
 from modules.authentication.internals.otp.store.otp_model import OTPModel
-from modules.authentication.types import OTP
+from modules.authentication.types import OTP, OTPEngine
 from modules.config.config_service import ConfigService
 
 
@@ -12,7 +12,7 @@ class OTPUtil:
     @staticmethod
     def generate_otp(length: int, phone_number: str) -> str:
         if OTPUtil.should_use_default_otp_for_phone_number(phone_number):
-            default_otp = ConfigService[str].get_value(key="public.default_otp.code")
+            default_otp = ConfigService.get_str(key="public.default_otp.code")
             return default_otp
         return "".join(secrets.choice(string.digits) for _ in range(length))
 
@@ -26,9 +26,13 @@ class OTPUtil:
             status=validated_otp_data.status,
         )
 
+    @staticmethod
+    def is_stateless_otp_engine() -> bool:
+        return ConfigService.get_str(key="accounts.otp_engine", default=OTPEngine.STORED) == OTPEngine.STATELESS
+
     @staticmethod
     def should_use_default_otp_for_phone_number(phone_number: str) -> bool:
-        default_otp_enabled = ConfigService[bool].get_value(key="public.default_otp.enabled", default=False)
+        default_otp_enabled = ConfigService.get_bool(key="public.default_otp.enabled", default=False)
 
         if not default_otp_enabled:
             return False
@@ -38,9 +42,7 @@ class OTPUtil:
         if not has_whitelist_config:
             return True
 
-        whitelisted_phone_number = ConfigService[str].get_value(
-            key="public.default_otp.whitelisted_phone_number", default=""
-        )
+        whitelisted_phone_number = ConfigService.get_str(key="public.default_otp.whitelisted_phone_number", default="")
 
         if not whitelisted_phone_number:
             return True
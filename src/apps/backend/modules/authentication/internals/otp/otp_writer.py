@@ -1,30 +1,40 @@
+import hmac
+from collections import Counter
 from dataclasses import asdict
+from datetime import datetime, timezone
 
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from modules.account.types import PhoneNumber
 from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
 from modules.authentication.internals.otp.otp_util import OTPUtil
+from modules.authentication.internals.otp.stateless_otp_util import StatelessOTPUtil
 from modules.authentication.internals.otp.store.otp_model import OTPModel
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.otp.store.used_otp_repository import UsedOTPRepository
 from modules.authentication.types import OTP, CreateOTPParams, OTPStatus, VerifyOTPParams
 
+OTP_LENGTH = 4
+
 
 class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {"active": True, "phone_number": phone_number_dict},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.now()}},
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
-        OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
-        otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
+        if OTPUtil.is_stateless_otp_engine():
+            return OTPWriter._create_stateless_otp(phone_number=phone_number)
+
+        OTPWriter.expire_previous_otps(phone_number=params.phone_number)
+        otp_code = OTPUtil.generate_otp(length=OTP_LENGTH, phone_number=phone_number.phone_number)
         otp_bson = OTPModel(
             active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
         ).to_bson()
@@ -34,6 +44,9 @@ class OTPWriter:
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
+        if OTPUtil.is_stateless_otp_engine():
+            return OTPWriter._verify_stateless_otp(params=params)
+
         phone_number_dict = asdict(params.phone_number)
         otp_bson = OTPRepository.collection().find_one(
             {"otp_code": params.otp_code, "phone_number": phone_number_dict}, sort=[("_id", -1)]
@@ -50,3 +63,88 @@ class OTPWriter:
             return_document=ReturnDocument.AFTER,
         )
         return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+
+    @staticmethod
+    def _create_stateless_otp(*, phone_number: PhoneNumber) -> OTP:
+        if OTPUtil.should_use_default_otp_for_phone_number(phone_number.phone_number):
+            otp_code = OTPUtil.generate_otp(length=OTP_LENGTH, phone_number=phone_number.phone_number)
+        else:
+            current_time_window = StatelessOTPUtil.get_current_time_window()
+            used_otp_counts = OTPWriter._get_used_stateless_otp_counts(
+                phone_number=phone_number, oldest_time_window=current_time_window
+            )
+            # A code consumed earlier in this window is never sent again, the window's next code is sent instead
+            otp_code = StatelessOTPUtil.derive_otp_code(
+                phone_number=phone_number,
+                time_window=current_time_window,
+                length=OTP_LENGTH,
+                sequence=used_otp_counts[current_time_window],
+            )
+
+        # Nothing is stored, the code is derived again from the phone number and time window on verification
+        return OTP(id="", otp_code=otp_code, phone_number=phone_number, status=str(OTPStatus.PENDING))
+
+    @staticmethod
+    def _verify_stateless_otp(*, params: VerifyOTPParams) -> OTP:
+        verified_otp = OTP(
+            id="", otp_code=params.otp_code, phone_number=params.phone_number, status=str(OTPStatus.SUCCESS)
+        )
+
+        if OTPUtil.should_use_default_otp_for_phone_number(params.phone_number.phone_number):
+            # The default OTP is a fixed code for whitelisted numbers, replay protection would only lock them out
+            default_otp_code = OTPUtil.generate_otp(length=OTP_LENGTH, phone_number=params.phone_number.phone_number)
+            if not hmac.compare_digest(default_otp_code, params.otp_code):
+                raise OTPIncorrectError()
+            return verified_otp
+
+        current_time_window = StatelessOTPUtil.get_current_time_window()
+        oldest_accepted_time_window = current_time_window - StatelessOTPUtil.get_accepted_previous_windows()
+        used_otp_counts = OTPWriter._get_used_stateless_otp_counts(
+            phone_number=params.phone_number, oldest_time_window=oldest_accepted_time_window
+        )
+
+        for time_window in range(current_time_window, oldest_accepted_time_window - 1, -1):
+            # Codes before the last one in a window's sequence were consumed, matching them is caught as a replay
+            for sequence in range(used_otp_counts[time_window] + 1):
+                expected_otp_code = StatelessOTPUtil.derive_otp_code(
+                    phone_number=params.phone_number, time_window=time_window, length=OTP_LENGTH, sequence=sequence
+                )
+                if hmac.compare_digest(expected_otp_code, params.otp_code):
+                    OTPWriter._mark_stateless_otp_as_used(
+                        phone_number=params.phone_number, time_window=time_window, otp_code=params.otp_code
+                    )
+                    return verified_otp
+
+        raise OTPIncorrectError()
+
+    @staticmethod
+    def _get_used_stateless_otp_counts(*, phone_number: PhoneNumber, oldest_time_window: int) -> Counter[int]:
+        used_otps = UsedOTPRepository.collection().find(
+            {
+                "phone_number_key": StatelessOTPUtil.get_phone_number_key(phone_number=phone_number),
+                "time_window": {"$gte": oldest_time_window},
+            },
+            projection={"_id": False, "time_window": True},
+        )
+        return Counter(used_otp["time_window"] for used_otp in used_otps)
+
+    @staticmethod
+    def _mark_stateless_otp_as_used(*, phone_number: PhoneNumber, time_window: int, otp_code: str) -> None:
+        window_in_seconds = StatelessOTPUtil.get_otp_window_in_seconds()
+        # Keep the marker until the code can no longer be accepted
+        expires_at = datetime.fromtimestamp(
+            (time_window + StatelessOTPUtil.get_accepted_previous_windows() + 1) * window_in_seconds, tz=timezone.utc
+        )
+        try:
+            UsedOTPRepository.collection().insert_one(
+                {
+                    "_id": StatelessOTPUtil.get_used_otp_id(
+                        phone_number=phone_number, time_window=time_window, otp_code=otp_code
+                    ),
+                    "expires_at": expires_at,
+                    "phone_number_key": StatelessOTPUtil.get_phone_number_key(phone_number=phone_number),
+                    "time_window": time_window,
+                }
+            )
+        except DuplicateKeyError:
+            raise OTPExpiredError()
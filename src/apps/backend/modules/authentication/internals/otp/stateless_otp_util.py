@@ -0,0 +1,61 @@
+import hashlib
+import hmac
+import time
+
+from modules.account.types import PhoneNumber
+from modules.authentication.internals.otp.otp_util import OTPUtil
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
+from modules.config.types import ErrorCode
+
+SIGNING_KEY_CONFIG_KEY = "accounts.stateless_otp.signing_key"
+
+# Placeholders shipped in the config files, anyone can derive valid OTP codes from these
+PLACEHOLDER_SIGNING_KEYS = ("OTP_SIGNING_KEY", "STATELESS_OTP_SIGNING_KEY")
+
+
+class StatelessOTPUtil:
+    @staticmethod
+    def validate_signing_key() -> None:
+        if not OTPUtil.is_stateless_otp_engine():
+            return
+
+        signing_key = ConfigService.get_str(key=SIGNING_KEY_CONFIG_KEY, default="")
+        if not signing_key or signing_key in PLACEHOLDER_SIGNING_KEYS:
+            raise MissingKeyError(missing_key=SIGNING_KEY_CONFIG_KEY, error_code=ErrorCode.MISSING_KEY)
+
+    @staticmethod
+    def get_otp_window_in_seconds() -> int:
+        return ConfigService.get_int(key="accounts.stateless_otp.window_in_seconds", default=300)
+
+    @staticmethod
+    def get_accepted_previous_windows() -> int:
+        return ConfigService.get_int(key="accounts.stateless_otp.accepted_previous_windows", default=1)
+
+    @staticmethod
+    def get_current_time_window() -> int:
+        return int(time.time()) // StatelessOTPUtil.get_otp_window_in_seconds()
+
+    @staticmethod
+    def derive_otp_code(*, phone_number: PhoneNumber, time_window: int, length: int, sequence: int = 0) -> str:
+        signing_key = ConfigService.get_str(key=SIGNING_KEY_CONFIG_KEY)
+        message = f"{phone_number.country_code}{phone_number.phone_number}:{time_window}"
+        # Every code consumed in a window moves the window on to the next code in its sequence
+        if sequence:
+            message = f"{message}:{sequence}"
+        digest = hmac.new(signing_key.encode("utf-8"), message.encode("utf-8"), hashlib.sha256).digest()
+
+        # Dynamic truncation as in HOTP (RFC 4226), applied to an HMAC-SHA256 digest
+        offset = digest[-1] & 0x0F
+        truncated_digest = int.from_bytes(digest[offset : offset + 4], "big") & 0x7FFFFFFF
+        return str(truncated_digest % 10**length).zfill(length)
+
+    @staticmethod
+    def get_phone_number_key(*, phone_number: PhoneNumber) -> str:
+        return hashlib.sha256(f"{phone_number.country_code}{phone_number.phone_number}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_used_otp_id(*, phone_number: PhoneNumber, time_window: int, otp_code: str) -> str:
+        return hashlib.sha256(
+            f"{phone_number.country_code}{phone_number.phone_number}:{time_window}:{otp_code}".encode("utf-8")
+        ).hexdigest()
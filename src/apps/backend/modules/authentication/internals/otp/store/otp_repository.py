@@ -1,10 +1,14 @@
+from pymongo import ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
+OTP_TTL_INDEX_NAME = "created_at_ttl"
+
 OTP_VALIDATION_SCHEMA = {
     "$jsonSchema": {
         "bsonType": "object",
@@ -35,8 +39,11 @@ class OTPRepository(ApplicationRepository):
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-
-        collection.create_index("phone_number")
+        collection.create_index(
+            [("phone_number", ASCENDING), ("otp_code", ASCENDING), ("_id", DESCENDING)],
+            name="phone_number_otp_code_id_index",
+        )
+        cls._ensure_ttl_index(collection, ttl_in_seconds=ConfigService.get_int(key="accounts.otp_ttl_in_seconds"))
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": OTP_VALIDATION_SCHEMA,
@@ -50,3 +57,17 @@ class OTPRepository(ApplicationRepository):
             else:
                 Logger.error(message=f"OperationFailure occurred for collection otp: {e.details}")
         return True
+
+    @classmethod
+    def _ensure_ttl_index(cls, collection: Collection, *, ttl_in_seconds: int) -> None:
+        ttl_index = collection.index_information().get(OTP_TTL_INDEX_NAME)
+        if ttl_index is None:
+            collection.create_index("created_at", expireAfterSeconds=ttl_in_seconds, name=OTP_TTL_INDEX_NAME)
+        elif ttl_index.get("expireAfterSeconds") != ttl_in_seconds:
+            # create_index with a changed TTL fails with IndexOptionsConflict, collMod updates it in place
+            collection.database.command(
+                {
+                    "collMod": cls.collection_name,
+                    "index": {"name": OTP_TTL_INDEX_NAME, "expireAfterSeconds": ttl_in_seconds},
+                }
+            )
@@ -0,0 +1,18 @@
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+
+
+class UsedOTPRepository(ApplicationRepository):
+    # Replay protection for stateless OTPs: one small document per consumed (phone number, time window, code)
+    collection_name = "used_otps"
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index("expires_at", expireAfterSeconds=0, name="expires_at_ttl")
+        # Counting the codes consumed in a window picks the next code to send and the codes still to verify
+        collection.create_index(
+            [("phone_number_key", ASCENDING), ("time_window", ASCENDING)], name="phone_number_key_time_window_index"
+        )
+        return True
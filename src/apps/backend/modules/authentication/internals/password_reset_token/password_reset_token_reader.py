@@ -43,8 +43,8 @@ class PasswordResetTokenReader:
                 f"Password reset is already used for accountId {account_id}. Please retry with new link"
             )
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
+        is_token_valid = PasswordResetTokenUtil.compare_password_reset_token(
+            reset_token=token, hashed_reset_token=password_reset_token.token
         )
         if not is_token_valid:
             raise AccountBadRequestError(
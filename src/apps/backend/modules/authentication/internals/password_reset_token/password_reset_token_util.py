@@ -1,10 +1,9 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
@@ -15,12 +14,8 @@ from modules.config.config_service import ConfigService
 class PasswordResetTokenUtil:
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
-
-    @staticmethod
-    def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+    def compare_password_reset_token(*, reset_token: str, hashed_reset_token: str) -> bool:
+        return hmac.compare_digest(PasswordResetTokenUtil.hash_password_reset_token(reset_token), hashed_reset_token)
 
     @staticmethod
     def generate_password_reset_token() -> str:
@@ -28,7 +23,8 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        # Reset tokens are 256-bit random values, so a salted slow hash adds nothing over SHA-256
+        return hashlib.sha256(reset_token.encode("utf-8")).hexdigest()
 
     @staticmethod
     def get_token_expires_at() -> datetime:
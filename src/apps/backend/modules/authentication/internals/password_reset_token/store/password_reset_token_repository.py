@@ -1,3 +1,4 @@
+from pymongo import ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
@@ -7,6 +8,9 @@ from modules.authentication.internals.password_reset_token.store.password_reset_
 )
 from modules.logger.logger import Logger
 
+# Expired tokens are kept for a day so a late click still gets the "link expired" response instead of a 404
+PASSWORD_RESET_TOKEN_TTL_IN_SECONDS = 24 * 60 * 60
+
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
     "$jsonSchema": {
         "bsonType": "object",
@@ -27,7 +31,10 @@ class PasswordResetTokenRepository(ApplicationRepository):
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("token")
+        collection.create_index([("account", ASCENDING), ("expires_at", DESCENDING)], name="account_expires_at_index")
+        collection.create_index(
+            "expires_at", expireAfterSeconds=PASSWORD_RESET_TOKEN_TTL_IN_SECONDS, name="expires_at_ttl"
+        )
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
@@ -0,0 +1,56 @@
+import math
+from typing import Optional
+
+from modules.authentication.types import RateLimitBackend, RateLimitRule, RateLimitWindow
+from modules.config.config_service import ConfigService
+
+
+class RateLimitUtil:
+    @staticmethod
+    def is_rate_limit_enabled() -> bool:
+        return ConfigService.get_bool(key="rate_limit.enabled", default=False)
+
+    @staticmethod
+    def get_rate_limit_backend() -> str:
+        return ConfigService.get_str(key="rate_limit.backend", default=RateLimitBackend.MEMORY)
+
+    @staticmethod
+    def get_rate_limit_rule(rule_name: str) -> RateLimitRule:
+        return RateLimitRule(
+            limit=ConfigService.get_int(key=f"rate_limit.rules.{rule_name}.limit"),
+            window_in_seconds=ConfigService.get_int(key=f"rate_limit.rules.{rule_name}.window_in_seconds"),
+        )
+
+    @staticmethod
+    def get_window_start(*, now: float, window_in_seconds: int) -> int:
+        return int(now // window_in_seconds) * window_in_seconds
+
+    @staticmethod
+    def roll_window(*, window: Optional[RateLimitWindow], window_start: int, window_in_seconds: int) -> RateLimitWindow:
+        if window is None:
+            return RateLimitWindow(current_count=0, previous_count=0, window_start=window_start)
+
+        if window.window_start == window_start:
+            return window
+
+        if window.window_start == window_start - window_in_seconds:
+            return RateLimitWindow(current_count=0, previous_count=window.current_count, window_start=window_start)
+
+        return RateLimitWindow(current_count=0, previous_count=0, window_start=window_start)
+
+    @staticmethod
+    def is_window_exhausted(*, window: RateLimitWindow, rule: RateLimitRule, now: float) -> bool:
+        return window.current_count >= RateLimitUtil.get_current_count_limit(
+            previous_count=window.previous_count, rule=rule, now=now, window_start=window.window_start
+        )
+
+    @staticmethod
+    def get_current_count_limit(*, previous_count: int, rule: RateLimitRule, now: float, window_start: int) -> float:
+        # Sliding window counter: the previous fixed window is weighted by how much of it still overlaps the
+        # sliding window ending now, which avoids the burst a plain fixed window allows at its boundary
+        elapsed_fraction = (now - window_start) / rule.window_in_seconds
+        return rule.limit - previous_count * (1 - elapsed_fraction)
+
+    @staticmethod
+    def get_retry_after_in_seconds(*, window_start: int, window_in_seconds: int, now: float) -> int:
+        return max(1, math.ceil(window_start + window_in_seconds - now))
@@ -0,0 +1,114 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Set
+
+from pymongo.errors import DuplicateKeyError
+
+from modules.application.common.bounded_cache import BoundedTTLCache
+from modules.authentication.errors import RateLimitExceededError
+from modules.authentication.internals.rate_limit.rate_limit_util import RateLimitUtil
+from modules.authentication.internals.rate_limit.store.rate_limit_bucket_repository import RateLimitBucketRepository
+from modules.authentication.types import RateLimitBackend, RateLimitRule, RateLimitWindow
+from modules.config.config_service import ConfigService
+
+
+class RateLimitWriter:
+    _in_memory_lock = threading.Lock()
+    _in_memory_windows: Optional[BoundedTTLCache[str, RateLimitWindow]] = None
+
+    @staticmethod
+    def consume(*, rule_name: str, identifier: str) -> None:
+        rule = RateLimitUtil.get_rate_limit_rule(rule_name)
+        key = f"{rule_name}:{identifier}"
+        now = time.time()
+        window_start = RateLimitUtil.get_window_start(now=now, window_in_seconds=rule.window_in_seconds)
+
+        if RateLimitUtil.get_rate_limit_backend() == RateLimitBackend.MONGO:
+            is_allowed = RateLimitWriter._consume_in_mongo(key=key, rule=rule, now=now, window_start=window_start)
+        else:
+            is_allowed = RateLimitWriter._consume_in_memory(key=key, rule=rule, now=now, window_start=window_start)
+
+        if not is_allowed:
+            raise RateLimitExceededError(
+                retry_after_in_seconds=RateLimitUtil.get_retry_after_in_seconds(
+                    window_start=window_start, window_in_seconds=rule.window_in_seconds, now=now
+                )
+            )
+
+    @staticmethod
+    def _consume_in_memory(*, key: str, rule: RateLimitRule, now: float, window_start: int) -> bool:
+        with RateLimitWriter._in_memory_lock:
+            in_memory_windows = RateLimitWriter._get_in_memory_windows()
+            window = RateLimitUtil.roll_window(
+                window=in_memory_windows.get(key), window_start=window_start, window_in_seconds=rule.window_in_seconds
+            )
+
+            if RateLimitUtil.is_window_exhausted(window=window, rule=rule, now=now):
+                return False
+
+            in_memory_windows.set(
+                key,
+                RateLimitWindow(
+                    current_count=window.current_count + 1,
+                    previous_count=window.previous_count,
+                    window_start=window_start,
+                ),
+                expires_at=window_start + 2 * rule.window_in_seconds,
+            )
+            return True
+
+    @staticmethod
+    def _consume_in_mongo(*, key: str, rule: RateLimitRule, now: float, window_start: int) -> bool:
+        previous_bucket = RateLimitBucketRepository.collection().find_one(
+            {"_id": f"{key}:{window_start - rule.window_in_seconds}"}, projection={"count": True}
+        )
+        current_count_limit = RateLimitUtil.get_current_count_limit(
+            previous_count=previous_bucket["count"] if previous_bucket is not None else 0,
+            rule=rule,
+            now=now,
+            window_start=window_start,
+        )
+        if current_count_limit <= 0:
+            return False
+
+        # Incremented only while under the limit, so a rejected request writes nothing and concurrent workers
+        # cannot push the count past it
+        bucket_filter = {"_id": f"{key}:{window_start}", "count": {"$lt": current_count_limit}}
+        try:
+            RateLimitBucketRepository.collection().update_one(
+                bucket_filter,
+                {
+                    "$inc": {"count": 1},
+                    "$setOnInsert": {
+                        "expires_at": datetime.fromtimestamp(
+                            window_start + 2 * rule.window_in_seconds, tz=timezone.utc
+                        ),
+                        "window_start": window_start,
+                    },
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The bucket exists and is at its limit, or another worker created it concurrently. Without the upsert
+            # the update only matches in the second case.
+            result = RateLimitBucketRepository.collection().update_one(bucket_filter, {"$inc": {"count": 1}})
+            matched_count: int = result.matched_count
+            return matched_count == 1
+
+        return True
+
+    @staticmethod
+    def _get_in_memory_windows() -> BoundedTTLCache[str, RateLimitWindow]:
+        if RateLimitWriter._in_memory_windows is None:
+            max_keys = ConfigService[int].get_value(key="rate_limit.memory_max_keys", default=100000)
+            RateLimitWriter._in_memory_windows = BoundedTTLCache(max_size=max_keys)
+            ConfigService.subscribe(RateLimitWriter._on_config_change)
+
+        return RateLimitWriter._in_memory_windows
+
+    @staticmethod
+    def _on_config_change(changed_keys: Set[str]) -> None:
+        in_memory_windows = RateLimitWriter._in_memory_windows
+        if in_memory_windows is not None and "rate_limit.memory_max_keys" in changed_keys:
+            in_memory_windows.resize(max_size=ConfigService.get_int(key="rate_limit.memory_max_keys", default=100000))
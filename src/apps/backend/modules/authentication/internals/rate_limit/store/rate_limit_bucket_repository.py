@@ -0,0 +1,13 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+
+
+class RateLimitBucketRepository(ApplicationRepository):
+    collection_name = "rate_limit_buckets"
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # Buckets are looked up by _id only; once a bucket can no longer affect a window MongoDB drops it
+        collection.create_index("expires_at", expireAfterSeconds=0, name="expires_at_ttl")
+        return True
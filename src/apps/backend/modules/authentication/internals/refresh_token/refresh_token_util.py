@@ -0,0 +1,22 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from modules.config.config_service import ConfigService
+
+
+class RefreshTokenUtil:
+    @staticmethod
+    def generate_refresh_token() -> str:
+        return secrets.token_urlsafe(48)
+
+    @staticmethod
+    def hash_refresh_token(refresh_token: str) -> str:
+        # Refresh tokens are high-entropy random values, so a fast hash is enough and keeps the lookup indexable
+        return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_refresh_token_expires_at() -> datetime:
+        refresh_token_expiry_days = ConfigService[int].get_value(key="accounts.refresh_token_expiry_days")
+        # MongoDB stores dates as UTC, a naive local time would shift the TTL expiry by the server's offset
+        return datetime.now(timezone.utc) + timedelta(days=refresh_token_expiry_days)
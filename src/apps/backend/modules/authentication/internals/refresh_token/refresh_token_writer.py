@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from bson.objectid import ObjectId
+
+from modules.authentication.errors import RefreshTokenInvalidError
+from modules.authentication.internals.refresh_token.refresh_token_util import RefreshTokenUtil
+from modules.authentication.internals.refresh_token.store.refresh_token_model import RefreshTokenModel
+from modules.authentication.internals.refresh_token.store.refresh_token_repository import RefreshTokenRepository
+from modules.authentication.types import RefreshToken
+
+
+class RefreshTokenWriter:
+    @staticmethod
+    def create_refresh_token(*, account_id: str) -> RefreshToken:
+        token = RefreshTokenUtil.generate_refresh_token()
+        expires_at = RefreshTokenUtil.get_refresh_token_expires_at()
+
+        refresh_token_model = RefreshTokenModel(
+            account=ObjectId(account_id),
+            expires_at=expires_at,
+            id=None,
+            token_hash=RefreshTokenUtil.hash_refresh_token(token),
+        )
+        RefreshTokenRepository.collection().insert_one(refresh_token_model.to_bson())
+
+        return RefreshToken(account_id=account_id, expires_at=expires_at.isoformat(), token=token)
+
+    @staticmethod
+    def rotate_refresh_token(*, token: str) -> RefreshToken:
+        token_hash = RefreshTokenUtil.hash_refresh_token(token)
+
+        revoked_refresh_token = RefreshTokenRepository.collection().find_one_and_update(
+            {"token_hash": token_hash, "is_revoked": False, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"$set": {"is_revoked": True}},
+            projection={"account": True},
+        )
+
+        if revoked_refresh_token is None:
+            # A revoked token being presented again means it has leaked, so end every session of that account
+            reused_refresh_token = RefreshTokenRepository.collection().find_one(
+                {"token_hash": token_hash, "is_revoked": True}, projection={"account": True}
+            )
+            if reused_refresh_token is not None:
+                RefreshTokenWriter.revoke_refresh_tokens_by_account_id(account_id=str(reused_refresh_token["account"]))
+            raise RefreshTokenInvalidError()
+
+        return RefreshTokenWriter.create_refresh_token(account_id=str(revoked_refresh_token["account"]))
+
+    @staticmethod
+    def revoke_refresh_tokens_by_account_id(*, account_id: str) -> None:
+        RefreshTokenRepository.collection().update_many(
+            {"account": ObjectId(account_id), "is_revoked": False}, {"$set": {"is_revoked": True}}
+        )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class RefreshTokenModel(BaseModel):
+    account: ObjectId | str
+    expires_at: datetime
+    id: Optional[ObjectId | str]
+    token_hash: str
+
+    is_revoked: bool = False
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "RefreshTokenModel":
+        return cls(
+            account=bson_data.get("account"),
+            expires_at=bson_data.get("expires_at", ""),
+            id=bson_data.get("_id"),
+            is_revoked=bson_data.get("is_revoked", False),
+            token_hash=bson_data.get("token_hash", ""),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "refresh_tokens"
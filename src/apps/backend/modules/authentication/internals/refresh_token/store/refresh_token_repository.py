@@ -0,0 +1,44 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.authentication.internals.refresh_token.store.refresh_token_model import RefreshTokenModel
+from modules.logger.logger import Logger
+
+REFRESH_TOKEN_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account", "expires_at", "is_revoked", "token_hash"],
+        "properties": {
+            "account": {"bsonType": "objectId", "description": "must be an ObjectId and is required"},
+            "expires_at": {"bsonType": "date", "description": "must be a valid date and is required"},
+            "is_revoked": {"bsonType": "bool", "description": "must be a boolean and is required"},
+            "token_hash": {"bsonType": "string", "description": "must be a string and is required"},
+            "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
+        },
+    }
+}
+
+
+class RefreshTokenRepository(ApplicationRepository):
+    collection_name = RefreshTokenModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index("token_hash", unique=True, name="token_hash_unique")
+        collection.create_index("account", name="account_index")
+        # Expired refresh tokens are useless, let MongoDB remove them instead of a cleanup job
+        collection.create_index("expires_at", expireAfterSeconds=0, name="expires_at_ttl")
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": REFRESH_TOKEN_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:  # NamespaceNotFound MongoDB error code
+                collection.database.create_collection(cls.collection_name, validator=REFRESH_TOKEN_VALIDATION_SCHEMA)
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection RefreshToken: {e.details}")
+        return True
@@ -0,0 +1,6 @@
+from modules.application.repository import ApplicationRepository
+
+
+class TokenEpochRepository(ApplicationRepository):
+    # One document per account keyed by the account id, so every lookup is an _id lookup
+    collection_name = "token_epochs"
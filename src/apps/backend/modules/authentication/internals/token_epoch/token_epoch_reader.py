@@ -0,0 +1,105 @@
+import threading
+from typing import Optional, Set
+
+from bson.objectid import ObjectId
+
+from modules.application.common.bounded_cache import BoundedTTLCache
+from modules.authentication.internals.token_epoch.store.token_epoch_repository import TokenEpochRepository
+from modules.config.config_service import ConfigService
+
+TOKEN_EPOCH_REFRESH_BATCH_SIZE = 500
+
+
+class TokenEpochReader:
+    _invalidation_count = 0
+    _invalidation_lock = threading.Lock()
+    _token_epoch_cache: Optional[BoundedTTLCache[str, int]] = None
+
+    @staticmethod
+    def get_token_epoch(*, account_id: str) -> int:
+        invalidation_count = TokenEpochReader._invalidation_count
+        token_epochs = TokenEpochReader._get_token_epochs_by_account_ids([account_id])
+        TokenEpochReader._cache_token_epochs(token_epochs, invalidation_count=invalidation_count)
+        return token_epochs[account_id]
+
+    @staticmethod
+    def get_cached_token_epoch(*, account_id: str) -> int:
+        token_epoch_cache = TokenEpochReader._get_token_epoch_cache()
+
+        cached_token_epoch = token_epoch_cache.get(account_id)
+        if cached_token_epoch is not None:
+            return cached_token_epoch
+
+        # Reload other expired entries along with the missing one, so a single query refreshes a whole batch
+        account_ids = [account_id] + [
+            expired_account_id
+            for expired_account_id in token_epoch_cache.get_expired_keys(scan_limit=TOKEN_EPOCH_REFRESH_BATCH_SIZE)
+            if expired_account_id != account_id
+        ]
+
+        invalidation_count = TokenEpochReader._invalidation_count
+        token_epochs = TokenEpochReader._get_token_epochs_by_account_ids(account_ids)
+        TokenEpochReader._cache_token_epochs(token_epochs, invalidation_count=invalidation_count)
+        return token_epochs[account_id]
+
+    @staticmethod
+    def is_token_epoch_current(*, account_id: str, token_epoch: int) -> bool:
+        current_token_epoch = TokenEpochReader.get_cached_token_epoch(account_id=account_id)
+
+        if token_epoch > current_token_epoch:
+            # The token was issued after this process cached the epoch, so the cached value is outdated
+            current_token_epoch = TokenEpochReader.get_token_epoch(account_id=account_id)
+
+        return token_epoch == current_token_epoch
+
+    @staticmethod
+    def invalidate_cached_token_epoch(*, account_id: str) -> None:
+        token_epoch_cache = TokenEpochReader._get_token_epoch_cache()
+        with TokenEpochReader._invalidation_lock:
+            TokenEpochReader._invalidation_count += 1
+            token_epoch_cache.delete(account_id)
+
+    @staticmethod
+    def _get_token_epochs_by_account_ids(account_ids: list[str]) -> dict[str, int]:
+        token_epochs = {account_id: 0 for account_id in account_ids}
+        token_epoch_bsons = TokenEpochRepository.collection().find(
+            {"_id": {"$in": [ObjectId(account_id) for account_id in account_ids]}}
+        )
+        for token_epoch_bson in token_epoch_bsons:
+            token_epochs[str(token_epoch_bson["_id"])] = token_epoch_bson.get("epoch", 0)
+
+        return token_epochs
+
+    @staticmethod
+    def _cache_token_epochs(token_epochs: dict[str, int], *, invalidation_count: int) -> None:
+        token_epoch_cache = TokenEpochReader._get_token_epoch_cache()
+        with TokenEpochReader._invalidation_lock:
+            # An epoch was bumped while these were read from the database, they may predate it and are not cached
+            if TokenEpochReader._invalidation_count != invalidation_count:
+                return
+
+            for account_id, token_epoch in token_epochs.items():
+                token_epoch_cache.set(account_id, token_epoch)
+
+    @staticmethod
+    def _get_token_epoch_cache() -> BoundedTTLCache[str, int]:
+        if TokenEpochReader._token_epoch_cache is None:
+            TokenEpochReader._token_epoch_cache = BoundedTTLCache(
+                max_size=ConfigService.get_int(key="accounts.token_epoch_cache_max_size", default=10000),
+                ttl_in_seconds=ConfigService.get_int(key="accounts.token_epoch_cache_ttl_in_seconds", default=30),
+            )
+            ConfigService.subscribe(TokenEpochReader._on_config_change)
+
+        return TokenEpochReader._token_epoch_cache
+
+    @staticmethod
+    def _on_config_change(changed_keys: Set[str]) -> None:
+        token_epoch_cache = TokenEpochReader._token_epoch_cache
+        if token_epoch_cache is not None and changed_keys & {
+            "accounts.token_epoch_cache_max_size",
+            "accounts.token_epoch_cache_ttl_in_seconds",
+        }:
+            token_epoch_cache.resize(
+                max_size=ConfigService.get_int(key="accounts.token_epoch_cache_max_size", default=10000),
+                ttl_in_seconds=ConfigService.get_int(key="accounts.token_epoch_cache_ttl_in_seconds", default=30),
+            )
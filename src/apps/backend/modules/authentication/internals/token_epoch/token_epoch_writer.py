@@ -0,0 +1,16 @@
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+
+from modules.authentication.internals.token_epoch.store.token_epoch_repository import TokenEpochRepository
+from modules.authentication.internals.token_epoch.token_epoch_reader import TokenEpochReader
+
+
+class TokenEpochWriter:
+    @staticmethod
+    def increment_token_epoch(*, account_id: str) -> int:
+        token_epoch_bson = TokenEpochRepository.collection().find_one_and_update(
+            {"_id": ObjectId(account_id)}, {"$inc": {"epoch": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        TokenEpochReader.invalidate_cached_token_epoch(account_id=account_id)
+
+        return int(token_epoch_bson["epoch"])
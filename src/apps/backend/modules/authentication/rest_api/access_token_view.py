@@ -12,6 +12,7 @@ from modules.authentication.types import (
     EmailBasedAuthAccessTokenRequestParams,
     OTPBasedAuthAccessTokenRequestParams,
     PhoneNumber,
+    RefreshTokenBasedAuthAccessTokenRequestParams,
 )
 
 
@@ -25,15 +26,25 @@ class AccessTokenView(MethodView):
             access_token_params = OTPBasedAuthAccessTokenRequestParams(
                 otp_code=request_data["otp_code"], phone_number=phone_number_obj
             )
+            AuthenticationService.check_access_token_request_rate_limit(
+                client_ip=request.remote_addr, phone_number=phone_number_obj
+            )
             account = AccountService.get_account_by_phone_number(phone_number=access_token_params.phone_number)
             access_token = AuthenticationService.create_access_token_by_phone_number(
                 params=access_token_params, account=account
             )
         elif "username" in request_data and "password" in request_data:
             access_token_params = EmailBasedAuthAccessTokenRequestParams(**request_data)
+            AuthenticationService.check_access_token_request_rate_limit(
+                client_ip=request.remote_addr, username=access_token_params.username
+            )
             account = AccountService.get_account_by_username_and_password(
                 params=AccountSearchParams(username=access_token_params.username, password=access_token_params.password)
             )
             access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        elif "refresh_token" in request_data:
+            access_token_params = RefreshTokenBasedAuthAccessTokenRequestParams(**request_data)
+            AuthenticationService.check_access_token_request_rate_limit(client_ip=request.remote_addr)
+            access_token = AuthenticationService.create_access_token_by_refresh_token(params=access_token_params)
         access_token_dict = asdict(access_token)
         return jsonify(access_token_dict), 201
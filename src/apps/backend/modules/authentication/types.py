@@ -10,11 +10,21 @@ class AccessToken:
     token: str
     account_id: str
     expires_at: str
+    refresh_token: str
+    refresh_token_expires_at: str
+
+
+@dataclass(frozen=True)
+class RefreshToken:
+    account_id: str
+    expires_at: str
+    token: str
 
 
 @dataclass(frozen=True)
 class AccessTokenPayload:
     account_id: str
+    token_epoch: int = 0
 
 
 @dataclass(frozen=True)
@@ -29,7 +39,16 @@ class OTPBasedAuthAccessTokenRequestParams:
     phone_number: PhoneNumber
 
 
-CreateAccessTokenParams = Union[EmailBasedAuthAccessTokenRequestParams, OTPBasedAuthAccessTokenRequestParams]
+@dataclass(frozen=True)
+class RefreshTokenBasedAuthAccessTokenRequestParams:
+    refresh_token: str
+
+
+CreateAccessTokenParams = Union[
+    EmailBasedAuthAccessTokenRequestParams,
+    OTPBasedAuthAccessTokenRequestParams,
+    RefreshTokenBasedAuthAccessTokenRequestParams,
+]
 
 
 @dataclass(frozen=True)
@@ -39,6 +58,7 @@ class AccessTokenErrorCode:
     AUTHORIZATION_HEADER_NOT_FOUND: str = "ACCESS_TOKEN_ERR_03"
     INVALID_AUTHORIZATION_HEADER: str = "ACCESS_TOKEN_ERR_04"
     ACCESS_TOKEN_INVALID: str = "ACCESS_TOKEN_ERR_05"
+    REFRESH_TOKEN_INVALID: str = "ACCESS_TOKEN_ERR_06"
 
 
 from dataclasses import dataclass
@@ -71,6 +91,12 @@ class OTPStatus(StrEnum):
     SUCCESS: str = "SUCCESS"
 
 
+@dataclass(frozen=True)
+class OTPEngine:
+    STATELESS: str = "stateless"
+    STORED: str = "stored"
+
+
 @dataclass(frozen=True)
 class OTP:
     id: str
@@ -95,3 +121,36 @@ class CreateOTPParams:
 class VerifyOTPParams:
     otp_code: str
     phone_number: PhoneNumber
+
+
+@dataclass(frozen=True)
+class RateLimitBackend:
+    MEMORY: str = "memory"
+    MONGO: str = "mongo"
+
+
+@dataclass(frozen=True)
+class RateLimitRuleName:
+    LOGIN_BY_IP: str = "login_by_ip"
+    LOGIN_BY_PHONE_NUMBER: str = "login_by_phone_number"
+    LOGIN_BY_USERNAME: str = "login_by_username"
+    OTP_BY_IP: str = "otp_by_ip"
+    OTP_BY_PHONE_NUMBER: str = "otp_by_phone_number"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    limit: int
+    window_in_seconds: int
+
+
+@dataclass(frozen=True)
+class RateLimitWindow:
+    current_count: int
+    previous_count: int
+    window_start: int
+
+
+@dataclass(frozen=True)
+class RateLimitErrorCode:
+    RATE_LIMIT_EXCEEDED: str = "RATE_LIMIT_ERR_01"
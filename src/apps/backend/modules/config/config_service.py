@@ -1,8 +1,8 @@
-from typing import Generic, Optional, cast
+from typing import Any, Generic, Optional, Set, cast
 
 from modules.config.errors import MissingKeyError
 from modules.config.internals.config_manager import ConfigManager
-from modules.config.types import ConfigType, ErrorCode
+from modules.config.types import ConfigChangeSubscriber, ConfigType, ErrorCode
 
 
 class ConfigService(Generic[ConfigType]):
@@ -10,11 +10,57 @@ class ConfigService(Generic[ConfigType]):
 
     @classmethod
     def get_value(cls, key: str, default: Optional[ConfigType] = None) -> ConfigType:
-        value: Optional[ConfigType] = cls.config_manager.get(key, default=default)
-        if value is None:
-            raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
-        return cast(ConfigType, value)
+        return cast(ConfigType, cls._get_value(key=key, default=default))
 
     @classmethod
     def has_value(cls, key: str) -> bool:
         return cls.config_manager.has(key)
+
+    @classmethod
+    def reload(cls) -> Set[str]:
+        return cls.config_manager.reload()
+
+    @classmethod
+    def subscribe(cls, subscriber: ConfigChangeSubscriber) -> None:
+        cls.config_manager.subscribe(subscriber)
+
+    @classmethod
+    def unsubscribe(cls, subscriber: ConfigChangeSubscriber) -> None:
+        cls.config_manager.unsubscribe(subscriber)
+
+    @classmethod
+    def start_reload_watcher(cls) -> None:
+        # Opt-in, a process only picks up config edits without a restart when `config_reload.enabled` is set
+        if cls.get_bool(key="config_reload.enabled", default=False):
+            cls.config_manager.start_reload_watcher(
+                poll_interval_in_seconds=cls.get_float(key="config_reload.poll_interval_in_seconds", default=5)
+            )
+
+    # Typed accessors for hot paths, which would otherwise build a `ConfigService[...]` alias on every lookup
+
+    @classmethod
+    def get_bool(cls, *, key: str, default: Optional[bool] = None) -> bool:
+        return cast(bool, cls._get_value(key=key, default=default))
+
+    @classmethod
+    def get_float(cls, *, key: str, default: Optional[float] = None) -> float:
+        return cast(float, cls._get_value(key=key, default=default))
+
+    @classmethod
+    def get_int(cls, *, key: str, default: Optional[int] = None) -> int:
+        return cast(int, cls._get_value(key=key, default=default))
+
+    @classmethod
+    def get_list(cls, *, key: str, default: Optional[list] = None) -> list:
+        return cast(list, cls._get_value(key=key, default=default))
+
+    @classmethod
+    def get_str(cls, *, key: str, default: Optional[str] = None) -> str:
+        return cast(str, cls._get_value(key=key, default=default))
+
+    @classmethod
+    def _get_value(cls, *, key: str, default: Any) -> Any:
+        value = cls.config_manager.get(key, default=default)
+        if value is None:
+            raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
+        return value
@@ -11,7 +11,15 @@ class CustomEnvConfig:
 
     @staticmethod
     def load() -> Config:
-        custom_env_config = ConfigUtil.read_yml_from_config_dir(CustomEnvConfig.FILENAME)
+        return CustomEnvConfig.resolve(CustomEnvConfig.read())
+
+    @staticmethod
+    def read() -> dict[str, Any]:
+        return ConfigUtil.read_yml_from_config_dir(CustomEnvConfig.FILENAME)
+
+    @staticmethod
+    def resolve(custom_env_config: dict[str, Any]) -> Config:
+        # Environment variables are read here rather than at read time, so a compiled snapshot never captures them
         custom_env_dict = CustomEnvConfig._apply_environment_overrides(custom_env_config)
         return cast(Config, custom_env_dict)
 
@@ -1,11 +1,18 @@
-from typing import Optional, cast
+import logging
+import threading
+from typing import Dict, List, Optional, Set, cast
 
 from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
 from modules.config.internals.config_files.default_config_file import DefaultConfig
+from modules.config.internals.config_reloader import ConfigReloader
+from modules.config.internals.config_snapshot import ConfigSnapshot
 from modules.config.internals.config_utils import ConfigUtil
-from modules.config.internals.types import Config
-from modules.config.types import ConfigType
+from modules.config.internals.observable_config import ObservableConfig
+from modules.config.internals.types import AllowedConfigValueTypes, Config
+from modules.config.types import ConfigChangeSubscriber, ConfigType
+
+logger = logging.getLogger(__name__)
 
 
 class ConfigManager:
@@ -13,32 +20,117 @@ class ConfigManager:
     CONFIG_KEY_SEPARATOR: str = "."
 
     def __init__(self) -> None:
-        default_content = DefaultConfig.load()
-        app_env_content = AppEnvConfig.load()
-        os_env_content = CustomEnvConfig.load()
+        self._config_index: Optional[Dict[str, AllowedConfigValueTypes]] = None
+        self._config_version = 0
+        self._reload_lock = threading.Lock()
+        self._reloader: Optional[ConfigReloader] = None
+        self._subscribers: List[ConfigChangeSubscriber] = []
+        self.config_store = ConfigManager._load_config()
+
+    @property
+    def config_store(self) -> Config:
+        return self._config_store
 
-        merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
+    @config_store.setter
+    def config_store(self, config: Config) -> None:
+        config_store = ObservableConfig(config, on_change=self._invalidate_config_index)
+        config_index = ConfigUtil.flatten(config_store, separator=self.CONFIG_KEY_SEPARATOR)
+        self._config_version += 1
+        self._config_store: Config = config_store
+        # Lookups only read the index, so publishing it is the atomic swap to the new config
+        self._config_index = config_index
 
-        self.config_store: Config = merged_content
+    def apply_overrides(self, overrides: Config) -> None:
+        self.config_store = ConfigUtil.deep_merge(self._config_store, overrides)
 
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        return value if value is not None else default
+        value = self._get_config_index().get(key)
+        return cast(ConfigType, value) if value is not None else default
 
     def has(self, key: str) -> bool:
-        return self._traverse_config(key) is not None
+        return self._get_config_index().get(key) is not None
+
+    def reload(self) -> Set[str]:
+        """
+        Re-reads the config files and swaps in the result, then notifies subscribers of the changed keys. A config
+        that fails to load leaves the current one in place.
+        """
+        with self._reload_lock:
+            try:
+                config = ConfigManager._load_config()
+            except Exception:
+                logger.exception("Config reload failed, keeping the current config")
+                return set()
+
+            previous_config_index = self._get_config_index()
+            self.config_store = config
+            config_index = self._get_config_index()
+
+            changed_keys = {
+                key
+                for key in previous_config_index.keys() | config_index.keys()
+                if previous_config_index.get(key) != config_index.get(key)
+            }
+            subscribers = list(self._subscribers)
+
+        if changed_keys:
+            ConfigManager._notify_subscribers(subscribers, changed_keys)
+
+        return changed_keys
+
+    def subscribe(self, subscriber: ConfigChangeSubscriber) -> None:
+        with self._reload_lock:
+            if subscriber not in self._subscribers:
+                self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: ConfigChangeSubscriber) -> None:
+        with self._reload_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def start_reload_watcher(self, *, poll_interval_in_seconds: float) -> None:
+        if self._reloader is None:
+            self._reloader = ConfigReloader(on_reload=self.reload, poll_interval_in_seconds=poll_interval_in_seconds)
+            self._reloader.start()
+
+    def stop_reload_watcher(self) -> None:
+        if self._reloader is not None:
+            self._reloader.stop()
+            self._reloader = None
+
+    def _get_config_index(self) -> Dict[str, AllowedConfigValueTypes]:
+        config_index = self._config_index
+        if config_index is None:
+            config_version = self._config_version
+            config_index = ConfigUtil.flatten(self._config_store, separator=self.CONFIG_KEY_SEPARATOR)
+            # A mutation that raced with the rebuild has already invalidated this index, so it is not published
+            if config_version == self._config_version:
+                self._config_index = config_index
+
+        return config_index
 
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
+    def _invalidate_config_index(self) -> None:
+        self._config_version += 1
+        self._config_index = None
 
-            next_values = values[k]
+    @staticmethod
+    def _load_config() -> Config:
+        snapshot = ConfigSnapshot.load()
+        if snapshot is None:
+            base_content = ConfigUtil.deep_merge(DefaultConfig.load(), AppEnvConfig.load())
+            custom_env_content = CustomEnvConfig.read()
+        else:
+            base_content, custom_env_content = snapshot
 
-            if not isinstance(next_values, dict):
-                return cast(ConfigType, next_values)
+        os_env_content = CustomEnvConfig.resolve(custom_env_content)
 
-            values = next_values
+        return ConfigUtil.deep_merge(base_content, os_env_content)
 
-        return cast(ConfigType, values)
+    @staticmethod
+    def _notify_subscribers(subscribers: List[ConfigChangeSubscriber], changed_keys: Set[str]) -> None:
+        for subscriber in subscribers:
+            try:
+                subscriber(changed_keys)
+            except Exception:
+                # One failing subscriber must not keep the others on the old config
+                logger.exception("Config change subscriber %r failed", subscriber)
@@ -0,0 +1,70 @@
+import logging
+import signal
+import threading
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional
+
+from modules.config.internals.config_snapshot import ConfigSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigReloader:
+    """
+    Background thread that reloads the config when a source file changes or the process receives SIGHUP. The
+    signal handler only flags the request, the reload itself always runs on this thread, off the request path.
+    """
+
+    def __init__(self, *, on_reload: Callable[[], Any], poll_interval_in_seconds: float) -> None:
+        self._on_reload = on_reload
+        self._poll_interval_in_seconds = poll_interval_in_seconds
+        self._reload_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        # Taken before the thread starts, so an edit made right after `start` returns is never mistaken for the baseline
+        source_stats = ConfigReloader._get_source_stats()
+        self._thread = threading.Thread(target=self._run, args=(source_stats,), name="config-reloader", daemon=True)
+        self._thread.start()
+
+        # Signal handlers can only be installed from the main thread, other threads rely on file polling alone
+        if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGHUP, self._handle_sighup)
+
+    def request_reload(self) -> None:
+        self._reload_requested.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._reload_requested.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_interval_in_seconds + 1)
+
+    def _handle_sighup(self, signum: int, frame: Optional[FrameType]) -> None:
+        self.request_reload()
+
+    def _run(self, source_stats: Dict[str, List[int]]) -> None:
+        while not self._stopped.is_set():
+            is_reload_requested = self._reload_requested.wait(timeout=self._poll_interval_in_seconds)
+            if self._stopped.is_set():
+                return
+            self._reload_requested.clear()
+
+            current_source_stats = ConfigReloader._get_source_stats()
+            if not is_reload_requested and current_source_stats == source_stats:
+                continue
+
+            source_stats = current_source_stats
+            try:
+                self._on_reload()
+            except Exception:
+                logger.exception("Config reload failed")
+
+    @staticmethod
+    def _get_source_stats() -> Dict[str, List[int]]:
+        try:
+            return ConfigSnapshot.get_source_stats()
+        except OSError:
+            # A file that is being replaced can be missing for a moment, the next poll sees the new one
+            return {}
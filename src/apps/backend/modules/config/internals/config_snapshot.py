@@ -0,0 +1,86 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
+from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
+from modules.config.internals.config_files.default_config_file import DefaultConfig
+from modules.config.internals.config_utils import ConfigUtil
+from modules.config.internals.types import Config
+
+
+class ConfigSnapshot:
+    """
+    Compiled form of the YAML config files for one APP_ENV, written by `scripts/compile_config.py`. It holds the
+    merged default and APP_ENV config plus the unresolved custom environment variable mapping, so loading it skips
+    YAML parsing and merging while environment variables are still read by every process.
+    """
+
+    DIRECTORY_NAME: str = ".compiled"
+    SNAPSHOT_VERSION: int = 1
+
+    @staticmethod
+    def build() -> Path:
+        source_stats = ConfigSnapshot.get_source_stats()
+
+        snapshot = {
+            "base_config": ConfigUtil.deep_merge(DefaultConfig.load(), AppEnvConfig.load()),
+            "custom_env_config": CustomEnvConfig.read(),
+            "sources": source_stats,
+            "version": ConfigSnapshot.SNAPSHOT_VERSION,
+        }
+
+        # Sources edited while the snapshot was being built would otherwise be recorded as fresh
+        if ConfigSnapshot.get_source_stats() != source_stats:
+            raise RuntimeError("Config files changed while the snapshot was being compiled, please retry")
+
+        snapshot_path = ConfigSnapshot._get_snapshot_path()
+        snapshot_path.parent.mkdir(exist_ok=True)
+        temporary_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot, snapshot_file, separators=(",", ":"))
+        # Readers see either the previous snapshot or the complete new one, never a partial write
+        os.replace(temporary_path, snapshot_path)
+
+        return snapshot_path
+
+    @staticmethod
+    def load() -> Optional[Tuple[Config, Dict[str, Any]]]:
+        snapshot_path = ConfigSnapshot._get_snapshot_path()
+
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            source_stats = ConfigSnapshot.get_source_stats()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if snapshot.get("version") != ConfigSnapshot.SNAPSHOT_VERSION or snapshot.get("sources") != source_stats:
+            return None
+
+        return cast(Config, snapshot["base_config"]), cast(Dict[str, Any], snapshot["custom_env_config"])
+
+    @staticmethod
+    def get_source_stats() -> Dict[str, List[int]]:
+        return ConfigSnapshot._get_source_stats(ConfigSnapshot._get_source_filenames())
+
+    @staticmethod
+    def _get_snapshot_path() -> Path:
+        app_env = os.environ.get("APP_ENV", "development")
+        return ConfigUtil.get_config_directory() / ConfigSnapshot.DIRECTORY_NAME / f"{app_env}.json"
+
+    @staticmethod
+    def _get_source_filenames() -> List[str]:
+        app_env = os.environ.get("APP_ENV", "development")
+        return [DefaultConfig.FILENAME, f"{app_env}.yml", CustomEnvConfig.FILENAME]
+
+    @staticmethod
+    def _get_source_stats(source_filenames: List[str]) -> Dict[str, List[int]]:
+        config_directory = ConfigUtil.get_config_directory()
+        source_stats: Dict[str, List[int]] = {}
+        for filename in source_filenames:
+            stat = os.stat(config_directory / filename)
+            source_stats[filename] = [stat.st_mtime_ns, stat.st_size]
+
+        return source_stats
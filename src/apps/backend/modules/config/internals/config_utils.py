@@ -1,10 +1,10 @@
 import os
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Dict, cast
 
 import yaml
 
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 
 
 class ConfigUtil:
@@ -24,9 +24,28 @@ class ConfigUtil:
 
         return merged_config
 
+    @staticmethod
+    def flatten(config: Config, *, separator: str, prefix: str = "") -> Dict[str, AllowedConfigValueTypes]:
+        # Sections are indexed alongside their leaves, so both `mongodb` and `mongodb.uri` resolve in one lookup
+        flattened_config: Dict[str, AllowedConfigValueTypes] = {}
+
+        for key, value in config.items():
+            dotted_key = f"{prefix}{key}"
+            flattened_config[dotted_key] = value
+            if isinstance(value, dict):
+                flattened_config.update(
+                    ConfigUtil.flatten(cast(Config, value), separator=separator, prefix=f"{dotted_key}{separator}")
+                )
+
+        return flattened_config
+
+    @staticmethod
+    def get_config_directory() -> Path:
+        return ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
+
     @staticmethod
     def read_yml_from_config_dir(filename: str) -> dict[str, Any]:
-        config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
+        config_path = ConfigUtil.get_config_directory()
         file_path = os.path.join(config_path, filename)
 
         try:
@@ -0,0 +1,61 @@
+from typing import Any, Callable, Iterable, Mapping, Self, Tuple, Union, cast
+
+from modules.config.internals.types import AllowedConfigValueTypes, Config
+
+
+class ObservableConfig(dict):
+    """
+    Config section that reports every in-place mutation, so indexes derived from the config can be dropped when
+    a section is patched (e.g. by `mock.patch.dict` in tests). Nested sections are wrapped on the way in.
+    """
+
+    def __init__(self, config: Config, *, on_change: Callable[[], None]) -> None:
+        self._on_change = on_change
+        super().__init__({key: self._wrap(value) for key, value in config.items()})
+
+    def __setitem__(self, key: str, value: AllowedConfigValueTypes) -> None:
+        super().__setitem__(key, self._wrap(value))
+        self._on_change()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._on_change()
+
+    def __or__(self, other: Any) -> dict:
+        # Merging builds a new mapping that is not part of the config store, so it is returned as a plain dict
+        return {**self, **other}
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_change()
+
+    def pop(self, key: str, *args: Any) -> AllowedConfigValueTypes:
+        value = cast(AllowedConfigValueTypes, super().pop(key, *args))
+        self._on_change()
+        return value
+
+    def popitem(self) -> Tuple[str, AllowedConfigValueTypes]:
+        item = cast(Tuple[str, AllowedConfigValueTypes], super().popitem())
+        self._on_change()
+        return item
+
+    def setdefault(self, key: str, default: AllowedConfigValueTypes = None) -> AllowedConfigValueTypes:
+        if key not in self:
+            self[key] = default
+        return cast(AllowedConfigValueTypes, self[key])
+
+    def update(  # type: ignore[override]
+        self, other: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]] = (), **kwargs: Any
+    ) -> None:
+        items = dict(other, **kwargs)
+        super().update({key: self._wrap(value) for key, value in items.items()})
+        self._on_change()
+
+    def _wrap(self, value: AllowedConfigValueTypes) -> AllowedConfigValueTypes:
+        if isinstance(value, dict) and not isinstance(value, ObservableConfig):
+            return ObservableConfig(cast(Config, value), on_change=self._on_change)
+        return value
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import Callable, Set, TypeVar
 
 ConfigType = TypeVar("ConfigType", bound=bool | dict | float | int | list | str)
 
@@ -8,3 +8,7 @@ ConfigType = TypeVar("ConfigType", bound=bool | dict | float | int | list | str)
 class ErrorCode:
     MISSING_KEY: str = "KEY_ERR_404"
     VALUE_TYPE_MISMATCH: str = "INVALID_VALUE_TYPE_400"
+
+
+# Called with the dotted keys (sections and leaves) whose values changed in a config reload
+ConfigChangeSubscriber = Callable[[Set[str]], None]
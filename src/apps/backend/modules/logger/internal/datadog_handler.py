@@ -1,18 +1,46 @@
 import logging
 import os
-from logging import LogRecord, StreamHandler
+import queue
+import sys
+import threading
+import time
+from logging import LogRecord
+from typing import List, Optional, Tuple
 
 from datadog_api_client import ApiClient, Configuration
 from datadog_api_client.v2.api.logs_api import LogsApi
-from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
+from datadog_api_client.v2.models import ContentEncoding, HTTPLog, HTTPLogItem
 
 from modules.config.config_service import ConfigService
+from modules.logger.internal.types import DatadogHandlerStats
 
 
-class DatadogHandler(StreamHandler):
+class DatadogHandler(logging.Handler):
+    """
+    Ships log records to Datadog from a background thread. `emit` only formats the record and puts it on a bounded
+    queue; the sender drains the queue in batches over one reused ApiClient. When the queue is full new records are
+    dropped and counted rather than blocking the caller, and the drop count is reported with the next batch.
+    """
+
     def __init__(self, ddsource: str) -> None:
-        StreamHandler.__init__(self)
+        logging.Handler.__init__(self)
         self.ddsource = ddsource
+        # Resolved up front, so a missing API key fails when the logger is mounted instead of on the sender thread
+        self._api_configuration = Configuration()
+        self._api_configuration.api_key["apiKeyAuth"] = ConfigService.get_str(key="datadog.api_key")
+        self._api_configuration.server_variables["site"] = ConfigService.get_str(key="datadog.site_name")
+        self._batch_size = ConfigService.get_int(key="datadog.batch_size", default=100)
+        self._flush_interval_in_seconds = ConfigService.get_float(key="datadog.flush_interval_in_seconds", default=2)
+        self._queue: queue.Queue[Optional[HTTPLogItem]] = queue.Queue(
+            maxsize=ConfigService.get_int(key="datadog.queue_max_size", default=10000)
+        )
+        self._sender_lock = threading.Lock()
+        self._sender: Optional[threading.Thread] = None
+        self._sender_pid: Optional[int] = None
+        self._dropped_records = 0
+        self._unreported_dropped_records = 0
+        self._failed_batches = 0
+        self._sent_records = 0
 
     def __get_status(self, record: LogRecord) -> str:
         if record.levelno in [logging.NOTSET, logging.DEBUG, logging.INFO]:
@@ -23,27 +51,119 @@ class DatadogHandler(StreamHandler):
             return "error"
 
     def emit(self, record: LogRecord) -> None:
-        msg = self.format(record)
-        datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-        datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-        data_app_name = ConfigService[str].get_value(key="datadog.app_name")
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = datadog_api_key
-        config.server_variables["site"] = datadog_host
-        config.debug = True
-        with ApiClient(config) as api_client:
-            api_instance = LogsApi(api_client)
-            body = HTTPLog(
-                [
-                    HTTPLogItem(
-                        ddsource=self.ddsource,
-                        ddtags=f"env : {os.environ.get('APP_NAME')}",
-                        hostname="",
-                        message=msg,
-                        service=data_app_name,
-                        status=self.__get_status(record=record),
-                    )
-                ]
+        try:
+            log_item = self._build_log_item(message=self.format(record), status=self.__get_status(record=record))
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._ensure_sender()
+        try:
+            self._queue.put_nowait(log_item)
+        except queue.Full:
+            with self._sender_lock:
+                self._dropped_records += 1
+                self._unreported_dropped_records += 1
+
+    def flush(self) -> None:
+        # Only waits when a sender is running in this process, otherwise nothing would ever drain the queue
+        if self._is_sender_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._is_sender_alive():
+            try:
+                # Queued behind every pending record, so the sender ships them all before it stops
+                self._queue.put(None, timeout=self._flush_interval_in_seconds)
+            except queue.Full:
+                pass
+            if self._sender is not None:
+                self._sender.join(timeout=self._flush_interval_in_seconds + 10)
+        logging.Handler.close(self)
+
+    def get_stats(self) -> DatadogHandlerStats:
+        with self._sender_lock:
+            return DatadogHandlerStats(
+                dropped_records=self._dropped_records,
+                failed_batches=self._failed_batches,
+                queued_records=self._queue.qsize(),
+                sent_records=self._sent_records,
             )
 
-            api_instance.submit_log(body)
+    def _build_log_item(self, *, message: str, status: str) -> HTTPLogItem:
+        return HTTPLogItem(
+            ddsource=self.ddsource,
+            ddtags=f"env : {os.environ.get('APP_NAME')}",
+            hostname="",
+            message=message,
+            service=ConfigService.get_str(key="datadog.app_name"),
+            status=status,
+        )
+
+    def _is_sender_alive(self) -> bool:
+        return self._sender is not None and self._sender_pid == os.getpid() and self._sender.is_alive()
+
+    def _ensure_sender(self) -> None:
+        if self._is_sender_alive():
+            return
+
+        with self._sender_lock:
+            # Threads do not survive a fork, so a forked worker starts its own sender
+            if not self._is_sender_alive():
+                self._sender = threading.Thread(target=self._run_sender, name="datadog-log-sender", daemon=True)
+                self._sender_pid = os.getpid()
+                self._sender.start()
+
+    def _run_sender(self) -> None:
+        with ApiClient(self._api_configuration) as api_client:
+            logs_api = LogsApi(api_client)
+            is_stopped = False
+            while not is_stopped:
+                batch, is_stopped = self._collect_batch()
+                if batch:
+                    self._send_batch(logs_api, batch)
+                for _ in range(len(batch) + (1 if is_stopped else 0)):
+                    self._queue.task_done()
+
+    def _collect_batch(self) -> Tuple[List[HTTPLogItem], bool]:
+        batch: List[HTTPLogItem] = []
+        deadline: Optional[float] = None
+
+        # A batch is sent once it is full or the oldest record in it has waited for the flush interval
+        while len(batch) < self._batch_size:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                log_item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if log_item is None:
+                return batch, True
+
+            batch.append(log_item)
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval_in_seconds
+
+        return batch, False
+
+    def _send_batch(self, logs_api: LogsApi, batch: List[HTTPLogItem]) -> None:
+        with self._sender_lock:
+            unreported_dropped_records = self._unreported_dropped_records
+            self._unreported_dropped_records = 0
+
+        log_items = list(batch)
+        if unreported_dropped_records:
+            dropped_message = f"Datadog log queue was full, dropped {unreported_dropped_records} record(s)"
+            log_items.append(self._build_log_item(message=dropped_message, status="warn"))
+
+        try:
+            logs_api.submit_log(HTTPLog(log_items), content_encoding=ContentEncoding.GZIP)
+        except Exception as err:
+            with self._sender_lock:
+                self._failed_batches += 1
+            # Logged straight to stderr, going through the logger here would feed the failure back into this queue
+            sys.stderr.write(f"Failed to ship {len(batch)} log record(s) to Datadog: {err}\n")
+            return
+
+        with self._sender_lock:
+            self._sent_records += len(batch)
@@ -7,7 +7,7 @@ from modules.logger.internal.logger_enum import Levels
 class LogLevel:
     @staticmethod
     def get_level() -> int:
-        ddconfig_level = ConfigService[str].get_value(key="datadog.log_level")
+        ddconfig_level = ConfigService.get_str(key="datadog.log_level")
         datadog_level = ddconfig_level.lower()
         for level in Levels:
             if datadog_level.lower() == level.name:
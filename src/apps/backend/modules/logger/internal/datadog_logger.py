@@ -17,6 +17,11 @@ class DatadogLogger(BaseLogger):
         self.handler.setFormatter(self.formatter)
         self.logger.addHandler(self.handler)
 
+    def set_level(self, level: int) -> None:
+        self.level = level
+        self.logger.setLevel(level)
+        self.handler.setLevel(level)
+
     def critical(self, *, message: str) -> None:
         self.logger.critical(message)
 
@@ -0,0 +1,75 @@
+import atexit
+import logging
+import queue
+import threading
+from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from modules.logger.internal.types import LogQueueStats
+
+
+class BoundedQueueHandler(QueueHandler):
+    def __init__(self, log_queue: "queue.Queue[Optional[LogRecord]]") -> None:
+        super().__init__(log_queue)
+        self._dropped_records_lock = threading.Lock()
+        self.dropped_records = 0
+
+    def enqueue(self, record: LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Dropping keeps request threads from ever waiting on a slow log sink
+            with self._dropped_records_lock:
+                self.dropped_records += 1
+
+
+class DrainingQueueListener(QueueListener):
+    def __init__(
+        self, log_queue: "queue.Queue[Optional[LogRecord]]", *handlers: logging.Handler, respect_handler_level: bool
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._bounded_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        # The stock listener uses put_nowait, which fails on a full bounded queue; the listener thread is still
+        # draining, so waiting for a free slot is safe and keeps every queued record ahead of the sentinel (None)
+        self._bounded_queue.put(None)
+
+
+class LogQueue:
+    """
+    Moves the handlers of a logger behind a bounded queue, so log calls only enqueue the record and a listener thread
+    does the formatting and I/O. The queue is drained into the handlers at process exit.
+    """
+
+    def __init__(self, *, logger: logging.Logger, max_size: int) -> None:
+        log_queue: "queue.Queue[Optional[LogRecord]]" = queue.Queue(maxsize=max_size)
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, QueueHandler)]
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+        self.logger_name = logger.name
+        self._queue = log_queue
+        self._queue_handler = BoundedQueueHandler(log_queue)
+        self._listener = DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._is_running = True
+        self._stop_lock = threading.Lock()
+
+        self._listener.start()
+        logger.addHandler(self._queue_handler)
+        # Registered after logging's own exit hook, so it runs first and the handlers are still open when drained
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        with self._stop_lock:
+            if self._is_running:
+                self._is_running = False
+                self._listener.stop()
+
+    def get_stats(self) -> LogQueueStats:
+        return LogQueueStats(
+            dropped_records=self._queue_handler.dropped_records,
+            logger_name=self.logger_name,
+            queued_records=self._queue.qsize(),
+        )
@@ -1,23 +1,47 @@
-from typing import Union
+from typing import Optional, Set, Union
 
 from modules.config.config_service import ConfigService
 from modules.logger.internal.console_logger import ConsoleLogger
+from modules.logger.internal.datadog_handler_level import LogLevel
 from modules.logger.internal.datadog_logger import DatadogLogger
-from modules.logger.internal.types import LoggerTransports
+from modules.logger.internal.log_queue import LogQueue
+from modules.logger.internal.types import LoggerTransports, LogQueueStats
 
 
 class Loggers:
     _LOGGERS: list[Union[ConsoleLogger, DatadogLogger]] = []
+    _LOG_QUEUES: list[LogQueue] = []
 
     @staticmethod
     def initialize_loggers() -> None:
         logger_transports = ConfigService[list[str]].get_value(key="logger.transports")
+        is_non_blocking = ConfigService.get_bool(key="logger.non_blocking", default=False)
         for logger_transport in logger_transports:
+            transport_logger: Optional[Union[ConsoleLogger, DatadogLogger]] = None
             if logger_transport == LoggerTransports.CONSOLE:
-                Loggers._LOGGERS.append(Loggers.__get_console_logger())
+                transport_logger = Loggers.__get_console_logger()
 
             if logger_transport == LoggerTransports.DATADOG:
-                Loggers._LOGGERS.append(Loggers.__get_datadog_logger())
+                transport_logger = Loggers.__get_datadog_logger()
+
+            if transport_logger is None:
+                continue
+
+            if is_non_blocking:
+                # Each transport gets its own queue, so a slow sink never holds back records for the others
+                Loggers._LOG_QUEUES.append(
+                    LogQueue(
+                        logger=transport_logger.logger,
+                        max_size=ConfigService.get_int(key="logger.queue_max_size", default=10000),
+                    )
+                )
+            Loggers._LOGGERS.append(transport_logger)
+
+        ConfigService.subscribe(Loggers._on_config_change)
+
+    @staticmethod
+    def get_log_queue_stats() -> list[LogQueueStats]:
+        return [log_queue.get_stats() for log_queue in Loggers._LOG_QUEUES]
 
     @staticmethod
     def info(*, message: str) -> None:
@@ -39,6 +63,16 @@ class Loggers:
     def critical(*, message: str) -> None:
         [logger.critical(message=message) for logger in Loggers._LOGGERS]
 
+    @staticmethod
+    def _on_config_change(changed_keys: Set[str]) -> None:
+        if "datadog.log_level" not in changed_keys:
+            return
+
+        level = LogLevel.get_level()
+        for logger in Loggers._LOGGERS:
+            if isinstance(logger, DatadogLogger):
+                logger.set_level(level)
+
     @staticmethod
     def __get_console_logger() -> ConsoleLogger:
         return ConsoleLogger()
@@ -5,3 +5,18 @@ from dataclasses import dataclass
 class LoggerTransports:
     CONSOLE: str = "console"
     DATADOG: str = "datadog"
+
+
+@dataclass(frozen=True)
+class DatadogHandlerStats:
+    dropped_records: int
+    failed_batches: int
+    queued_records: int
+    sent_records: int
+
+
+@dataclass(frozen=True)
+class LogQueueStats:
+    dropped_records: int
+    logger_name: str
+    queued_records: int
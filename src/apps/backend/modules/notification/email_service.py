@@ -1,12 +1,28 @@
+from dataclasses import replace
+
 from modules.logger.logger import Logger
-from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.email_transport import EmailTransport
+from modules.notification.internals.sendgrid_service import MAX_PERSONALIZATIONS_PER_REQUEST
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendEmailParams
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.notification_digest_writer import NotificationDigestWriter
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.types import NotificationChannel, SendBulkEmailParams, SendEmailParams
 
 
 class EmailService:
     @staticmethod
-    def send_email_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendEmailParams) -> None:
+    def get_template_id(*, sendgrid_template_id_key: str, template_type: str) -> str:
+        return EmailTransport.get_template_id(
+            sendgrid_template_id_key=sendgrid_template_id_key, template_type=template_type
+        )
+
+    @staticmethod
+    def send_email_for_account(
+        *, account_id: str, bypass_preferences: bool = False, coalesce: bool = False, params: SendEmailParams
+    ) -> None:
         if not bypass_preferences:
             preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
                 account_id
@@ -19,4 +35,71 @@ class EmailService:
                 )
                 return
 
-        return SendGridService.send_email(params)
+        if coalesce and NotificationDigestUtil.is_email_digest_enabled():
+            # Buffered until the account's window closes, then sent together with its siblings as one digest
+            EmailParams.validate(params)
+            NotificationDigestWriter.buffer_notification(
+                account_id=account_id,
+                channel=NotificationChannel.EMAIL,
+                payload=NotificationOutboxUtil.convert_send_email_params_to_payload(params),
+            )
+            return
+
+        if NotificationOutboxUtil.is_outbox_enabled():
+            # Validate before queueing so invalid params still fail the request instead of the dispatcher
+            EmailParams.validate(params)
+            NotificationOutboxWriter.enqueue_notification(
+                account_id=account_id,
+                channel=NotificationChannel.EMAIL,
+                payload=NotificationOutboxUtil.convert_send_email_params_to_payload(params),
+            )
+            return
+
+        return EmailTransport.send_email(params)
+
+    @staticmethod
+    def send_bulk_email(*, bypass_preferences: bool = False, params: SendBulkEmailParams) -> int:
+        recipients = params.recipients
+        if not bypass_preferences:
+            # Preferences for the whole batch are read in one query instead of one per recipient
+            preferences_by_account_id = (
+                AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(
+                    list({bulk_recipient.account_id for bulk_recipient in recipients})
+                )
+            )
+            recipients = [
+                bulk_recipient
+                for bulk_recipient in recipients
+                if bulk_recipient.account_id in preferences_by_account_id
+                and preferences_by_account_id[bulk_recipient.account_id].email_enabled
+            ]
+
+            skipped_count = len(params.recipients) - len(recipients)
+            if skipped_count:
+                Logger.info(
+                    message=f"Bulk email using template {params.template_id} skipped {skipped_count} recipient(s): "
+                    f"disabled by user preferences or preferences not found"
+                )
+
+        if not recipients:
+            return 0
+
+        filtered_params = replace(params, recipients=recipients)
+
+        if NotificationOutboxUtil.is_outbox_enabled():
+            EmailParams.validate_bulk(filtered_params)
+            for start in range(0, len(recipients), MAX_PERSONALIZATIONS_PER_REQUEST):
+                NotificationOutboxWriter.enqueue_notification(
+                    account_id=None,
+                    channel=NotificationChannel.BULK_EMAIL,
+                    payload=NotificationOutboxUtil.convert_send_bulk_email_params_to_payload(
+                        replace(
+                            filtered_params, recipients=recipients[start : start + MAX_PERSONALIZATIONS_PER_REQUEST]
+                        )
+                    ),
+                )
+            return len(recipients)
+
+        # Recipients the transport failed to reach were not sent to, they are left out of the sent count
+        failures = EmailTransport.send_bulk_email(filtered_params)
+        return len(recipients) - len(failures)
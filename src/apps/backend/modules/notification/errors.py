@@ -1,3 +1,4 @@
+import smtplib
 from typing import List, Optional
 
 from modules.application.errors import AppError
@@ -25,9 +26,38 @@ class AccountNotificationPreferencesNotFoundError(AppError):
         )
 
 
+class NotificationBroadcastNotFoundError(AppError):
+    def __init__(self, broadcast_id: str) -> None:
+        super().__init__(
+            code=NotificationErrorCode.BROADCAST_NOT_FOUND,
+            http_status_code=404,
+            message=f"Notification broadcast not found: {broadcast_id}.",
+        )
+
+
+class NotificationBroadcastDisabledError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=NotificationErrorCode.BROADCAST_DISABLED,
+            http_status_code=409,
+            message="Notification broadcasts are disabled, enable notification.broadcast.enabled to create one.",
+        )
+
+
 class ServiceError(AppError):
     def __init__(self, err: Exception) -> None:
-        super().__init__(message=err.args[2], code=NotificationErrorCode.SERVICE_ERROR)
+        # Provider SDK errors carry the response body as their third argument, transport errors only a message
+        message = err.args[2] if len(err.args) > 2 and not isinstance(err, smtplib.SMTPException) else str(err)
+        super().__init__(message=message, code=NotificationErrorCode.SERVICE_ERROR)
         self.code = NotificationErrorCode.SERVICE_ERROR
         self.stack = getattr(err, "stack", None)
         self.http_status_code = 503
+
+
+class ProviderUnavailableError(ServiceError):
+    def __init__(self, provider: str) -> None:
+        super().__init__(
+            ConnectionError(
+                f"{provider} is temporarily unavailable, notification was not sent. Please try again later."
+            )
+        )
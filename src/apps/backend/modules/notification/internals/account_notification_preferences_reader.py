@@ -1,3 +1,15 @@
+import threading
+from typing import Dict, List, Optional, Set
+
+from bson.objectid import ObjectId
+
+from modules.application.common.bounded_cache import BoundedTTLCache
+from modules.application.common.types import CacheStats
+from modules.config.config_service import ConfigService
+from modules.notification.internals.store.account_embedded_notification_preferences_repository import (
+    EMBEDDED_NOTIFICATION_PREFERENCES_FIELD,
+    AccountEmbeddedNotificationPreferencesRepository,
+)
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
@@ -7,8 +19,113 @@ from modules.notification.types import AccountNotificationPreferences
 
 
 class AccountNotificationPreferenceReader:
+    _invalidation_count = 0
+    _invalidation_lock = threading.Lock()
+    _preferences_cache: Optional[BoundedTTLCache[str, AccountNotificationPreferences]] = None
+
     @staticmethod
     def get_account_notification_preferences_by_account_id(account_id: str) -> AccountNotificationPreferences:
+        preferences_cache = AccountNotificationPreferenceReader._get_preferences_cache()
+
+        cached_preferences = preferences_cache.get(account_id)
+        if cached_preferences is not None:
+            return cached_preferences
+
+        invalidation_count = AccountNotificationPreferenceReader._invalidation_count
+        if AccountNotificationPreferenceUtil.is_embedded_storage():
+            preferences = AccountNotificationPreferenceReader._get_embedded_account_notification_preferences(account_id)
+        else:
+            preferences = AccountNotificationPreferenceReader._get_collection_account_notification_preferences(
+                account_id
+            )
+
+        AccountNotificationPreferenceReader._cache_preferences(
+            {account_id: preferences}, invalidation_count=invalidation_count
+        )
+        return preferences
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        account_ids: List[str],
+    ) -> Dict[str, AccountNotificationPreferences]:
+        preferences_cache = AccountNotificationPreferenceReader._get_preferences_cache()
+
+        preferences_by_account_id: Dict[str, AccountNotificationPreferences] = {}
+        missing_account_ids: List[str] = []
+        for account_id in account_ids:
+            cached_preferences = preferences_cache.get(account_id)
+            if cached_preferences is None:
+                missing_account_ids.append(account_id)
+            else:
+                preferences_by_account_id[account_id] = cached_preferences
+
+        if missing_account_ids:
+            invalidation_count = AccountNotificationPreferenceReader._invalidation_count
+            loaded_preferences = AccountNotificationPreferenceReader._load_account_notification_preferences(
+                missing_account_ids
+            )
+            AccountNotificationPreferenceReader._cache_preferences(
+                loaded_preferences, invalidation_count=invalidation_count
+            )
+            preferences_by_account_id.update(loaded_preferences)
+
+        return preferences_by_account_id
+
+    @staticmethod
+    def warm_account_notification_preferences_cache(account_ids: List[str]) -> int:
+        return len(AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(account_ids))
+
+    @staticmethod
+    def invalidate_cached_account_notification_preferences(account_id: str) -> None:
+        preferences_cache = AccountNotificationPreferenceReader._get_preferences_cache()
+        with AccountNotificationPreferenceReader._invalidation_lock:
+            AccountNotificationPreferenceReader._invalidation_count += 1
+            preferences_cache.delete(account_id)
+
+    @staticmethod
+    def get_account_notification_preferences_cache_stats() -> CacheStats:
+        return AccountNotificationPreferenceReader._get_preferences_cache().stats()
+
+    @staticmethod
+    def _cache_preferences(
+        preferences_by_account_id: Dict[str, AccountNotificationPreferences], *, invalidation_count: int
+    ) -> None:
+        preferences_cache = AccountNotificationPreferenceReader._get_preferences_cache()
+        with AccountNotificationPreferenceReader._invalidation_lock:
+            # A write landed while these were read from the database, they may predate it and are not cached
+            if AccountNotificationPreferenceReader._invalidation_count != invalidation_count:
+                return
+
+            for account_id, preferences in preferences_by_account_id.items():
+                preferences_cache.set(account_id, preferences)
+
+    @staticmethod
+    def _get_preferences_cache() -> BoundedTTLCache[str, AccountNotificationPreferences]:
+        if AccountNotificationPreferenceReader._preferences_cache is None:
+            AccountNotificationPreferenceReader._preferences_cache = BoundedTTLCache(
+                max_size=ConfigService[int].get_value(key="notification.preferences_cache_max_size", default=10000),
+                ttl_in_seconds=ConfigService[int].get_value(
+                    key="notification.preferences_cache_ttl_in_seconds", default=60
+                ),
+            )
+            ConfigService.subscribe(AccountNotificationPreferenceReader._on_config_change)
+
+        return AccountNotificationPreferenceReader._preferences_cache
+
+    @staticmethod
+    def _on_config_change(changed_keys: Set[str]) -> None:
+        preferences_cache = AccountNotificationPreferenceReader._preferences_cache
+        if preferences_cache is not None and changed_keys & {
+            "notification.preferences_cache_max_size",
+            "notification.preferences_cache_ttl_in_seconds",
+        }:
+            preferences_cache.resize(
+                max_size=ConfigService.get_int(key="notification.preferences_cache_max_size", default=10000),
+                ttl_in_seconds=ConfigService.get_int(key="notification.preferences_cache_ttl_in_seconds", default=60),
+            )
+
+    @staticmethod
+    def _get_collection_account_notification_preferences(account_id: str) -> AccountNotificationPreferences:
         notification_preferences = AccountNotificationPreferencesRepository.collection().find_one(
             {"account_id": account_id, "active": True}
         )
@@ -19,3 +136,45 @@ class AccountNotificationPreferenceReader:
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             notification_preferences
         )
+
+    @staticmethod
+    def _load_account_notification_preferences(account_ids: List[str]) -> Dict[str, AccountNotificationPreferences]:
+        if AccountNotificationPreferenceUtil.is_embedded_storage():
+            accounts_bson = AccountEmbeddedNotificationPreferencesRepository.collection().find(
+                {"_id": {"$in": [ObjectId(account_id) for account_id in account_ids]}, "active": True},
+                projection={EMBEDDED_NOTIFICATION_PREFERENCES_FIELD: True},
+            )
+            return {
+                str(account_bson["_id"]): (
+                    AccountNotificationPreferenceUtil.convert_embedded_notification_preferences_to_account_notification_preferences(
+                        str(account_bson["_id"]), account_bson[EMBEDDED_NOTIFICATION_PREFERENCES_FIELD]
+                    )
+                )
+                for account_bson in accounts_bson
+                if EMBEDDED_NOTIFICATION_PREFERENCES_FIELD in account_bson
+            }
+
+        notification_preferences = AccountNotificationPreferencesRepository.collection().find(
+            {"account_id": {"$in": account_ids}, "active": True}
+        )
+        account_notification_preferences = [
+            AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                notification_preferences_bson
+            )
+            for notification_preferences_bson in notification_preferences
+        ]
+        return {preferences.account_id: preferences for preferences in account_notification_preferences}
+
+    @staticmethod
+    def _get_embedded_account_notification_preferences(account_id: str) -> AccountNotificationPreferences:
+        account_bson = AccountEmbeddedNotificationPreferencesRepository.collection().find_one(
+            {"_id": ObjectId(account_id), "active": True},
+            projection={EMBEDDED_NOTIFICATION_PREFERENCES_FIELD: True, "_id": False},
+        )
+
+        if account_bson is None or EMBEDDED_NOTIFICATION_PREFERENCES_FIELD not in account_bson:
+            raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
+
+        return AccountNotificationPreferenceUtil.convert_embedded_notification_preferences_to_account_notification_preferences(
+            account_id, account_bson[EMBEDDED_NOTIFICATION_PREFERENCES_FIELD]
+        )
@@ -1,8 +1,9 @@
 from typing import Any
+from modules.config.config_service import ConfigService
 from modules.notification.internals.store.account_notification_preferences_model import (
     AccountNotificationPreferencesModel,
 )
-from modules.notification.types import AccountNotificationPreferences
+from modules.notification.types import AccountNotificationPreferences, AccountNotificationPreferencesStorage
 
 
 class AccountNotificationPreferenceUtil:
@@ -17,3 +18,21 @@ class AccountNotificationPreferenceUtil:
             push_enabled=validated_preferences_data.push_enabled,
             sms_enabled=validated_preferences_data.sms_enabled,
         )
+
+    @staticmethod
+    def convert_embedded_notification_preferences_to_account_notification_preferences(
+        account_id: str, embedded_preferences: dict[str, Any]
+    ) -> AccountNotificationPreferences:
+        return AccountNotificationPreferences(
+            account_id=account_id,
+            email_enabled=embedded_preferences.get("email_enabled", True),
+            push_enabled=embedded_preferences.get("push_enabled", True),
+            sms_enabled=embedded_preferences.get("sms_enabled", True),
+        )
+
+    @staticmethod
+    def is_embedded_storage() -> bool:
+        storage = ConfigService[str].get_value(
+            key="notification.preferences_storage", default=AccountNotificationPreferencesStorage.COLLECTION
+        )
+        return storage == AccountNotificationPreferencesStorage.EMBEDDED
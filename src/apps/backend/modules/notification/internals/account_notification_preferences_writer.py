@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Any
-from pymongo import ReturnDocument
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 
-from modules.notification.internals.store.account_notification_preferences_model import (
-    AccountNotificationPreferencesModel,
+from modules.notification.internals.store.account_embedded_notification_preferences_repository import (
+    EMBEDDED_NOTIFICATION_PREFERENCES_FIELD,
+    AccountEmbeddedNotificationPreferencesRepository,
 )
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
@@ -18,54 +21,128 @@ from modules.notification.types import (
 
 
 class AccountNotificationPreferenceWriter:
+    PREFERENCE_FIELDS = ("email_enabled", "push_enabled", "sms_enabled")
+
+    @staticmethod
+    def create_or_update_account_notification_preferences(
+        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
+    ) -> AccountNotificationPreferences:
+        try:
+            if AccountNotificationPreferenceUtil.is_embedded_storage():
+                return AccountNotificationPreferenceWriter._create_or_update_embedded_account_notification_preferences(
+                    account_id, preferences
+                )
+
+            return AccountNotificationPreferenceWriter._upsert_account_notification_preferences(account_id, preferences)
+        finally:
+            # Invalidate after the write so a read racing with it cannot leave the old value cached
+            AccountNotificationPreferenceReader.invalidate_cached_account_notification_preferences(account_id)
+
     @staticmethod
-    def _create_account_notification_preferences(
+    def _upsert_account_notification_preferences(
         account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
     ) -> AccountNotificationPreferences:
-        preferences_model = AccountNotificationPreferencesModel(
-            account_id=account_id,
-            id=None,
-            email_enabled=preferences.email_enabled if preferences.email_enabled is not None else True,
-            push_enabled=preferences.push_enabled if preferences.push_enabled is not None else True,
-            sms_enabled=preferences.sms_enabled if preferences.sms_enabled is not None else True,
-        ).to_bson()
+        now = datetime.now()
+        # Provided fields are always written, the others only get their default when the document is created
+        set_data: dict[str, Any] = {"updated_at": now}
+        set_on_insert_data: dict[str, Any] = {"created_at": now}
+        for field in AccountNotificationPreferenceWriter.PREFERENCE_FIELDS:
+            value = getattr(preferences, field)
+            if value is not None:
+                set_data[field] = value
+            else:
+                set_on_insert_data[field] = True
 
-        query = AccountNotificationPreferencesRepository.collection().insert_one(preferences_model)
-        created_preferences = AccountNotificationPreferencesRepository.collection().find_one({"_id": query.inserted_id})
+        try:
+            updated_preferences = AccountNotificationPreferenceWriter._find_one_and_upsert_preferences(
+                account_id, set_data, set_on_insert_data
+            )
+        except DuplicateKeyError:
+            # A concurrent call created the document between our match and insert, so this time the update matches
+            updated_preferences = AccountNotificationPreferenceWriter._find_one_and_upsert_preferences(
+                account_id, set_data, set_on_insert_data
+            )
 
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            created_preferences
+            updated_preferences
         )
 
     @staticmethod
-    def _update_account_notification_preferences(
+    def _find_one_and_upsert_preferences(
+        account_id: str, set_data: dict[str, Any], set_on_insert_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        preferences_bson: dict[str, Any] = AccountNotificationPreferencesRepository.collection().find_one_and_update(
+            {"account_id": account_id, "active": True},
+            {"$set": set_data, "$setOnInsert": set_on_insert_data},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return preferences_bson
+
+    @staticmethod
+    def _create_or_update_embedded_account_notification_preferences(
         account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
     ) -> AccountNotificationPreferences:
-        update_data: dict[str, Any] = {"updated_at": datetime.now()}
-
-        if preferences.email_enabled is not None:
-            update_data["email_enabled"] = preferences.email_enabled
+        # Fields that are not provided keep their stored value, or default to enabled on first write
+        embedded_preferences: dict[str, Any] = {"updated_at": datetime.now()}
+        for field in AccountNotificationPreferenceWriter.PREFERENCE_FIELDS:
+            value = getattr(preferences, field)
+            embedded_preferences[field] = (
+                value
+                if value is not None
+                else {"$ifNull": [f"${EMBEDDED_NOTIFICATION_PREFERENCES_FIELD}.{field}", True]}
+            )
 
-        if preferences.push_enabled is not None:
-            update_data["push_enabled"] = preferences.push_enabled
+        updated_account = AccountEmbeddedNotificationPreferencesRepository.collection().find_one_and_update(
+            {"_id": ObjectId(account_id), "active": True},
+            [{"$set": {EMBEDDED_NOTIFICATION_PREFERENCES_FIELD: embedded_preferences}}],
+            projection={EMBEDDED_NOTIFICATION_PREFERENCES_FIELD: True, "_id": False},
+            return_document=ReturnDocument.AFTER,
+        )
 
-        if preferences.sms_enabled is not None:
-            update_data["sms_enabled"] = preferences.sms_enabled
+        if updated_account is None:
+            raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
 
-        updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
-            {"account_id": account_id, "active": True}, {"$set": update_data}, return_document=ReturnDocument.AFTER
+        return AccountNotificationPreferenceUtil.convert_embedded_notification_preferences_to_account_notification_preferences(
+            account_id, updated_account[EMBEDDED_NOTIFICATION_PREFERENCES_FIELD]
         )
 
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            updated_preferences
-        )
+    @staticmethod
+    def embed_account_notification_preferences_in_accounts(*, batch_size: int) -> int:
+        migrated_count = 0
+        updates: list[UpdateOne] = []
+        cursor = AccountNotificationPreferencesRepository.collection().find({"active": True}, batch_size=batch_size)
+
+        for preferences_bson in cursor:
+            preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                preferences_bson
+            )
+            if not ObjectId.is_valid(preferences.account_id):
+                continue
+
+            embedded_preferences = {
+                "email_enabled": preferences.email_enabled,
+                "push_enabled": preferences.push_enabled,
+                "sms_enabled": preferences.sms_enabled,
+                "updated_at": preferences_bson.get("updated_at") or datetime.now(),
+            }
+            updates.append(
+                UpdateOne(
+                    {"_id": ObjectId(preferences.account_id)},
+                    {"$set": {EMBEDDED_NOTIFICATION_PREFERENCES_FIELD: embedded_preferences}},
+                )
+            )
+
+            if len(updates) >= batch_size:
+                migrated_count += AccountNotificationPreferenceWriter._write_embedded_preferences_batch(updates)
+                updates = []
+
+        if updates:
+            migrated_count += AccountNotificationPreferenceWriter._write_embedded_preferences_batch(updates)
+
+        return migrated_count
 
     @staticmethod
-    def create_or_update_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        try:
-            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
-            return AccountNotificationPreferenceWriter._update_account_notification_preferences(account_id, preferences)
-        except AccountNotificationPreferencesNotFoundError:
-            return AccountNotificationPreferenceWriter._create_account_notification_preferences(account_id, preferences)
+    def _write_embedded_preferences_batch(updates: list[UpdateOne]) -> int:
+        result = AccountEmbeddedNotificationPreferencesRepository.collection().bulk_write(updates, ordered=False)
+        return int(result.matched_count)
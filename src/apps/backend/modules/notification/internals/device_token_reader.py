@@ -0,0 +1,17 @@
+from typing import List
+
+from modules.notification.internals.device_token_util import DeviceTokenUtil
+from modules.notification.internals.store.device_token_repository import DeviceTokenRepository
+from modules.notification.types import DeviceToken
+
+
+class DeviceTokenReader:
+    @staticmethod
+    def get_device_tokens_by_account_ids(account_ids: List[str]) -> List[DeviceToken]:
+        if not account_ids:
+            return []
+
+        device_tokens = DeviceTokenRepository.collection().find({"account_id": {"$in": account_ids}})
+        return [
+            DeviceTokenUtil.convert_device_token_bson_to_device_token(device_token) for device_token in device_tokens
+        ]
@@ -0,0 +1,16 @@
+from typing import Any
+
+from modules.notification.internals.store.device_token_model import DeviceTokenModel
+from modules.notification.types import DeviceToken
+
+
+class DeviceTokenUtil:
+    @staticmethod
+    def convert_device_token_bson_to_device_token(device_token_bson: dict[str, Any]) -> DeviceToken:
+        validated_device_token_data = DeviceTokenModel.from_bson(device_token_bson)
+        return DeviceToken(
+            account_id=validated_device_token_data.account_id,
+            id=str(validated_device_token_data.id),
+            platform=validated_device_token_data.platform,
+            token=validated_device_token_data.token,
+        )
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, List
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from modules.notification.internals.device_token_util import DeviceTokenUtil
+from modules.notification.internals.push_params import PushParams
+from modules.notification.internals.store.device_token_repository import DeviceTokenRepository
+from modules.notification.types import DeviceToken, RegisterDeviceTokenParams
+
+
+class DeviceTokenWriter:
+    @staticmethod
+    def register_device_token(*, account_id: str, params: RegisterDeviceTokenParams) -> DeviceToken:
+        PushParams.validate_device_token(params)
+
+        try:
+            device_token_bson = DeviceTokenWriter._upsert_device_token(account_id=account_id, params=params)
+        except DuplicateKeyError:
+            # A concurrent registration of the same token won the insert, this time the update matches it
+            device_token_bson = DeviceTokenWriter._upsert_device_token(account_id=account_id, params=params)
+
+        return DeviceTokenUtil.convert_device_token_bson_to_device_token(device_token_bson)
+
+    @staticmethod
+    def remove_device_token(*, account_id: str, token: str) -> None:
+        DeviceTokenRepository.collection().delete_one({"account_id": account_id, "token": token})
+
+    @staticmethod
+    def remove_device_tokens_by_account_id(*, account_id: str) -> int:
+        return int(DeviceTokenRepository.collection().delete_many({"account_id": account_id}).deleted_count)
+
+    @staticmethod
+    def prune_device_tokens(*, tokens: List[str]) -> int:
+        if not tokens:
+            return 0
+
+        return int(DeviceTokenRepository.collection().delete_many({"token": {"$in": tokens}}).deleted_count)
+
+    @staticmethod
+    def _upsert_device_token(*, account_id: str, params: RegisterDeviceTokenParams) -> dict[str, Any]:
+        now = datetime.now()
+        device_token_bson: dict[str, Any] = DeviceTokenRepository.collection().find_one_and_update(
+            {"token": params.token},
+            {
+                "$set": {"account_id": account_id, "platform": params.platform, "updated_at": now},
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return device_token_bson
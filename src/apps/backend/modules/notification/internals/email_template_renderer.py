@@ -0,0 +1,62 @@
+import os
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
+
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ValidationError
+from modules.notification.types import RenderedEmail, ValidationFailure
+
+DEFAULT_EMAIL_TEMPLATES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "email")
+
+
+class EmailTemplateRenderer:
+    """
+    Renders the local email templates used by the SMTP transport. Every template id is a directory holding
+    `subject.txt`, `body.html` and optionally `body.txt`.
+    """
+
+    _environment: Optional[Environment] = None
+
+    @staticmethod
+    def render(*, template_id: str, template_data: Optional[Dict[str, Any]]) -> RenderedEmail:
+        environment = EmailTemplateRenderer._get_environment()
+        template_data = template_data or {}
+
+        try:
+            subject_template = environment.get_template(f"{template_id}/subject.txt")
+            html_template = environment.get_template(f"{template_id}/body.html")
+        except TemplateNotFound:
+            raise ValidationError(
+                "Email cannot be sent, please check the params validity.",
+                [ValidationFailure(field="template_id", message=f"No email template found for {template_id}.")],
+            )
+
+        try:
+            text_body: Optional[str] = environment.get_template(f"{template_id}/body.txt").render(template_data)
+        except TemplateNotFound:
+            text_body = None
+
+        return RenderedEmail(
+            html_body=html_template.render(template_data),
+            # A header cannot span lines, so a trailing newline in the template file must not end up in it
+            subject=" ".join(subject_template.render(template_data).split()),
+            text_body=text_body,
+        )
+
+    @staticmethod
+    def _get_environment() -> Environment:
+        if EmailTemplateRenderer._environment is None:
+            EmailTemplateRenderer._environment = Environment(
+                # Templates ship with the release, so compiled templates are never checked against the files again
+                auto_reload=False,
+                autoescape=select_autoescape(["html"]),
+                cache_size=ConfigService[int].get_value(key="smtp.template_cache_size", default=200),
+                loader=FileSystemLoader(
+                    ConfigService[str].get_value(
+                        key="smtp.templates_directory", default=DEFAULT_EMAIL_TEMPLATES_DIRECTORY
+                    )
+                ),
+            )
+
+        return EmailTemplateRenderer._environment
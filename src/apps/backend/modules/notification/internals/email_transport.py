@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from modules.config.config_service import ConfigService
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.smtp_service import SmtpService
+from modules.notification.types import BulkEmailFailure, EmailTransportType, SendBulkEmailParams, SendEmailParams
+
+
+class EmailTransport:
+    @staticmethod
+    def get_template_id(*, sendgrid_template_id_key: str, template_type: str, default: Optional[str] = None) -> str:
+        if EmailTransport._is_smtp():
+            # SendGrid template ids mean nothing to the SMTP transport, it renders the local template directory instead
+            return ConfigService.get_str(key=f"mailer.smtp_template_ids.{template_type}", default=default)
+
+        return ConfigService.get_str(key=sendgrid_template_id_key, default=default)
+
+    @staticmethod
+    def send_email(params: SendEmailParams) -> None:
+        if EmailTransport._is_smtp():
+            SmtpService.send_email(params)
+        else:
+            SendGridService.send_email(params)
+
+    @staticmethod
+    def send_bulk_email(params: SendBulkEmailParams) -> List[BulkEmailFailure]:
+        if EmailTransport._is_smtp():
+            return SmtpService.send_bulk_email(params)
+
+        return SendGridService.send_bulk_email(params)
+
+    @staticmethod
+    def _is_smtp() -> bool:
+        return (
+            ConfigService[str].get_value(key="mailer.transport", default=EmailTransportType.SENDGRID)
+            == EmailTransportType.SMTP
+        )
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.push_params import PushParams
+from modules.notification.types import NotificationProvider, PushDeliveryStatus, SendPushParams
+
+FCM_MESSAGES_SEND_PATH = "/v1/projects/{project_id}/messages:send"
+
+# FCM reports these for tokens that will never be deliverable again, e.g. after the app was uninstalled
+FCM_INVALID_TOKEN_ERROR_CODES = ("UNREGISTERED", "SENDER_ID_MISMATCH")
+
+
+class FcmService:
+    __headers: Optional[Dict[str, str]] = None
+    __messages_send_url: Optional[str] = None
+
+    @staticmethod
+    def send_push_batch(*, tokens: List[str], params: SendPushParams) -> Dict[str, str]:
+        PushParams.validate(params)
+
+        if not tokens:
+            return {}
+
+        # FCM v1 takes one token per request, the pooled session keeps these concurrent requests on warm connections
+        max_concurrency = ConfigService[int].get_value(key="push.max_concurrency", default=10)
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(tokens))) as executor:
+            statuses = list(executor.map(lambda token: FcmService._send_push(token=token, params=params), tokens))
+
+        return dict(zip(tokens, statuses))
+
+    @staticmethod
+    def _send_push(*, token: str, params: SendPushParams) -> str:
+        payload = FcmService._build_message(token=token, params=params)
+        try:
+            return ProviderCallExecutor.execute(
+                provider=NotificationProvider.PUSH,
+                call=lambda timeout_in_seconds: FcmService._post_message(
+                    payload, timeout_in_seconds=timeout_in_seconds
+                ),
+            )
+        except ServiceError as err:
+            Logger.error(message=f"Push notification could not be sent: {err.message}")
+            return PushDeliveryStatus.FAILED
+
+    @staticmethod
+    def _build_message(*, token: str, params: SendPushParams) -> Dict[str, Any]:
+        message: Dict[str, Any] = {"token": token, "notification": {"title": params.title, "body": params.body}}
+        if params.data:
+            message["data"] = params.data
+        return {"message": message}
+
+    @staticmethod
+    def _post_message(payload: Dict[str, Any], *, timeout_in_seconds: float) -> str:
+        response = NotificationHttpTransport.get_session(provider=NotificationProvider.PUSH).post(
+            FcmService._get_messages_send_url(),
+            headers=FcmService._get_headers(),
+            json=payload,
+            timeout=NotificationHttpTransport.get_timeout(max_timeout_in_seconds=timeout_in_seconds),
+        )
+
+        if FcmService._is_invalid_token_response(response):
+            return PushDeliveryStatus.INVALID_TOKEN
+
+        NotificationHttpTransport.raise_for_status(response)
+        return PushDeliveryStatus.SENT
+
+    @staticmethod
+    def _is_invalid_token_response(response: requests.Response) -> bool:
+        if response.status_code == 404:
+            return True
+
+        if response.status_code != 400:
+            return False
+
+        try:
+            error_details = response.json().get("error", {}).get("details", [])
+        except ValueError:
+            return False
+
+        return any(detail.get("errorCode") in FCM_INVALID_TOKEN_ERROR_CODES for detail in error_details)
+
+    @staticmethod
+    def _get_headers() -> Dict[str, str]:
+        if not FcmService.__headers:
+            access_token = ConfigService[str].get_value(key="push.access_token")
+            FcmService.__headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+        return FcmService.__headers
+
+    @staticmethod
+    def _get_messages_send_url() -> str:
+        if not FcmService.__messages_send_url:
+            base_url = ConfigService[str].get_value(key="push.base_url", default="https://fcm.googleapis.com")
+            project_id = ConfigService[str].get_value(key="push.project_id")
+            FcmService.__messages_send_url = (
+                f"{base_url.rstrip('/')}{FCM_MESSAGES_SEND_PATH.format(project_id=project_id)}"
+            )
+        return FcmService.__messages_send_url
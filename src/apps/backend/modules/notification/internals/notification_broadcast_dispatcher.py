@@ -0,0 +1,125 @@
+from typing import List, Optional
+
+from modules.account.types import Account, AccountSegmentPageParams
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.email_service import EmailService
+from modules.notification.internals.notification_broadcast_reader import NotificationBroadcastReader
+from modules.notification.internals.notification_broadcast_util import NotificationBroadcastUtil
+from modules.notification.internals.notification_broadcast_writer import NotificationBroadcastWriter
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.types import (
+    BulkEmailRecipient,
+    CreateNotificationBroadcastParams,
+    EmailRecipient,
+    NotificationBroadcast,
+    SendBulkEmailParams,
+)
+
+
+class NotificationBroadcastDispatcher:
+    @staticmethod
+    def run_next_notification_broadcast() -> Optional[NotificationBroadcast]:
+        notification_broadcast_bson = NotificationBroadcastWriter.claim_next_notification_broadcast()
+        if notification_broadcast_bson is None:
+            return None
+
+        broadcast = NotificationBroadcastUtil.convert_notification_broadcast_bson_to_notification_broadcast(
+            notification_broadcast_bson
+        )
+        params = NotificationBroadcastUtil.convert_notification_broadcast_bson_to_create_notification_broadcast_params(
+            notification_broadcast_bson
+        )
+        claim_id = str(notification_broadcast_bson["claim_id"])
+
+        try:
+            is_lease_held = NotificationBroadcastDispatcher._send_to_segment(
+                broadcast_id=broadcast.id, claim_id=claim_id, after_account_id=broadcast.last_account_id, params=params
+            )
+        except Exception as err:
+            # The checkpoint survives, so the next attempt continues after the last chunk that went out
+            Logger.error(message=f"Notification broadcast {broadcast.id} failed: {err}")
+            is_lease_held = NotificationBroadcastWriter.record_failure(
+                broadcast_id=broadcast.id,
+                claim_id=claim_id,
+                attempts=broadcast.attempts + 1,
+                error=str(err) or err.__class__.__name__,
+                max_attempts=ConfigService[int].get_value(key="notification.broadcast.max_attempts", default=5),
+            )
+        else:
+            is_lease_held = is_lease_held and NotificationBroadcastWriter.mark_completed(
+                broadcast_id=broadcast.id, claim_id=claim_id
+            )
+
+        if not is_lease_held:
+            # Another worker re-claimed the broadcast after the lease ran out, it owns the outcome from here on
+            Logger.warn(message=f"Notification broadcast {broadcast.id} lost its lease, leaving it to its new worker")
+
+        return NotificationBroadcastReader.get_notification_broadcast_by_id(broadcast.id)
+
+    @staticmethod
+    def _send_to_segment(
+        *, broadcast_id: str, claim_id: str, after_account_id: Optional[str], params: CreateNotificationBroadcastParams
+    ) -> bool:
+        # The account module imports the notification service, so its service is only resolved once both are loaded
+        from modules.account.account_service import AccountService
+
+        chunk_size = NotificationBroadcastUtil.get_chunk_size()
+        while True:
+            # Paged in _id order, so memory stays bounded by one chunk and _id is a stable resume point
+            accounts_chunk = AccountService.get_accounts_in_segment(
+                params=AccountSegmentPageParams(
+                    after_account_id=after_account_id, limit=chunk_size, segment=params.segment
+                )
+            )
+            if not accounts_chunk:
+                return True
+
+            if not NotificationBroadcastDispatcher._send_to_chunk(
+                broadcast_id=broadcast_id, claim_id=claim_id, accounts_chunk=accounts_chunk, params=params
+            ):
+                return False
+            if len(accounts_chunk) < chunk_size:
+                return True
+
+            after_account_id = accounts_chunk[-1].id
+
+    @staticmethod
+    def _send_to_chunk(
+        *, broadcast_id: str, claim_id: str, accounts_chunk: List[Account], params: CreateNotificationBroadcastParams
+    ) -> bool:
+        recipients = [
+            BulkEmailRecipient(
+                account_id=account.id,
+                recipient=EmailRecipient(email=account.username),
+                template_data={
+                    **(params.template_data or {}),
+                    "first_name": account.first_name,
+                    "last_name": account.last_name,
+                },
+            )
+            for account in accounts_chunk
+            # One malformed username must not fail the bulk email of the whole chunk
+            if EmailParams.is_email_valid(account.username)
+        ]
+
+        sent_count = 0
+        if recipients:
+            # Preferences are joined for the whole chunk in one query and the chunk goes out as one bulk email
+            sent_count = EmailService.send_bulk_email(
+                params=SendBulkEmailParams(recipients=recipients, sender=params.sender, template_id=params.template_id)
+            )
+
+        is_lease_held = NotificationBroadcastWriter.record_progress(
+            broadcast_id=broadcast_id,
+            claim_id=claim_id,
+            last_account_id=accounts_chunk[-1].id,
+            processed_count=len(accounts_chunk),
+            sent_count=sent_count,
+            skipped_count=len(accounts_chunk) - sent_count,
+        )
+        Logger.info(
+            message=f"Notification broadcast {broadcast_id} sent to {sent_count} of {len(accounts_chunk)} accounts "
+            f"up to account {accounts_chunk[-1].id}"
+        )
+        return is_lease_held
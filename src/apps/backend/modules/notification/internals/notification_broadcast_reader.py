@@ -0,0 +1,27 @@
+from typing import Any, Dict, Optional
+
+from bson.objectid import ObjectId
+
+from modules.notification.errors import NotificationBroadcastNotFoundError
+from modules.notification.internals.notification_broadcast_util import NotificationBroadcastUtil
+from modules.notification.internals.store.notification_broadcast_repository import NotificationBroadcastRepository
+from modules.notification.types import NotificationBroadcast
+
+
+class NotificationBroadcastReader:
+    @staticmethod
+    def get_notification_broadcast_by_id(broadcast_id: str) -> NotificationBroadcast:
+        return NotificationBroadcastUtil.convert_notification_broadcast_bson_to_notification_broadcast(
+            NotificationBroadcastReader.get_notification_broadcast_bson_by_id(broadcast_id)
+        )
+
+    @staticmethod
+    def get_notification_broadcast_bson_by_id(broadcast_id: str) -> Dict[str, Any]:
+        notification_broadcast_bson: Optional[Dict[str, Any]] = NotificationBroadcastRepository.collection().find_one(
+            {"_id": ObjectId(broadcast_id)}
+        )
+
+        if notification_broadcast_bson is None:
+            raise NotificationBroadcastNotFoundError(broadcast_id=broadcast_id)
+
+        return notification_broadcast_bson
@@ -0,0 +1,81 @@
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Dict
+
+from modules.config.config_service import ConfigService
+from modules.notification.internals.sendgrid_service import MAX_PERSONALIZATIONS_PER_REQUEST
+from modules.notification.internals.store.notification_broadcast_model import NotificationBroadcastModel
+from modules.notification.types import (
+    AccountSegment,
+    CreateNotificationBroadcastParams,
+    EmailSender,
+    NotificationBroadcast,
+)
+
+
+class NotificationBroadcastUtil:
+    @staticmethod
+    def is_broadcast_enabled() -> bool:
+        return ConfigService.get_bool(key="notification.broadcast.enabled", default=False)
+
+    @staticmethod
+    def get_chunk_size() -> int:
+        chunk_size = ConfigService[int].get_value(
+            key="notification.broadcast.chunk_size", default=MAX_PERSONALIZATIONS_PER_REQUEST
+        )
+        # A chunk becomes one bulk email, which cannot address more recipients than SendGrid accepts per request
+        return max(1, min(chunk_size, MAX_PERSONALIZATIONS_PER_REQUEST))
+
+    @staticmethod
+    def get_lease() -> timedelta:
+        return timedelta(
+            seconds=ConfigService[int].get_value(key="notification.broadcast.lease_in_seconds", default=300)
+        )
+
+    @staticmethod
+    def get_retry_delay(*, attempts: int) -> timedelta:
+        retry_base_delay_in_seconds = ConfigService[int].get_value(
+            key="notification.broadcast.retry_base_delay_in_seconds", default=60
+        )
+        return timedelta(seconds=retry_base_delay_in_seconds * 2 ** max(attempts - 1, 0))
+
+    @staticmethod
+    def convert_create_notification_broadcast_params_to_bson(
+        params: CreateNotificationBroadcastParams, *, status: str
+    ) -> Dict[str, Any]:
+        return NotificationBroadcastModel(
+            id=None,
+            segment=asdict(params.segment),
+            sender=asdict(params.sender),
+            status=status,
+            template_data=params.template_data,
+            template_id=params.template_id,
+        ).to_bson()
+
+    @staticmethod
+    def convert_notification_broadcast_bson_to_create_notification_broadcast_params(
+        notification_broadcast_bson: Dict[str, Any]
+    ) -> CreateNotificationBroadcastParams:
+        validated_notification_broadcast_data = NotificationBroadcastModel.from_bson(notification_broadcast_bson)
+        return CreateNotificationBroadcastParams(
+            segment=AccountSegment(**validated_notification_broadcast_data.segment),
+            sender=EmailSender(**validated_notification_broadcast_data.sender),
+            template_data=validated_notification_broadcast_data.template_data,
+            template_id=validated_notification_broadcast_data.template_id,
+        )
+
+    @staticmethod
+    def convert_notification_broadcast_bson_to_notification_broadcast(
+        notification_broadcast_bson: Dict[str, Any]
+    ) -> NotificationBroadcast:
+        validated_notification_broadcast_data = NotificationBroadcastModel.from_bson(notification_broadcast_bson)
+        return NotificationBroadcast(
+            attempts=validated_notification_broadcast_data.attempts,
+            id=str(validated_notification_broadcast_data.id),
+            last_account_id=validated_notification_broadcast_data.last_account_id,
+            last_error=validated_notification_broadcast_data.last_error,
+            processed_count=validated_notification_broadcast_data.processed_count,
+            sent_count=validated_notification_broadcast_data.sent_count,
+            skipped_count=validated_notification_broadcast_data.skipped_count,
+            status=validated_notification_broadcast_data.status,
+        )
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+
+from modules.notification.errors import NotificationBroadcastDisabledError
+from modules.notification.internals.notification_broadcast_util import NotificationBroadcastUtil
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.store.notification_broadcast_repository import NotificationBroadcastRepository
+from modules.notification.types import (
+    CreateNotificationBroadcastParams,
+    NotificationBroadcast,
+    NotificationBroadcastStatus,
+)
+
+CLAIMABLE_STATUSES = [NotificationBroadcastStatus.PENDING, NotificationBroadcastStatus.RUNNING]
+
+
+class NotificationBroadcastWriter:
+    @staticmethod
+    def create_notification_broadcast(params: CreateNotificationBroadcastParams) -> NotificationBroadcast:
+        if not NotificationBroadcastUtil.is_broadcast_enabled():
+            raise NotificationBroadcastDisabledError()
+        EmailParams.validate_broadcast(params)
+
+        notification_broadcast_bson = NotificationBroadcastUtil.convert_create_notification_broadcast_params_to_bson(
+            params, status=NotificationBroadcastStatus.PENDING
+        )
+        query = NotificationBroadcastRepository.collection().insert_one(notification_broadcast_bson)
+        notification_broadcast_bson["_id"] = query.inserted_id
+
+        return NotificationBroadcastUtil.convert_notification_broadcast_bson_to_notification_broadcast(
+            notification_broadcast_bson
+        )
+
+    @staticmethod
+    def claim_next_notification_broadcast() -> Optional[Dict[str, Any]]:
+        now = datetime.now()
+        # RUNNING broadcasts whose lease ran out belong to a worker that died, they resume from their checkpoint
+        notification_broadcast_bson: Optional[
+            Dict[str, Any]
+        ] = NotificationBroadcastRepository.collection().find_one_and_update(
+            {"status": {"$in": CLAIMABLE_STATUSES}, "lease_expires_at": {"$lte": now}},
+            {
+                "$set": {
+                    "claim_id": ObjectId(),
+                    "lease_expires_at": now + NotificationBroadcastUtil.get_lease(),
+                    "status": NotificationBroadcastStatus.RUNNING,
+                    "updated_at": now,
+                }
+            },
+            sort=[("lease_expires_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return notification_broadcast_bson
+
+    @staticmethod
+    def record_progress(
+        *,
+        broadcast_id: str,
+        claim_id: str,
+        last_account_id: str,
+        processed_count: int,
+        sent_count: int,
+        skipped_count: int,
+    ) -> bool:
+        now = datetime.now()
+        # Renewing the lease fails once another worker re-claimed the broadcast, the caller then stops sending
+        result = NotificationBroadcastRepository.collection().update_one(
+            {"_id": ObjectId(broadcast_id), "claim_id": ObjectId(claim_id)},
+            {
+                "$set": {
+                    "last_account_id": last_account_id,
+                    "lease_expires_at": now + NotificationBroadcastUtil.get_lease(),
+                    "updated_at": now,
+                },
+                "$inc": {"processed_count": processed_count, "sent_count": sent_count, "skipped_count": skipped_count},
+            },
+        )
+        matched_count: int = result.matched_count
+        return matched_count == 1
+
+    @staticmethod
+    def mark_completed(*, broadcast_id: str, claim_id: str) -> bool:
+        now = datetime.now()
+        result = NotificationBroadcastRepository.collection().update_one(
+            {"_id": ObjectId(broadcast_id), "claim_id": ObjectId(claim_id)},
+            {
+                "$set": {"completed_at": now, "status": NotificationBroadcastStatus.COMPLETED, "updated_at": now},
+                "$unset": {"claim_id": ""},
+            },
+        )
+        matched_count: int = result.matched_count
+        return matched_count == 1
+
+    @staticmethod
+    def record_failure(*, broadcast_id: str, claim_id: str, attempts: int, error: str, max_attempts: int) -> bool:
+        now = datetime.now()
+        update: Dict[str, Any] = {"attempts": attempts, "last_error": error, "updated_at": now}
+
+        if attempts >= max_attempts:
+            update["status"] = NotificationBroadcastStatus.FAILED
+        else:
+            update.update(
+                {
+                    "lease_expires_at": now + NotificationBroadcastUtil.get_retry_delay(attempts=attempts),
+                    "status": NotificationBroadcastStatus.PENDING,
+                }
+            )
+
+        result = NotificationBroadcastRepository.collection().update_one(
+            {"_id": ObjectId(broadcast_id), "claim_id": ObjectId(claim_id)},
+            {"$set": update, "$unset": {"claim_id": ""}},
+        )
+        matched_count: int = result.matched_count
+        return matched_count == 1
@@ -0,0 +1,77 @@
+from modules.logger.logger import Logger
+from modules.notification.internals.email_transport import EmailTransport
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.notification_digest_writer import NotificationDigestWriter
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import NotificationChannel, NotificationDigest
+
+
+class NotificationDigestDispatcher:
+    @staticmethod
+    def flush_due_digests(*, batch_size: int) -> int:
+        digests = NotificationDigestWriter.claim_due_digests(
+            batch_size=batch_size, lease=NotificationDigestUtil.get_lease()
+        )
+        max_attempts = NotificationDigestUtil.get_max_attempts()
+
+        for digest in digests:
+            NotificationDigestDispatcher._deliver(digest, max_attempts=max_attempts)
+
+        return len(digests)
+
+    @staticmethod
+    def _deliver(digest: NotificationDigest, *, max_attempts: int) -> None:
+        try:
+            NotificationDigestDispatcher._send(digest)
+        except Exception as err:
+            if digest.attempts < max_attempts:
+                # Kept claimed, the digest is delivered again by the first flush after its lease expires
+                Logger.warn(
+                    message=f"Notification digest {digest.id} ({digest.channel}) for account {digest.account_id} "
+                    f"could not be delivered on attempt {digest.attempts}, retrying after the lease expires: {err}"
+                )
+                return
+
+            Logger.error(
+                message=f"Notification digest {digest.id} ({digest.channel}) of {digest.total_count} notifications "
+                f"for account {digest.account_id} could not be delivered after {digest.attempts} attempts: {err}"
+            )
+
+        NotificationDigestWriter.delete_claimed_digest(digest_id=digest.id, claim_id=digest.claim_id)
+
+    @staticmethod
+    def _send(digest: NotificationDigest) -> None:
+        # Handed to the outbox when it is enabled, which then owns retrying the delivery
+        is_outbox_enabled = NotificationOutboxUtil.is_outbox_enabled()
+        if digest.channel == NotificationChannel.EMAIL:
+            if digest.total_count > 1 and not NotificationDigestUtil.get_email_template_id():
+                # Buffered before the digest template was unset, the emails go out one by one instead of being lost
+                emails_params = [
+                    NotificationOutboxUtil.convert_payload_to_send_email_params(item) for item in digest.items
+                ]
+            else:
+                emails_params = [NotificationDigestUtil.convert_digest_to_send_email_params(digest)]
+
+            for email_params in emails_params:
+                if is_outbox_enabled:
+                    NotificationOutboxWriter.enqueue_notification(
+                        account_id=digest.account_id,
+                        channel=NotificationChannel.EMAIL,
+                        payload=NotificationOutboxUtil.convert_send_email_params_to_payload(email_params),
+                    )
+                else:
+                    EmailTransport.send_email(email_params)
+        elif digest.channel == NotificationChannel.SMS:
+            sms_params = NotificationDigestUtil.convert_digest_to_send_sms_params(digest)
+            if is_outbox_enabled:
+                NotificationOutboxWriter.enqueue_notification(
+                    account_id=digest.account_id,
+                    channel=NotificationChannel.SMS,
+                    payload=NotificationOutboxUtil.convert_send_sms_params_to_payload(sms_params),
+                )
+            else:
+                TwilioService.send_sms(params=sms_params)
+        else:
+            Logger.error(message=f"Notification digest {digest.id} has unsupported channel: {digest.channel}")
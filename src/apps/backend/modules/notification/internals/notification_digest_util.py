@@ -0,0 +1,116 @@
+from datetime import timedelta
+from typing import Any, Dict
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.email_transport import EmailTransport
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.store.notification_digest_model import NotificationDigestModel
+from modules.notification.types import EmailTemplateType, NotificationDigest, SendEmailParams, SendSMSParams
+
+DEFAULT_SMS_DIGEST_TEMPLATE = "You have {notification_count} new notifications:\n{messages}"
+
+# Twilio rejects message bodies longer than 1600 characters
+MAX_SMS_BODY_LENGTH = 1600
+
+
+class NotificationDigestUtil:
+    @staticmethod
+    def is_digest_enabled() -> bool:
+        return ConfigService[bool].get_value(key="notification.digest.enabled", default=False)
+
+    @staticmethod
+    def get_email_template_id() -> str:
+        return EmailTransport.get_template_id(
+            default="",
+            sendgrid_template_id_key="notification.digest.email_template_id",
+            template_type=EmailTemplateType.NOTIFICATION_DIGEST,
+        )
+
+    @staticmethod
+    def is_email_digest_enabled() -> bool:
+        # Emails are only buffered when there is a template to render their digest with
+        return NotificationDigestUtil.is_digest_enabled() and bool(NotificationDigestUtil.get_email_template_id())
+
+    @staticmethod
+    def validate_email_template_id() -> None:
+        if NotificationDigestUtil.is_digest_enabled() and not NotificationDigestUtil.get_email_template_id():
+            Logger.warn(
+                message="No notification digest email template is configured for the mailer transport, "
+                "coalesced emails are sent one by one instead of being digested"
+            )
+
+    @staticmethod
+    def get_window() -> timedelta:
+        return timedelta(seconds=ConfigService[int].get_value(key="notification.digest.window_in_seconds", default=300))
+
+    @staticmethod
+    def get_lease() -> timedelta:
+        return timedelta(seconds=ConfigService[int].get_value(key="notification.digest.lease_in_seconds", default=120))
+
+    @staticmethod
+    def get_max_attempts() -> int:
+        return ConfigService[int].get_value(key="notification.digest.max_attempts", default=5)
+
+    @staticmethod
+    def get_max_items() -> int:
+        return ConfigService[int].get_value(key="notification.digest.max_items", default=50)
+
+    @staticmethod
+    def convert_digest_to_send_email_params(digest: NotificationDigest) -> SendEmailParams:
+        latest_params = NotificationOutboxUtil.convert_payload_to_send_email_params(digest.items[-1])
+        if digest.total_count == 1:
+            return latest_params
+
+        return SendEmailParams(
+            recipient=latest_params.recipient,
+            sender=latest_params.sender,
+            template_id=NotificationDigestUtil.get_email_template_id(),
+            template_data={
+                "notification_count": digest.total_count,
+                "notifications": [
+                    NotificationDigestUtil._convert_email_payload_to_digest_item(item) for item in digest.items
+                ],
+            },
+        )
+
+    @staticmethod
+    def convert_digest_to_send_sms_params(digest: NotificationDigest) -> SendSMSParams:
+        latest_params = NotificationOutboxUtil.convert_payload_to_send_sms_params(digest.items[-1])
+        if digest.total_count == 1:
+            return latest_params
+
+        sms_template = ConfigService[str].get_value(
+            key="notification.digest.sms_template", default=DEFAULT_SMS_DIGEST_TEMPLATE
+        )
+        message_body = sms_template.format(
+            notification_count=digest.total_count,
+            messages="\n".join(f"- {item['message_body']}" for item in digest.items),
+        )
+        if len(message_body) > MAX_SMS_BODY_LENGTH:
+            message_body = f"{message_body[:MAX_SMS_BODY_LENGTH - 3]}..."
+
+        return SendSMSParams(message_body=message_body, recipient_phone=latest_params.recipient_phone)
+
+    @staticmethod
+    def convert_notification_digest_bson_to_notification_digest(
+        notification_digest_bson: Dict[str, Any]
+    ) -> NotificationDigest:
+        validated_notification_digest_data = NotificationDigestModel.from_bson(notification_digest_bson)
+        return NotificationDigest(
+            account_id=validated_notification_digest_data.account_id,
+            attempts=validated_notification_digest_data.attempts,
+            channel=validated_notification_digest_data.channel,
+            claim_id=(
+                str(validated_notification_digest_data.claim_id)
+                if validated_notification_digest_data.claim_id is not None
+                else None
+            ),
+            id=str(validated_notification_digest_data.id),
+            items=validated_notification_digest_data.items,
+            total_count=validated_notification_digest_data.total_count,
+        )
+
+    @staticmethod
+    def _convert_email_payload_to_digest_item(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"template_data": payload.get("template_data") or {}, "template_id": payload["template_id"]}
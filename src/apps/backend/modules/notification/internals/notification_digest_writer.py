@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.types import NotificationDigest
+
+
+class NotificationDigestWriter:
+    @staticmethod
+    def buffer_notification(*, account_id: str, channel: str, payload: Dict[str, Any]) -> None:
+        try:
+            NotificationDigestWriter._append_to_digest(account_id=account_id, channel=channel, payload=payload)
+        except DuplicateKeyError:
+            # A concurrent notification opened the buffer first, this time the update matches it
+            NotificationDigestWriter._append_to_digest(account_id=account_id, channel=channel, payload=payload)
+
+    @staticmethod
+    def claim_due_digests(*, batch_size: int, lease: timedelta) -> List[NotificationDigest]:
+        now = datetime.now()
+        # Claimed digests move their window end to the lease expiry, one whose lease ran out is claimed again
+        due_filter = {"window_ends_at": {"$lte": now}}
+        due_digest_ids = [
+            notification_digest_bson["_id"]
+            for notification_digest_bson in NotificationDigestRepository.collection()
+            .find(due_filter, projection={"_id": True})
+            .sort("window_ends_at", 1)
+            .limit(batch_size)
+        ]
+
+        # The digest stays stored until it is delivered, a notification arriving mid-flush opens a new buffer
+        claimed_digests: List[NotificationDigest] = []
+        for digest_id in due_digest_ids:
+            notification_digest_bson = NotificationDigestRepository.collection().find_one_and_update(
+                {**due_filter, "_id": digest_id},
+                {
+                    "$inc": {"attempts": 1},
+                    "$set": {"claim_id": ObjectId(), "updated_at": now, "window_ends_at": now + lease},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if notification_digest_bson is not None:
+                claimed_digests.append(
+                    NotificationDigestUtil.convert_notification_digest_bson_to_notification_digest(
+                        notification_digest_bson
+                    )
+                )
+
+        return claimed_digests
+
+    @staticmethod
+    def delete_claimed_digest(*, digest_id: str, claim_id: Optional[str]) -> None:
+        NotificationDigestRepository.collection().delete_one(
+            {"_id": ObjectId(digest_id), "claim_id": ObjectId(claim_id) if claim_id is not None else None}
+        )
+
+    @staticmethod
+    def _append_to_digest(*, account_id: str, channel: str, payload: Dict[str, Any]) -> None:
+        now = datetime.now()
+        NotificationDigestRepository.collection().update_one(
+            {"account_id": account_id, "channel": channel, "claim_id": None},
+            {
+                "$push": {"items": {"$each": [payload], "$slice": -NotificationDigestUtil.get_max_items()}},
+                "$inc": {"total_count": 1},
+                "$set": {"updated_at": now},
+                "$setOnInsert": {"created_at": now, "window_ends_at": now + NotificationDigestUtil.get_window()},
+            },
+            upsert=True,
+        )
@@ -0,0 +1,99 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.config.config_service import ConfigService
+from modules.notification.types import NotificationHttpPoolStats
+
+
+class NotificationHttpTransport:
+    """
+    Keep-alive HTTP sessions shared by the notification providers. Every provider gets one pooled session per
+    process, so TLS handshakes are paid once per pooled connection instead of once per message.
+    """
+
+    _adapters: Dict[str, HTTPAdapter] = {}
+    _lock = threading.Lock()
+    _pid: Optional[int] = None
+    _sessions: Dict[str, requests.Session] = {}
+
+    @staticmethod
+    def get_session(*, provider: str) -> requests.Session:
+        NotificationHttpTransport._reset_after_fork()
+
+        session = NotificationHttpTransport._sessions.get(provider)
+        if session is not None:
+            return session
+
+        with NotificationHttpTransport._lock:
+            if provider not in NotificationHttpTransport._sessions:
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=NotificationHttpTransport._get_pool_max_size())
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                NotificationHttpTransport._adapters[provider] = adapter
+                NotificationHttpTransport._sessions[provider] = session
+
+            return NotificationHttpTransport._sessions[provider]
+
+    @staticmethod
+    def get_timeout(*, max_timeout_in_seconds: Optional[float] = None) -> Tuple[float, float]:
+        connect_timeout_in_seconds = ConfigService[float].get_value(
+            key="notification.http_transport.connect_timeout_in_seconds", default=3
+        )
+        read_timeout_in_seconds = ConfigService[float].get_value(
+            key="notification.http_transport.read_timeout_in_seconds", default=10
+        )
+        if max_timeout_in_seconds is None:
+            return connect_timeout_in_seconds, read_timeout_in_seconds
+
+        return min(connect_timeout_in_seconds, max_timeout_in_seconds), min(
+            read_timeout_in_seconds, max_timeout_in_seconds
+        )
+
+    @staticmethod
+    def get_pool_stats(*, provider: str) -> NotificationHttpPoolStats:
+        connections_created = 0
+        requests_sent = 0
+
+        adapter = NotificationHttpTransport._adapters.get(provider)
+        if adapter is not None:
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is not None:
+                    connections_created += pool.num_connections
+                    requests_sent += pool.num_requests
+
+        return NotificationHttpPoolStats(
+            connections_created=connections_created,
+            max_pool_size=NotificationHttpTransport._get_pool_max_size(),
+            provider=provider,
+            requests_sent=requests_sent,
+        )
+
+    @staticmethod
+    def raise_for_status(response: requests.Response) -> None:
+        if not response.ok:
+            raise requests.HTTPError(
+                f"{response.status_code} {response.reason} from {response.url}: {response.text}", response=response
+            )
+
+    @staticmethod
+    def _get_pool_max_size() -> int:
+        return ConfigService[int].get_value(key="notification.http_transport.pool_max_size", default=10)
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        # Sockets opened before gunicorn forks its workers must not be shared between processes
+        if NotificationHttpTransport._pid == os.getpid():
+            return
+
+        with NotificationHttpTransport._lock:
+            if NotificationHttpTransport._pid != os.getpid():
+                NotificationHttpTransport._adapters = {}
+                NotificationHttpTransport._sessions = {}
+                NotificationHttpTransport._pid = os.getpid()
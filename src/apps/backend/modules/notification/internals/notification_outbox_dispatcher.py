@@ -0,0 +1,45 @@
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.email_transport import EmailTransport
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import NotificationChannel, NotificationOutboxDeliveryResult, NotificationOutboxMessage
+
+
+class NotificationOutboxDispatcher:
+    @staticmethod
+    def dispatch_pending_notifications(*, batch_size: int) -> int:
+        messages = NotificationOutboxWriter.claim_pending_notifications(
+            batch_size=batch_size,
+            lease_in_seconds=ConfigService[int].get_value(key="notification.outbox.lease_in_seconds", default=120),
+        )
+
+        results = [NotificationOutboxDispatcher._deliver(message) for message in messages]
+        NotificationOutboxWriter.record_delivery_results(
+            results=results,
+            max_attempts=ConfigService[int].get_value(key="notification.outbox.max_attempts", default=5),
+        )
+
+        return len(messages)
+
+    @staticmethod
+    def _deliver(message: NotificationOutboxMessage) -> NotificationOutboxDeliveryResult:
+        try:
+            if message.channel == NotificationChannel.EMAIL:
+                EmailTransport.send_email(NotificationOutboxUtil.convert_payload_to_send_email_params(message.payload))
+            elif message.channel == NotificationChannel.BULK_EMAIL:
+                EmailTransport.send_bulk_email(
+                    NotificationOutboxUtil.convert_payload_to_send_bulk_email_params(message.payload)
+                )
+            elif message.channel == NotificationChannel.SMS:
+                TwilioService.send_sms(NotificationOutboxUtil.convert_payload_to_send_sms_params(message.payload))
+            else:
+                return NotificationOutboxDeliveryResult(
+                    message=message, error=f"Unsupported notification channel: {message.channel}"
+                )
+        except Exception as err:
+            Logger.error(message=f"Notification {message.id} ({message.channel}) delivery failed: {err}")
+            return NotificationOutboxDeliveryResult(message=message, error=str(err) or err.__class__.__name__)
+
+        return NotificationOutboxDeliveryResult(message=message)
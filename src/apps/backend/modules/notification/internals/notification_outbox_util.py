@@ -0,0 +1,89 @@
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Dict
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.types import (
+    BulkEmailRecipient,
+    EmailRecipient,
+    EmailSender,
+    NotificationOutboxMessage,
+    SendBulkEmailParams,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+
+class NotificationOutboxUtil:
+    @staticmethod
+    def is_outbox_enabled() -> bool:
+        return ConfigService[bool].get_value(key="notification.outbox.enabled", default=False)
+
+    @staticmethod
+    def get_retry_delay(*, attempts: int) -> timedelta:
+        retry_base_delay_in_seconds = ConfigService[int].get_value(
+            key="notification.outbox.retry_base_delay_in_seconds", default=30
+        )
+        return timedelta(seconds=retry_base_delay_in_seconds * 2 ** max(attempts - 1, 0))
+
+    @staticmethod
+    def convert_send_email_params_to_payload(params: SendEmailParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_email_params(payload: Dict[str, Any]) -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(**payload["recipient"]),
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+
+    @staticmethod
+    def convert_send_bulk_email_params_to_payload(params: SendBulkEmailParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_bulk_email_params(payload: Dict[str, Any]) -> SendBulkEmailParams:
+        return SendBulkEmailParams(
+            recipients=[
+                BulkEmailRecipient(
+                    account_id=bulk_recipient["account_id"],
+                    recipient=EmailRecipient(**bulk_recipient["recipient"]),
+                    template_data=bulk_recipient.get("template_data"),
+                )
+                for bulk_recipient in payload["recipients"]
+            ],
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+        )
+
+    @staticmethod
+    def convert_send_sms_params_to_payload(params: SendSMSParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_sms_params(payload: Dict[str, Any]) -> SendSMSParams:
+        return SendSMSParams(
+            message_body=payload["message_body"], recipient_phone=PhoneNumber(**payload["recipient_phone"])
+        )
+
+    @staticmethod
+    def convert_notification_outbox_bson_to_notification_outbox_message(
+        notification_outbox_bson: Dict[str, Any]
+    ) -> NotificationOutboxMessage:
+        validated_notification_outbox_data = NotificationOutboxModel.from_bson(notification_outbox_bson)
+        return NotificationOutboxMessage(
+            id=str(validated_notification_outbox_data.id),
+            account_id=validated_notification_outbox_data.account_id,
+            attempts=validated_notification_outbox_data.attempts,
+            channel=validated_notification_outbox_data.channel,
+            claim_id=(
+                str(validated_notification_outbox_data.claim_id)
+                if validated_notification_outbox_data.claim_id is not None
+                else None
+            ),
+            payload=validated_notification_outbox_data.payload,
+        )
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.types import (
+    NotificationOutboxDeliveryResult,
+    NotificationOutboxMessage,
+    NotificationOutboxStatus,
+)
+
+CLAIMABLE_STATUSES = [NotificationOutboxStatus.PENDING, NotificationOutboxStatus.PROCESSING]
+
+
+class NotificationOutboxWriter:
+    @staticmethod
+    def enqueue_notification(*, account_id: Optional[str], channel: str, payload: Dict[str, Any]) -> None:
+        notification_outbox_bson = NotificationOutboxModel(
+            account_id=account_id, channel=channel, id=None, payload=payload, status=NotificationOutboxStatus.PENDING
+        ).to_bson()
+        NotificationOutboxRepository.collection().insert_one(notification_outbox_bson)
+
+    @staticmethod
+    def claim_pending_notifications(*, batch_size: int, lease_in_seconds: int) -> List[NotificationOutboxMessage]:
+        now = datetime.now()
+        # PROCESSING messages whose lease ran out belong to a dispatcher that died mid-batch
+        claimable_filter = {"status": {"$in": CLAIMABLE_STATUSES}, "next_attempt_at": {"$lte": now}}
+
+        claimable_ids = [
+            notification_outbox_bson["_id"]
+            for notification_outbox_bson in NotificationOutboxRepository.collection()
+            .find(claimable_filter, projection={"_id": True})
+            .sort("next_attempt_at", 1)
+            .limit(batch_size)
+        ]
+        if not claimable_ids:
+            return []
+
+        claim_id = ObjectId()
+        NotificationOutboxRepository.collection().update_many(
+            {**claimable_filter, "_id": {"$in": claimable_ids}},
+            {
+                "$set": {
+                    "claim_id": claim_id,
+                    "next_attempt_at": now + timedelta(seconds=lease_in_seconds),
+                    "status": NotificationOutboxStatus.PROCESSING,
+                    "updated_at": now,
+                }
+            },
+        )
+
+        claimed_notifications = NotificationOutboxRepository.collection().find(
+            {"_id": {"$in": claimable_ids}, "claim_id": claim_id}
+        )
+        return [
+            NotificationOutboxUtil.convert_notification_outbox_bson_to_notification_outbox_message(
+                notification_outbox_bson
+            )
+            for notification_outbox_bson in claimed_notifications
+        ]
+
+    @staticmethod
+    def record_delivery_results(*, results: List[NotificationOutboxDeliveryResult], max_attempts: int) -> None:
+        if not results:
+            return
+
+        now = datetime.now()
+        operations = []
+        for result in results:
+            attempts = result.message.attempts + 1
+            update: Dict[str, Any] = {"attempts": attempts, "updated_at": now}
+
+            if result.error is None:
+                update.update({"sent_at": now, "status": NotificationOutboxStatus.SENT})
+            elif attempts >= max_attempts:
+                update.update({"last_error": result.error, "status": NotificationOutboxStatus.FAILED})
+            else:
+                update.update(
+                    {
+                        "last_error": result.error,
+                        "next_attempt_at": now + NotificationOutboxUtil.get_retry_delay(attempts=attempts),
+                        "status": NotificationOutboxStatus.PENDING,
+                    }
+                )
+
+            # A dispatcher that outlived its lease must not overwrite the outcome of the one that re-claimed the message
+            claim_id = ObjectId(result.message.claim_id) if result.message.claim_id is not None else None
+            operations.append(
+                UpdateOne(
+                    {"_id": ObjectId(result.message.id), "claim_id": claim_id},
+                    {"$set": update, "$unset": {"claim_id": ""}},
+                )
+            )
+
+        NotificationOutboxRepository.collection().bulk_write(operations, ordered=False)
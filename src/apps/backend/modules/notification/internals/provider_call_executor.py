@@ -0,0 +1,138 @@
+import random
+import smtplib
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+from twilio.base.exceptions import TwilioException, TwilioRestException
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.errors import ProviderUnavailableError, ServiceError
+from modules.notification.internals.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.types import NotificationProviderCallStats
+
+T = TypeVar("T")
+
+MIN_CALL_TIMEOUT_IN_SECONDS = 0.1
+
+
+class ProviderCallExecutor:
+    _circuit_breakers: Dict[str, ProviderCircuitBreaker] = {}
+    _lock = threading.Lock()
+    _retry_counts: Dict[str, int] = {}
+
+    @staticmethod
+    def execute(*, provider: str, call: Callable[[float], T]) -> T:
+        """
+        Runs `call` with retries inside the provider's circuit breaker. Every attempt is passed the seconds left in
+        the time budget, which the transport uses to cap its own timeout so a single slow attempt cannot overrun it.
+        """
+        circuit_breaker = ProviderCallExecutor._get_circuit_breaker(provider)
+        max_attempts = ConfigService.get_int(key="notification.retry.max_attempts", default=3)
+        deadline = time.monotonic() + ConfigService.get_float(
+            key="notification.retry.time_budget_in_seconds", default=5
+        )
+
+        attempt = 0
+        while True:
+            # Fail fast while the provider is known to be down instead of waiting for its timeout
+            if not circuit_breaker.allow_call():
+                raise ProviderUnavailableError(provider)
+
+            attempt += 1
+            # Floored so an attempt that starts right at the deadline still gets a usable socket timeout
+            timeout_in_seconds = max(deadline - time.monotonic(), MIN_CALL_TIMEOUT_IN_SECONDS)
+            try:
+                result = call(timeout_in_seconds)
+            except (TwilioException, requests.RequestException, smtplib.SMTPException, OSError) as err:
+                if not ProviderCallExecutor._is_retryable(err):
+                    # The provider answered, so it is healthy even though it rejected this request
+                    circuit_breaker.record_success()
+                    raise ServiceError(err)
+
+                circuit_breaker.record_failure()
+                delay = ProviderCallExecutor._get_retry_delay(attempt=attempt)
+                if attempt >= max_attempts or time.monotonic() + delay >= deadline:
+                    raise ServiceError(err)
+
+                Logger.warn(message=f"{provider} call failed ({err}), retrying in {delay:.2f} seconds")
+                ProviderCallExecutor._increment_retry_count(provider)
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # Anything else still has to settle the call, otherwise a half-open trial slot is never released
+                circuit_breaker.record_failure()
+                raise
+
+            circuit_breaker.record_success()
+            return result
+
+    @staticmethod
+    def get_call_stats(*, provider: str) -> NotificationProviderCallStats:
+        circuit_breaker = ProviderCallExecutor._get_circuit_breaker(provider)
+        return NotificationProviderCallStats(
+            circuit_state=circuit_breaker.state,
+            consecutive_failures=circuit_breaker.consecutive_failures,
+            opened_count=circuit_breaker.opened_count,
+            provider=provider,
+            rejected_count=circuit_breaker.rejected_count,
+            retry_count=ProviderCallExecutor._retry_counts.get(provider, 0),
+        )
+
+    @staticmethod
+    def _get_circuit_breaker(provider: str) -> ProviderCircuitBreaker:
+        circuit_breaker = ProviderCallExecutor._circuit_breakers.get(provider)
+        if circuit_breaker is not None:
+            return circuit_breaker
+
+        with ProviderCallExecutor._lock:
+            if provider not in ProviderCallExecutor._circuit_breakers:
+                ProviderCallExecutor._circuit_breakers[provider] = ProviderCircuitBreaker(
+                    provider=provider,
+                    failure_threshold=ConfigService.get_int(
+                        key="notification.circuit_breaker.failure_threshold", default=5
+                    ),
+                    half_open_max_calls=ConfigService.get_int(
+                        key="notification.circuit_breaker.half_open_max_calls", default=1
+                    ),
+                    reset_timeout_in_seconds=ConfigService.get_float(
+                        key="notification.circuit_breaker.reset_timeout_in_seconds", default=30
+                    ),
+                )
+
+            return ProviderCallExecutor._circuit_breakers[provider]
+
+    @staticmethod
+    def _get_retry_delay(*, attempt: int) -> float:
+        base_delay_in_seconds = ConfigService.get_float(key="notification.retry.base_delay_in_seconds", default=0.2)
+        max_delay_in_seconds = ConfigService.get_float(key="notification.retry.max_delay_in_seconds", default=2)
+        # Full jitter spreads the retries of concurrent callers instead of sending them in waves
+        return random.uniform(0, min(max_delay_in_seconds, base_delay_in_seconds * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _increment_retry_count(provider: str) -> None:
+        with ProviderCallExecutor._lock:
+            ProviderCallExecutor._retry_counts[provider] = ProviderCallExecutor._retry_counts.get(provider, 0) + 1
+
+    @staticmethod
+    def _is_retryable(err: Exception) -> bool:
+        status_code: Optional[int] = None
+        if isinstance(err, TwilioRestException):
+            status_code = err.status
+        elif isinstance(err, requests.HTTPError) and err.response is not None:
+            status_code = err.response.status_code
+        elif isinstance(err, requests.RequestException):
+            # Connection errors and timeouts never reached the provider
+            return True
+        elif isinstance(err, smtplib.SMTPResponseException):
+            # SMTP reply codes in the 4xx range are transient by definition, 5xx ones fail the same way again
+            return 400 <= err.smtp_code < 500
+        elif isinstance(err, (smtplib.SMTPRecipientsRefused, smtplib.SMTPNotSupportedError)):
+            return False
+        elif isinstance(err, OSError):
+            # Dropped SMTP sessions, refused connections and socket timeouts
+            return True
+
+        return status_code is not None and (status_code == 429 or status_code >= 500)
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from modules.logger.logger import Logger
+from modules.notification.types import CircuitBreakerState
+
+
+class ProviderCircuitBreaker:
+    """
+    Tracks consecutive failures of one provider. After `failure_threshold` failures the circuit opens and calls are
+    rejected until `reset_timeout_in_seconds` has passed, then a limited number of trial calls decide whether it
+    closes again.
+    """
+
+    def __init__(
+        self, *, provider: str, failure_threshold: int, reset_timeout_in_seconds: float, half_open_max_calls: int
+    ) -> None:
+        self.provider = provider
+        self._failure_threshold = failure_threshold
+        self._half_open_max_calls = half_open_max_calls
+        self._reset_timeout_in_seconds = reset_timeout_in_seconds
+        self._lock = threading.Lock()
+        self._state = CircuitBreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._half_open_calls = 0
+        self._opened_at = 0.0
+        self._opened_count = 0
+        self._rejected_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def opened_count(self) -> int:
+        return self._opened_count
+
+    @property
+    def rejected_count(self) -> int:
+        return self._rejected_count
+
+    def allow_call(self) -> bool:
+        with self._lock:
+            if self._state == CircuitBreakerState.OPEN:
+                if time.monotonic() - self._opened_at < self._reset_timeout_in_seconds:
+                    self._rejected_count += 1
+                    return False
+                self._transition_to(CircuitBreakerState.HALF_OPEN)
+
+            if self._state == CircuitBreakerState.HALF_OPEN:
+                if self._half_open_calls >= self._half_open_max_calls:
+                    self._rejected_count += 1
+                    return False
+                self._half_open_calls += 1
+
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != CircuitBreakerState.CLOSED:
+                self._transition_to(CircuitBreakerState.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitBreakerState.HALF_OPEN or (
+                self._state == CircuitBreakerState.CLOSED and self._consecutive_failures >= self._failure_threshold
+            ):
+                self._transition_to(CircuitBreakerState.OPEN)
+
+    def _transition_to(self, state: str) -> None:
+        previous_state = self._state
+        self._state = state
+        self._half_open_calls = 0
+
+        if state == CircuitBreakerState.OPEN:
+            self._opened_at = time.monotonic()
+            self._opened_count += 1
+            Logger.warn(
+                message=f"Circuit breaker for {self.provider} opened after {self._consecutive_failures} consecutive "
+                f"failure(s), rejecting calls for {self._reset_timeout_in_seconds} seconds"
+            )
+        else:
+            Logger.info(message=f"Circuit breaker for {self.provider} moved from {previous_state} to {state}")
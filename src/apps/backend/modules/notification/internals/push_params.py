@@ -0,0 +1,39 @@
+from dataclasses import fields
+from typing import List
+
+from modules.notification.errors import ValidationError
+from modules.notification.types import DevicePlatform, RegisterDeviceTokenParams, SendPushParams, ValidationFailure
+
+DEVICE_PLATFORMS = [getattr(DevicePlatform, platform_field.name) for platform_field in fields(DevicePlatform)]
+
+
+class PushParams:
+    @staticmethod
+    def validate(params: SendPushParams) -> None:
+        failures: List[ValidationFailure] = []
+
+        if not params.title:
+            failures.append(ValidationFailure(field="title", message="Please specify a non-empty push title."))
+
+        if not params.body:
+            failures.append(ValidationFailure(field="body", message="Please specify a non-empty push body."))
+
+        if failures:
+            raise ValidationError("Push notification cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def validate_device_token(params: RegisterDeviceTokenParams) -> None:
+        failures: List[ValidationFailure] = []
+
+        if not params.token:
+            failures.append(ValidationFailure(field="token", message="Please specify a non-empty device token."))
+
+        if params.platform not in DEVICE_PLATFORMS:
+            failures.append(
+                ValidationFailure(
+                    field="platform", message=f"Please specify a device platform, one of {', '.join(DEVICE_PLATFORMS)}."
+                )
+            )
+
+        if failures:
+            raise ValidationError("Device token cannot be registered, please check the params validity.", failures)
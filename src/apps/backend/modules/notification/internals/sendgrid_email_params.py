@@ -2,7 +2,13 @@ import re
 from typing import List
 
 from modules.notification.errors import ValidationError
-from modules.notification.types import SendEmailParams, ValidationFailure
+from modules.notification.types import (
+    CreateNotificationBroadcastParams,
+    EmailSender,
+    SendBulkEmailParams,
+    SendEmailParams,
+    ValidationFailure,
+)
 
 
 class EmailParams:
@@ -19,19 +25,55 @@ class EmailParams:
                 )
             )
 
-        if not EmailParams.is_email_valid(params.sender.email):
-            failures.append(
-                ValidationFailure(
-                    field="sender.email", message="Please specify valid sender email in format you@example.com."
+        failures.extend(EmailParams._validate_sender(params.sender))
+
+        if failures:
+            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def validate_bulk(params: SendBulkEmailParams) -> None:
+        failures: List[ValidationFailure] = []
+
+        for index, bulk_recipient in enumerate(params.recipients):
+            if not EmailParams.is_email_valid(bulk_recipient.recipient.email):
+                failures.append(
+                    ValidationFailure(
+                        field=f"recipients[{index}].recipient.email",
+                        message="Please specify valid recipient email in format you@example.com.",
+                    )
                 )
-            )
 
-        if not params.sender.name:
-            failures.append(ValidationFailure(field="sender.name", message="Please specify a non-empty sender name."))
+        failures.extend(EmailParams._validate_sender(params.sender))
 
         if failures:
-            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+            raise ValidationError("Emails cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def validate_broadcast(params: CreateNotificationBroadcastParams) -> None:
+        failures = EmailParams._validate_sender(params.sender)
+
+        if not params.template_id:
+            failures.append(ValidationFailure(field="template_id", message="Please specify a non-empty template id."))
+
+        if failures:
+            raise ValidationError("Broadcast cannot be created, please check the params validity.", failures)
 
     @staticmethod
     def is_email_valid(email: str) -> bool:
         return bool(re.match(EmailParams.email_regex, email.lower()))  # Use your email_regex
+
+    @staticmethod
+    def _validate_sender(sender: EmailSender) -> List[ValidationFailure]:
+        failures: List[ValidationFailure] = []
+
+        if not EmailParams.is_email_valid(sender.email):
+            failures.append(
+                ValidationFailure(
+                    field="sender.email", message="Please specify valid sender email in format you@example.com."
+                )
+            )
+
+        if not sender.name:
+            failures.append(ValidationFailure(field="sender.name", message="Please specify a non-empty sender name."))
+
+        return failures
@@ -1,16 +1,28 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
-from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
 from modules.notification.internals.sendgrid_email_params import EmailParams
-from modules.notification.types import SendEmailParams
+from modules.notification.types import (
+    BulkEmailFailure,
+    BulkEmailRecipient,
+    NotificationProvider,
+    SendBulkEmailParams,
+    SendEmailParams,
+)
+
+SENDGRID_MAIL_SEND_PATH = "/v3/mail/send"
+
+# SendGrid accepts at most 1000 personalizations in a single mail send request
+MAX_PERSONALIZATIONS_PER_REQUEST = 1000
 
 
 class SendGridService:
-    __client: Optional[sendgrid.SendGridAPIClient] = None
+    __headers: Optional[Dict[str, str]] = None
+    __mail_send_url: Optional[str] = None
 
     @staticmethod
     def send_email(params: SendEmailParams) -> None:
@@ -18,18 +30,68 @@ class SendGridService:
 
         message = Mail(from_email=From(params.sender.email, params.sender.name), to_emails=To(params.recipient.email))
         message.template_id = TemplateId(params.template_id)
-        message.dynamic_template_data = params.template_data
+        if params.template_data is not None:
+            message.dynamic_template_data = params.template_data
+
+        SendGridService._send_message(message)
+
+    @staticmethod
+    def send_bulk_email(params: SendBulkEmailParams) -> List[BulkEmailFailure]:
+        EmailParams.validate_bulk(params)
+
+        for start in range(0, len(params.recipients), MAX_PERSONALIZATIONS_PER_REQUEST):
+            recipients = params.recipients[start : start + MAX_PERSONALIZATIONS_PER_REQUEST]
+            SendGridService._send_message(SendGridService._build_bulk_message(params=params, recipients=recipients))
+
+        # SendGrid accepts or rejects a request as a whole, a rejection is raised instead of reported per recipient
+        return []
+
+    @staticmethod
+    def _build_bulk_message(*, params: SendBulkEmailParams, recipients: List[BulkEmailRecipient]) -> Mail:
+        message = Mail(from_email=From(params.sender.email, params.sender.name))
+        message.template_id = TemplateId(params.template_id)
+
+        # One personalization per recipient keeps addresses and template data private to each recipient
+        for bulk_recipient in recipients:
+            personalization = Personalization()
+            personalization.add_to(To(bulk_recipient.recipient.email))
+            if bulk_recipient.template_data is not None:
+                personalization.dynamic_template_data = bulk_recipient.template_data
+            message.add_personalization(personalization)
+
+        return message
 
-        try:
-            client = SendGridService.get_client()
-            client.send(message)
+    @staticmethod
+    def _send_message(message: Mail) -> None:
+        payload = message.get()
+        ProviderCallExecutor.execute(
+            provider=NotificationProvider.SENDGRID,
+            call=lambda timeout_in_seconds: SendGridService._post_message(
+                payload, timeout_in_seconds=timeout_in_seconds
+            ),
+        )
 
-        except sendgrid.SendGridException as err:
-            raise ServiceError(err)
+    @staticmethod
+    def _post_message(payload: Dict[str, Any], *, timeout_in_seconds: float) -> None:
+        # Posted through the pooled session, the SendGrid client opens a new connection for every request
+        response = NotificationHttpTransport.get_session(provider=NotificationProvider.SENDGRID).post(
+            SendGridService._get_mail_send_url(),
+            headers=SendGridService._get_headers(),
+            json=payload,
+            timeout=NotificationHttpTransport.get_timeout(max_timeout_in_seconds=timeout_in_seconds),
+        )
+        NotificationHttpTransport.raise_for_status(response)
 
     @staticmethod
-    def get_client() -> sendgrid.SendGridAPIClient:
-        if not SendGridService.__client:
+    def _get_headers() -> Dict[str, str]:
+        if not SendGridService.__headers:
             api_key = ConfigService[str].get_value(key="sendgrid.api_key")
-            SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
-        return SendGridService.__client
+            SendGridService.__headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        return SendGridService.__headers
+
+    @staticmethod
+    def _get_mail_send_url() -> str:
+        if not SendGridService.__mail_send_url:
+            base_url = ConfigService[str].get_value(key="sendgrid.base_url", default="https://api.sendgrid.com")
+            SendGridService.__mail_send_url = f"{base_url.rstrip('/')}{SENDGRID_MAIL_SEND_PATH}"
+        return SendGridService.__mail_send_url
@@ -0,0 +1,143 @@
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional, Tuple
+
+from modules.notification.errors import ServiceError
+from modules.notification.types import SmtpPoolStats
+
+
+class SmtpConnectionPool:
+    """
+    Bounded pool of authenticated SMTP connections. A connection is checked out for one message at a time and put
+    back afterwards, so the TCP, STARTTLS and AUTH round trips are paid once per connection instead of once per
+    message. Connections idle for longer than the server is likely to keep them, or that sent
+    `max_messages_per_connection` messages, are closed instead of reused.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        use_tls: bool,
+        timeout_in_seconds: float,
+        max_size: int,
+        max_idle_in_seconds: float,
+        max_messages_per_connection: int,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._use_tls = use_tls
+        self._timeout_in_seconds = timeout_in_seconds
+        self._max_size = max_size
+        self._max_idle_in_seconds = max_idle_in_seconds
+        self._max_messages_per_connection = max_messages_per_connection
+        # (connection, messages sent over it, monotonic time it was returned)
+        self._idle_connections: Deque[Tuple[smtplib.SMTP, int, float]] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._connections_created = 0
+        self._messages_sent = 0
+
+    @contextmanager
+    def connection(self, *, timeout_in_seconds: Optional[float] = None) -> Iterator[smtplib.SMTP]:
+        # A caller with less time left than the pool timeout gets a tighter one for this checkout only
+        if timeout_in_seconds is None or timeout_in_seconds > self._timeout_in_seconds:
+            timeout_in_seconds = self._timeout_in_seconds
+
+        # Every connection busy for the whole timeout means the server is too slow to keep up, waiting longer only
+        # ties up the caller's thread
+        if not self._slots.acquire(timeout=timeout_in_seconds):
+            raise ServiceError(
+                TimeoutError(f"No SMTP connection became available within {timeout_in_seconds:.2f} seconds")
+            )
+        try:
+            smtp_connection, message_count = self._checkout(timeout_in_seconds)
+            try:
+                yield smtp_connection
+            except BaseException:
+                # The session may be mid-transaction or already dropped by the server, it is not safe to reuse
+                self._close(smtp_connection)
+                raise
+
+            self._checkin(smtp_connection, message_count + 1)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle_connections = list(self._idle_connections)
+            self._idle_connections.clear()
+
+        for smtp_connection, _, _ in idle_connections:
+            self._close(smtp_connection)
+
+    def stats(self) -> SmtpPoolStats:
+        with self._lock:
+            return SmtpPoolStats(
+                connections_created=self._connections_created,
+                idle_connections=len(self._idle_connections),
+                max_pool_size=self._max_size,
+                messages_sent=self._messages_sent,
+            )
+
+    def _checkout(self, timeout_in_seconds: float) -> Tuple[smtplib.SMTP, int]:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle_connections:
+                    break
+                # Most recently used first, it is the least likely to have been timed out by the server
+                smtp_connection, message_count, returned_at = self._idle_connections.pop()
+
+            if now - returned_at < self._max_idle_in_seconds:
+                self._set_timeout(smtp_connection, timeout_in_seconds)
+                return smtp_connection, message_count
+            self._close(smtp_connection)
+
+        return self._open(timeout_in_seconds), 0
+
+    def _checkin(self, smtp_connection: smtplib.SMTP, message_count: int) -> None:
+        with self._lock:
+            self._messages_sent += 1
+            if message_count < self._max_messages_per_connection:
+                self._idle_connections.append((smtp_connection, message_count, time.monotonic()))
+                return
+
+        self._close(smtp_connection)
+
+    def _open(self, timeout_in_seconds: float) -> smtplib.SMTP:
+        smtp_connection = smtplib.SMTP(self._host, self._port, timeout=timeout_in_seconds)
+        try:
+            if self._use_tls:
+                smtp_connection.starttls(context=ssl.create_default_context())
+            if self._username and self._password:
+                smtp_connection.login(self._username, self._password)
+        except BaseException:
+            self._close(smtp_connection)
+            raise
+
+        with self._lock:
+            self._connections_created += 1
+        return smtp_connection
+
+    @staticmethod
+    def _set_timeout(smtp_connection: smtplib.SMTP, timeout_in_seconds: float) -> None:
+        smtp_connection.timeout = timeout_in_seconds
+        if smtp_connection.sock is not None:
+            smtp_connection.sock.settimeout(timeout_in_seconds)
+
+    @staticmethod
+    def _close(smtp_connection: smtplib.SMTP) -> None:
+        try:
+            smtp_connection.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp_connection.close()
@@ -0,0 +1,149 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import List, Optional
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.errors import ServiceError
+from modules.notification.internals.email_template_renderer import EmailTemplateRenderer
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.smtp_connection_pool import SmtpConnectionPool
+from modules.notification.types import (
+    BulkEmailFailure,
+    EmailSender,
+    NotificationProvider,
+    RenderedEmail,
+    SendBulkEmailParams,
+    SendEmailParams,
+    SmtpPoolStats,
+)
+
+
+class SmtpService:
+    _lock = threading.Lock()
+    _pid: Optional[int] = None
+    _pool: Optional[SmtpConnectionPool] = None
+
+    @staticmethod
+    def send_email(params: SendEmailParams) -> None:
+        EmailParams.validate(params)
+
+        message = SmtpService._build_message(
+            recipient_email=params.recipient.email,
+            rendered_email=EmailTemplateRenderer.render(
+                template_id=params.template_id, template_data=params.template_data
+            ),
+            sender=params.sender,
+        )
+        SmtpService._send_message(message)
+
+    @staticmethod
+    def send_bulk_email(params: SendBulkEmailParams) -> List[BulkEmailFailure]:
+        EmailParams.validate_bulk(params)
+
+        messages = [
+            SmtpService._build_message(
+                recipient_email=bulk_recipient.recipient.email,
+                rendered_email=EmailTemplateRenderer.render(
+                    template_id=params.template_id, template_data=bulk_recipient.template_data
+                ),
+                sender=params.sender,
+            )
+            for bulk_recipient in params.recipients
+        ]
+        if not messages:
+            return []
+
+        # Every pooled connection sends in parallel, more workers than connections would only wait for a slot
+        with ThreadPoolExecutor(max_workers=min(SmtpService._get_pool_max_size(), len(messages))) as executor:
+            errors = list(executor.map(SmtpService._try_send_message, messages))
+
+        failures = [
+            BulkEmailFailure(
+                account_id=bulk_recipient.account_id, email=bulk_recipient.recipient.email, error=error.message
+            )
+            for bulk_recipient, error in zip(params.recipients, errors)
+            if error is not None
+        ]
+        # Raising after a partial success would make the outbox send the delivered messages again
+        if failures and len(failures) == len(messages):
+            raise next(error for error in errors if error is not None)
+
+        for failure in failures:
+            Logger.error(
+                message=f"Bulk email using template {params.template_id} to {failure.email} "
+                f"(account {failure.account_id}) failed: {failure.error}"
+            )
+        return failures
+
+    @staticmethod
+    def get_pool_stats() -> SmtpPoolStats:
+        return SmtpService._get_pool().stats()
+
+    @staticmethod
+    def _build_message(*, recipient_email: str, rendered_email: RenderedEmail, sender: EmailSender) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = formataddr((sender.name, sender.email))
+        message["To"] = recipient_email
+        message["Subject"] = rendered_email.subject
+
+        if rendered_email.text_body is not None:
+            message.set_content(rendered_email.text_body)
+            message.add_alternative(rendered_email.html_body, subtype="html")
+        else:
+            message.set_content(rendered_email.html_body, subtype="html")
+
+        return message
+
+    @staticmethod
+    def _try_send_message(message: EmailMessage) -> Optional[ServiceError]:
+        try:
+            SmtpService._send_message(message)
+        except ServiceError as err:
+            return err
+        return None
+
+    @staticmethod
+    def _send_message(message: EmailMessage) -> None:
+        ProviderCallExecutor.execute(
+            provider=NotificationProvider.SMTP,
+            call=lambda timeout_in_seconds: SmtpService._deliver(message, timeout_in_seconds=timeout_in_seconds),
+        )
+
+    @staticmethod
+    def _deliver(message: EmailMessage, *, timeout_in_seconds: float) -> None:
+        with SmtpService._get_pool().connection(timeout_in_seconds=timeout_in_seconds) as smtp_connection:
+            smtp_connection.send_message(message)
+
+    @staticmethod
+    def _get_pool() -> SmtpConnectionPool:
+        # Sockets opened before gunicorn forks its workers must not be shared between processes
+        if SmtpService._pool is not None and SmtpService._pid == os.getpid():
+            return SmtpService._pool
+
+        with SmtpService._lock:
+            if SmtpService._pool is None or SmtpService._pid != os.getpid():
+                SmtpService._pool = SmtpConnectionPool(
+                    host=ConfigService[str].get_value(key="smtp.host"),
+                    port=ConfigService[int].get_value(key="smtp.port", default=587),
+                    username=ConfigService[str].get_value(key="smtp.username", default=""),
+                    password=ConfigService[str].get_value(key="smtp.password", default=""),
+                    use_tls=ConfigService[bool].get_value(key="smtp.use_tls", default=True),
+                    timeout_in_seconds=ConfigService[float].get_value(key="smtp.timeout_in_seconds", default=10),
+                    max_size=SmtpService._get_pool_max_size(),
+                    max_idle_in_seconds=ConfigService[float].get_value(key="smtp.max_idle_in_seconds", default=60),
+                    max_messages_per_connection=ConfigService[int].get_value(
+                        key="smtp.max_messages_per_connection", default=100
+                    ),
+                )
+                SmtpService._pid = os.getpid()
+
+            return SmtpService._pool
+
+    @staticmethod
+    def _get_pool_max_size() -> int:
+        return ConfigService[int].get_value(key="smtp.pool_max_size", default=5)
@@ -0,0 +1,8 @@
+from modules.application.repository import ApplicationRepository
+
+EMBEDDED_NOTIFICATION_PREFERENCES_FIELD = "notification_preferences"
+
+
+class AccountEmbeddedNotificationPreferencesRepository(ApplicationRepository):
+    # Preferences are stored as a subdocument of the account, the account module owns indexes and validation
+    collection_name = "accounts"
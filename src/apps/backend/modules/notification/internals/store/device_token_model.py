@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class DeviceTokenModel(BaseModel):
+    account_id: str
+    id: Optional[ObjectId | str]
+    platform: str
+    token: str
+
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "DeviceTokenModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            id=bson_data.get("_id"),
+            platform=bson_data.get("platform", ""),
+            token=bson_data.get("token", ""),
+            created_at=bson_data.get("created_at", datetime.now()),
+            updated_at=bson_data.get("updated_at", datetime.now()),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "device_tokens"
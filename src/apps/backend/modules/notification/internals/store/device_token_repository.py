@@ -0,0 +1,15 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.notification.internals.store.device_token_model import DeviceTokenModel
+
+
+class DeviceTokenRepository(ApplicationRepository):
+    collection_name = DeviceTokenModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # A token identifies one app install, re-registering it from another account moves it
+        collection.create_index("token", unique=True, name="token_unique")
+        collection.create_index("account_id", name="account_id_index")
+        return True
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationBroadcastModel(BaseModel):
+    id: Optional[ObjectId | str]
+    segment: Dict[str, Any]
+    sender: Dict[str, Any]
+    status: str
+    template_id: str
+
+    template_data: Optional[Dict[str, Any]] = None
+    attempts: int = 0
+    # Set by every claim, progress from a worker whose lease was taken over no longer matches it
+    claim_id: Optional[ObjectId] = None
+    # Accounts are processed in _id order, so the last processed _id is the checkpoint a retried worker resumes from
+    last_account_id: Optional[str] = None
+    last_error: Optional[str] = None
+    processed_count: int = 0
+    sent_count: int = 0
+    skipped_count: int = 0
+    completed_at: Optional[datetime] = None
+    # A running broadcast renews its lease after every chunk, an expired lease means its worker died mid-segment
+    lease_expires_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationBroadcastModel":
+        return cls(
+            attempts=bson_data.get("attempts", 0),
+            claim_id=bson_data.get("claim_id"),
+            completed_at=bson_data.get("completed_at"),
+            id=bson_data.get("_id"),
+            lease_expires_at=bson_data.get("lease_expires_at", datetime.now()),
+            last_account_id=bson_data.get("last_account_id"),
+            last_error=bson_data.get("last_error"),
+            processed_count=bson_data.get("processed_count", 0),
+            segment=bson_data.get("segment", {}),
+            sender=bson_data.get("sender", {}),
+            sent_count=bson_data.get("sent_count", 0),
+            skipped_count=bson_data.get("skipped_count", 0),
+            status=bson_data.get("status", ""),
+            template_data=bson_data.get("template_data"),
+            template_id=bson_data.get("template_id", ""),
+            created_at=bson_data.get("created_at", datetime.now()),
+            updated_at=bson_data.get("updated_at", datetime.now()),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_broadcasts"
@@ -0,0 +1,16 @@
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.notification.internals.store.notification_broadcast_model import NotificationBroadcastModel
+
+
+class NotificationBroadcastRepository(ApplicationRepository):
+    collection_name = NotificationBroadcastModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index(
+            [("status", ASCENDING), ("lease_expires_at", ASCENDING)], name="status_lease_expires_at_index"
+        )
+        return True
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationDigestModel(BaseModel):
+    account_id: str
+    channel: str
+    id: Optional[ObjectId | str]
+    window_ends_at: datetime
+
+    # Only the latest items are kept, total_count still counts every buffered notification
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    total_count: int = 0
+    attempts: int = 0
+    # Set while a flush delivers the digest, notifications arriving meanwhile open a new buffer
+    claim_id: Optional[ObjectId] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationDigestModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            attempts=bson_data.get("attempts", 0),
+            channel=bson_data.get("channel", ""),
+            claim_id=bson_data.get("claim_id"),
+            id=bson_data.get("_id"),
+            items=bson_data.get("items", []),
+            total_count=bson_data.get("total_count", 0),
+            window_ends_at=bson_data.get("window_ends_at", datetime.now()),
+            created_at=bson_data.get("created_at", datetime.now()),
+            updated_at=bson_data.get("updated_at", datetime.now()),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_digests"
@@ -0,0 +1,21 @@
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.notification.internals.store.notification_digest_model import NotificationDigestModel
+
+
+class NotificationDigestRepository(ApplicationRepository):
+    collection_name = NotificationDigestModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # One open buffer (claim_id null) per account and channel, concurrent notifications append to the same document
+        collection.create_index(
+            [("account_id", ASCENDING), ("channel", ASCENDING), ("claim_id", ASCENDING)],
+            unique=True,
+            name="account_id_channel_claim_id_unique",
+        )
+        # The flush scan only reads buffers whose window has closed
+        collection.create_index("window_ends_at", name="window_ends_at_index")
+        return True
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationOutboxModel(BaseModel):
+    # Bulk emails address many accounts and are queued without one
+    account_id: Optional[str]
+    channel: str
+    id: Optional[ObjectId | str]
+    payload: Dict[str, Any]
+    status: str
+
+    attempts: int = 0
+    claim_id: Optional[ObjectId] = None
+    last_error: Optional[str] = None
+    sent_at: Optional[datetime] = None
+    next_attempt_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationOutboxModel":
+        return cls(
+            account_id=bson_data.get("account_id"),
+            attempts=bson_data.get("attempts", 0),
+            channel=bson_data.get("channel", ""),
+            claim_id=bson_data.get("claim_id"),
+            id=bson_data.get("_id"),
+            last_error=bson_data.get("last_error"),
+            next_attempt_at=bson_data.get("next_attempt_at", datetime.now()),
+            payload=bson_data.get("payload", {}),
+            sent_at=bson_data.get("sent_at"),
+            status=bson_data.get("status", ""),
+            created_at=bson_data.get("created_at", datetime.now()),
+            updated_at=bson_data.get("updated_at", datetime.now()),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_outbox"
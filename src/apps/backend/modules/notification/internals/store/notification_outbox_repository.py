@@ -0,0 +1,22 @@
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+
+SENT_NOTIFICATION_RETENTION_IN_SECONDS = 7 * 24 * 60 * 60
+
+
+class NotificationOutboxRepository(ApplicationRepository):
+    collection_name = NotificationOutboxModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index(
+            [("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_at_index"
+        )
+        # Only delivered messages have sent_at, so failed ones stay around for inspection
+        collection.create_index(
+            "sent_at", expireAfterSeconds=SENT_NOTIFICATION_RETENTION_IN_SECONDS, name="sent_at_ttl"
+        )
+        return True
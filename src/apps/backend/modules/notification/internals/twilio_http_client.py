@@ -0,0 +1,51 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response
+
+
+class TimeoutCappedTwilioHttpClient(TwilioHttpClient):
+    """
+    Twilio HTTP client whose timeout can be lowered for the requests made on the current thread. The Twilio
+    resources do not take a per-request timeout, and the client is shared, so the cap is kept thread-local.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+
+    @contextmanager
+    def timeout_cap(self, timeout_in_seconds: float) -> Iterator[None]:
+        self._local.timeout_in_seconds = timeout_in_seconds
+        try:
+            yield
+        finally:
+            self._local.timeout_in_seconds = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, object]] = None,
+        data: Optional[Dict[str, object]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = False,
+    ) -> Response:
+        timeout_in_seconds: Optional[float] = getattr(self._local, "timeout_in_seconds", None)
+        if timeout is None and timeout_in_seconds is not None:
+            timeout = timeout_in_seconds
+
+        return super().request(
+            method,
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+        )
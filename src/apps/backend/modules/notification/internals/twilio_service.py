@@ -1,33 +1,32 @@
-from typing import Optional
+from typing import Optional, cast
 
-from twilio.base.exceptions import TwilioException
 from twilio.rest import Client
 
 from modules.config.config_service import ConfigService
-from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.twilio_http_client import TimeoutCappedTwilioHttpClient
 from modules.notification.internals.twilio_params import SMSParams
-from modules.notification.types import SendSMSParams
+from modules.notification.types import NotificationProvider, SendSMSParams
 
 
 class TwilioService:
     __client: Optional[Client] = None
+    __messaging_service_sid: Optional[str] = None
 
     @staticmethod
     def send_sms(params: SendSMSParams) -> None:
         SMSParams.validate(params)
 
-        try:
-            client = TwilioService.get_client()
+        client = TwilioService.get_client()
 
-            # Send SMS
-            client.messages.create(
-                to=params.recipient_phone,
-                messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
-                body=params.message_body,
-            )
-
-        except TwilioException as err:
-            raise ServiceError(err)
+        # Send SMS
+        ProviderCallExecutor.execute(
+            provider=NotificationProvider.TWILIO,
+            call=lambda timeout_in_seconds: TwilioService._create_message(
+                client=client, params=params, timeout_in_seconds=timeout_in_seconds
+            ),
+        )
 
     @staticmethod
     def get_client() -> Client:
@@ -36,6 +35,36 @@ class TwilioService:
             auth_token = ConfigService[str].get_value(key="twilio.auth_token")
 
             # Initialize the Twilio client
-            TwilioService.__client = Client(account_sid, auth_token)
+            http_client = TimeoutCappedTwilioHttpClient()
+            # Twilio only validates a single float, requests also takes the (connect, read) pair
+            http_client.timeout = NotificationHttpTransport.get_timeout()
+            client = Client(account_sid, auth_token, http_client=http_client)
+            # Set before publishing the client, concurrent senders must never see the default base URL
+            client.api.base_url = (
+                ConfigService[str].get_value(key="twilio.base_url", default="https://api.twilio.com").rstrip("/")
+            )
+            TwilioService.__client = client
 
+        # Re-attached on every call so a forked worker never sends over the parent's sockets
+        TwilioService.__client.http_client.session = NotificationHttpTransport.get_session(
+            provider=NotificationProvider.TWILIO
+        )
         return TwilioService.__client
+
+    @staticmethod
+    def _create_message(*, client: Client, params: SendSMSParams, timeout_in_seconds: float) -> None:
+        http_client = cast(TimeoutCappedTwilioHttpClient, client.http_client)
+        # Twilio takes a single timeout for connect and read, so both are held to the tighter of the two bounds
+        _, read_timeout_in_seconds = NotificationHttpTransport.get_timeout(max_timeout_in_seconds=timeout_in_seconds)
+        with http_client.timeout_cap(read_timeout_in_seconds):
+            client.messages.create(
+                to=params.recipient_phone,
+                messaging_service_sid=TwilioService.get_messaging_service_sid(),
+                body=params.message_body,
+            )
+
+    @staticmethod
+    def get_messaging_service_sid() -> str:
+        if not TwilioService.__messaging_service_sid:
+            TwilioService.__messaging_service_sid = ConfigService[str].get_value(key="twilio.messaging_service_sid")
+        return TwilioService.__messaging_service_sid
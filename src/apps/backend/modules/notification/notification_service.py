@@ -1,29 +1,108 @@
+from typing import List, Optional
+
+from modules.application.common.types import CacheStats
 from modules.notification.email_service import EmailService
+from modules.notification.push_service import PushService
 from modules.notification.sms_service import SMSService
 from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.device_token_writer import DeviceTokenWriter
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.notification_broadcast_dispatcher import NotificationBroadcastDispatcher
+from modules.notification.internals.notification_broadcast_util import NotificationBroadcastUtil
+from modules.notification.internals.notification_broadcast_reader import NotificationBroadcastReader
+from modules.notification.internals.notification_broadcast_writer import NotificationBroadcastWriter
+from modules.notification.internals.notification_digest_dispatcher import NotificationDigestDispatcher
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.notification_outbox_dispatcher import NotificationOutboxDispatcher
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.smtp_service import SmtpService
 from modules.notification.types import (
+    SendBulkEmailParams,
     SendEmailParams,
+    SendPushParams,
     SendSMSParams,
     CreateOrUpdateAccountNotificationPreferencesParams,
     AccountNotificationPreferences,
+    NotificationHttpPoolStats,
+    NotificationProvider,
+    NotificationProviderCallStats,
+    CreateNotificationBroadcastParams,
+    NotificationBroadcast,
+    DeviceToken,
+    PushDeliveryResult,
+    RegisterDeviceTokenParams,
+    SmtpPoolStats,
 )
 
 
 class NotificationService:
 
     @staticmethod
-    def send_email_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendEmailParams) -> None:
+    def send_email_for_account(
+        *, account_id: str, bypass_preferences: bool = False, coalesce: bool = False, params: SendEmailParams
+    ) -> None:
         return EmailService.send_email_for_account(
-            account_id=account_id, bypass_preferences=bypass_preferences, params=params
+            account_id=account_id, bypass_preferences=bypass_preferences, coalesce=coalesce, params=params
         )
 
     @staticmethod
-    def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
+    def send_bulk_email(*, bypass_preferences: bool = False, params: SendBulkEmailParams) -> int:
+        return EmailService.send_bulk_email(bypass_preferences=bypass_preferences, params=params)
+
+    @staticmethod
+    def create_notification_broadcast(*, params: CreateNotificationBroadcastParams) -> NotificationBroadcast:
+        return NotificationBroadcastWriter.create_notification_broadcast(params)
+
+    @staticmethod
+    def get_notification_broadcast(*, broadcast_id: str) -> NotificationBroadcast:
+        return NotificationBroadcastReader.get_notification_broadcast_by_id(broadcast_id)
+
+    @staticmethod
+    def is_notification_broadcast_enabled() -> bool:
+        return NotificationBroadcastUtil.is_broadcast_enabled()
+
+    @staticmethod
+    def run_next_notification_broadcast() -> Optional[NotificationBroadcast]:
+        return NotificationBroadcastDispatcher.run_next_notification_broadcast()
+
+    @staticmethod
+    def send_sms_for_account(
+        *, account_id: str, bypass_preferences: bool = False, coalesce: bool = False, params: SendSMSParams
+    ) -> None:
         return SMSService.send_sms_for_account(
+            account_id=account_id, bypass_preferences=bypass_preferences, coalesce=coalesce, params=params
+        )
+
+    @staticmethod
+    def send_push_for_account(
+        *, account_id: str, bypass_preferences: bool = False, params: SendPushParams
+    ) -> PushDeliveryResult:
+        return PushService.send_push_for_account(
             account_id=account_id, bypass_preferences=bypass_preferences, params=params
         )
 
+    @staticmethod
+    def send_push_for_accounts(
+        *, account_ids: List[str], bypass_preferences: bool = False, params: SendPushParams
+    ) -> PushDeliveryResult:
+        return PushService.send_push_for_accounts(
+            account_ids=account_ids, bypass_preferences=bypass_preferences, params=params
+        )
+
+    @staticmethod
+    def register_device_token(*, account_id: str, params: RegisterDeviceTokenParams) -> DeviceToken:
+        return DeviceTokenWriter.register_device_token(account_id=account_id, params=params)
+
+    @staticmethod
+    def remove_device_token(*, account_id: str, token: str) -> None:
+        return DeviceTokenWriter.remove_device_token(account_id=account_id, token=token)
+
+    @staticmethod
+    def remove_device_tokens_by_account_id(*, account_id: str) -> int:
+        return DeviceTokenWriter.remove_device_tokens_by_account_id(account_id=account_id)
+
     @staticmethod
     def create_or_update_account_notification_preferences(
         *, account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
@@ -35,3 +114,60 @@ class NotificationService:
     @staticmethod
     def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
         return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
+
+    @staticmethod
+    def warm_account_notification_preferences_cache(*, account_ids: List[str]) -> int:
+        return AccountNotificationPreferenceReader.warm_account_notification_preferences_cache(account_ids)
+
+    @staticmethod
+    def get_account_notification_preferences_cache_stats() -> CacheStats:
+        return AccountNotificationPreferenceReader.get_account_notification_preferences_cache_stats()
+
+    @staticmethod
+    def embed_account_notification_preferences_in_accounts(*, batch_size: int = 500) -> int:
+        return AccountNotificationPreferenceWriter.embed_account_notification_preferences_in_accounts(
+            batch_size=batch_size
+        )
+
+    @staticmethod
+    def is_notification_outbox_enabled() -> bool:
+        return NotificationOutboxUtil.is_outbox_enabled()
+
+    @staticmethod
+    def dispatch_pending_notifications(*, batch_size: int) -> int:
+        return NotificationOutboxDispatcher.dispatch_pending_notifications(batch_size=batch_size)
+
+    @staticmethod
+    def validate_digest_config() -> None:
+        NotificationDigestUtil.validate_email_template_id()
+
+    @staticmethod
+    def is_notification_digest_enabled() -> bool:
+        return NotificationDigestUtil.is_digest_enabled()
+
+    @staticmethod
+    def flush_notification_digests(*, batch_size: int) -> int:
+        return NotificationDigestDispatcher.flush_due_digests(batch_size=batch_size)
+
+    @staticmethod
+    def get_notification_http_pool_stats() -> List[NotificationHttpPoolStats]:
+        return [
+            NotificationHttpTransport.get_pool_stats(provider=provider)
+            for provider in (NotificationProvider.PUSH, NotificationProvider.SENDGRID, NotificationProvider.TWILIO)
+        ]
+
+    @staticmethod
+    def get_notification_provider_call_stats() -> List[NotificationProviderCallStats]:
+        return [
+            ProviderCallExecutor.get_call_stats(provider=provider)
+            for provider in (
+                NotificationProvider.PUSH,
+                NotificationProvider.SENDGRID,
+                NotificationProvider.SMTP,
+                NotificationProvider.TWILIO,
+            )
+        ]
+
+    @staticmethod
+    def get_smtp_pool_stats() -> SmtpPoolStats:
+        return SmtpService.get_pool_stats()
@@ -0,0 +1,65 @@
+from typing import List
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.device_token_reader import DeviceTokenReader
+from modules.notification.internals.device_token_writer import DeviceTokenWriter
+from modules.notification.internals.fcm_service import FcmService
+from modules.notification.internals.push_params import PushParams
+from modules.notification.types import PushDeliveryResult, PushDeliveryStatus, SendPushParams
+
+
+class PushService:
+    @staticmethod
+    def send_push_for_account(
+        *, account_id: str, bypass_preferences: bool = False, params: SendPushParams
+    ) -> PushDeliveryResult:
+        return PushService.send_push_for_accounts(
+            account_ids=[account_id], bypass_preferences=bypass_preferences, params=params
+        )
+
+    @staticmethod
+    def send_push_for_accounts(
+        *, account_ids: List[str], bypass_preferences: bool = False, params: SendPushParams
+    ) -> PushDeliveryResult:
+        is_push_enabled = ConfigService[bool].get_value(key="push.enabled", default=False)
+        if not is_push_enabled:
+            Logger.warn(message=f"Push is disabled. Could not send push notification - {params.title}")
+            return PushDeliveryResult(failed_count=0, pruned_count=0, sent_count=0)
+
+        PushParams.validate(params)
+
+        if not bypass_preferences:
+            preferences_by_account_id = (
+                AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(account_ids)
+            )
+            enabled_account_ids = [
+                account_id
+                for account_id in account_ids
+                if account_id in preferences_by_account_id and preferences_by_account_id[account_id].push_enabled
+            ]
+            skipped_count = len(account_ids) - len(enabled_account_ids)
+            if skipped_count:
+                Logger.info(
+                    message=f"Push notification skipped for {skipped_count} accounts: "
+                    f"disabled by user preferences or preferences not found"
+                )
+            account_ids = enabled_account_ids
+
+        # One query for all devices of all accounts, then one concurrent fan-out over every token
+        tokens = [
+            device_token.token for device_token in DeviceTokenReader.get_device_tokens_by_account_ids(account_ids)
+        ]
+        statuses = FcmService.send_push_batch(tokens=tokens, params=params)
+
+        invalid_tokens = [token for token, status in statuses.items() if status == PushDeliveryStatus.INVALID_TOKEN]
+        pruned_count = DeviceTokenWriter.prune_device_tokens(tokens=invalid_tokens)
+        if pruned_count:
+            Logger.info(message=f"Pruned {pruned_count} device tokens reported invalid by the push provider")
+
+        return PushDeliveryResult(
+            failed_count=sum(1 for status in statuses.values() if status == PushDeliveryStatus.FAILED),
+            pruned_count=pruned_count,
+            sent_count=sum(1 for status in statuses.values() if status == PushDeliveryStatus.SENT),
+        )
@@ -2,13 +2,20 @@ from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.notification.internals.twilio_service import TwilioService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendSMSParams
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.notification_digest_writer import NotificationDigestWriter
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.twilio_params import SMSParams
+from modules.notification.types import NotificationChannel, SendSMSParams
 
 
 class SMSService:
     @staticmethod
-    def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
-        is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
+    def send_sms_for_account(
+        *, account_id: str, bypass_preferences: bool = False, coalesce: bool = False, params: SendSMSParams
+    ) -> None:
+        is_sms_enabled = ConfigService.get_bool(key="sms.enabled")
         if not is_sms_enabled:
             Logger.warn(message=f"SMS is disabled. Could not send message - {params.message_body}")
             return
@@ -24,4 +31,24 @@ class SMSService:
                 )
                 return
 
+        if coalesce and NotificationDigestUtil.is_digest_enabled():
+            # Buffered until the account's window closes, then sent together with its siblings as one digest
+            SMSParams.validate(params)
+            NotificationDigestWriter.buffer_notification(
+                account_id=account_id,
+                channel=NotificationChannel.SMS,
+                payload=NotificationOutboxUtil.convert_send_sms_params_to_payload(params),
+            )
+            return
+
+        if NotificationOutboxUtil.is_outbox_enabled():
+            # Validate before queueing so invalid params still fail the request instead of the dispatcher
+            SMSParams.validate(params)
+            NotificationOutboxWriter.enqueue_notification(
+                account_id=account_id,
+                channel=NotificationChannel.SMS,
+                payload=NotificationOutboxUtil.convert_send_sms_params_to_payload(params),
+            )
+            return
+
         TwilioService.send_sms(params=params)
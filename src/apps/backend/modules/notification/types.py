@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from modules.account.types import PhoneNumber
+from modules.account.types import AccountSegment, PhoneNumber
 
 
 @dataclass(frozen=True)
@@ -22,6 +22,12 @@ class CreateOrUpdateAccountNotificationPreferencesParams:
     sms_enabled: Optional[bool] = None
 
 
+@dataclass(frozen=True)
+class AccountNotificationPreferencesStorage:
+    COLLECTION: str = "collection"
+    EMBEDDED: str = "embedded"
+
+
 @dataclass(frozen=True)
 class AccountNotificationPreferences:
     account_id: str
@@ -38,17 +44,214 @@ class SendEmailParams:
     template_data: Dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class BulkEmailRecipient:
+    account_id: str
+    recipient: EmailRecipient
+    template_data: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class BulkEmailFailure:
+    account_id: str
+    email: str
+    error: str
+
+
+@dataclass(frozen=True)
+class SendBulkEmailParams:
+    recipients: List[BulkEmailRecipient]
+    sender: EmailSender
+    template_id: str
+
+
+@dataclass(frozen=True)
+class SendPushParams:
+    body: str
+    title: str
+    data: Dict[str, str] | None = None
+
+
 @dataclass(frozen=True)
 class SendSMSParams:
     message_body: str
     recipient_phone: PhoneNumber
 
 
+@dataclass(frozen=True)
+class NotificationChannel:
+    BULK_EMAIL: str = "bulk_email"
+    EMAIL: str = "email"
+    SMS: str = "sms"
+
+
+@dataclass(frozen=True)
+class NotificationOutboxStatus:
+    FAILED: str = "FAILED"
+    PENDING: str = "PENDING"
+    PROCESSING: str = "PROCESSING"
+    SENT: str = "SENT"
+
+
+@dataclass(frozen=True)
+class NotificationOutboxMessage:
+    id: str
+    account_id: Optional[str]
+    attempts: int
+    channel: str
+    payload: Dict[str, Any]
+    # Set while a dispatcher holds the message, results from a claim that lost its lease are not recorded
+    claim_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class NotificationOutboxDeliveryResult:
+    message: NotificationOutboxMessage
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class NotificationDigest:
+    account_id: str
+    channel: str
+    id: str
+    items: List[Dict[str, Any]]
+    total_count: int
+    # Both set by the claim, the claim_id guards the delete after delivery against a dispatcher that lost its lease
+    attempts: int = 0
+    claim_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CreateNotificationBroadcastParams:
+    segment: AccountSegment
+    sender: EmailSender
+    template_id: str
+    template_data: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class NotificationBroadcastStatus:
+    COMPLETED: str = "COMPLETED"
+    FAILED: str = "FAILED"
+    PENDING: str = "PENDING"
+    RUNNING: str = "RUNNING"
+
+
+@dataclass(frozen=True)
+class NotificationBroadcast:
+    attempts: int
+    id: str
+    last_account_id: Optional[str]
+    last_error: Optional[str]
+    processed_count: int
+    sent_count: int
+    skipped_count: int
+    status: str
+
+
+@dataclass(frozen=True)
+class NotificationProvider:
+    PUSH: str = "push"
+    SENDGRID: str = "sendgrid"
+    SMTP: str = "smtp"
+    TWILIO: str = "twilio"
+
+
+@dataclass(frozen=True)
+class NotificationHttpPoolStats:
+    connections_created: int
+    max_pool_size: int
+    provider: str
+    requests_sent: int
+
+
+@dataclass(frozen=True)
+class SmtpPoolStats:
+    connections_created: int
+    idle_connections: int
+    max_pool_size: int
+    messages_sent: int
+
+
+@dataclass(frozen=True)
+class EmailTransportType:
+    SENDGRID: str = "sendgrid"
+    SMTP: str = "smtp"
+
+
+@dataclass(frozen=True)
+class EmailTemplateType:
+    FORGOT_PASSWORD: str = "forgot_password"
+    NOTIFICATION_DIGEST: str = "notification_digest"
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    html_body: str
+    subject: str
+    text_body: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CircuitBreakerState:
+    CLOSED: str = "CLOSED"
+    HALF_OPEN: str = "HALF_OPEN"
+    OPEN: str = "OPEN"
+
+
+@dataclass(frozen=True)
+class NotificationProviderCallStats:
+    circuit_state: str
+    consecutive_failures: int
+    opened_count: int
+    provider: str
+    rejected_count: int
+    retry_count: int
+
+
+@dataclass(frozen=True)
+class DevicePlatform:
+    ANDROID: str = "android"
+    IOS: str = "ios"
+    WEB: str = "web"
+
+
+@dataclass(frozen=True)
+class DeviceToken:
+    account_id: str
+    id: str
+    platform: str
+    token: str
+
+
+@dataclass(frozen=True)
+class RegisterDeviceTokenParams:
+    platform: str
+    token: str
+
+
+@dataclass(frozen=True)
+class PushDeliveryStatus:
+    FAILED: str = "FAILED"
+    INVALID_TOKEN: str = "INVALID_TOKEN"
+    SENT: str = "SENT"
+
+
+@dataclass(frozen=True)
+class PushDeliveryResult:
+    failed_count: int
+    pruned_count: int
+    sent_count: int
+
+
 @dataclass(frozen=True)
 class NotificationErrorCode:
     PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
     VALIDATION_ERROR = "NOTIFICATION_ERR_02"
     SERVICE_ERROR = "NOTIFICATION_ERR_03"
+    BROADCAST_NOT_FOUND = "NOTIFICATION_ERR_04"
+    BROADCAST_DISABLED = "NOTIFICATION_ERR_05"
 
 
 @dataclass(frozen=True)
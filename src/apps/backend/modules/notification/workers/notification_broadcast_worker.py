@@ -0,0 +1,21 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker, WorkerPriority
+from modules.notification.notification_service import NotificationService
+
+
+class NotificationBroadcastWorker(BaseWorker):
+    priority = WorkerPriority.DEFAULT
+    max_execution_time_in_seconds = 3600
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        # Broadcasts checkpoint after every chunk, a run cut short by the time limit resumes on the next schedule. Each
+        # broadcast runs on a thread, its blocking database and provider calls would otherwise stall the worker loop
+        while await asyncio.to_thread(NotificationService.run_next_notification_broadcast) is not None:
+            pass
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker, WorkerPriority
+from modules.config.config_service import ConfigService
+from modules.notification.notification_service import NotificationService
+
+
+class NotificationDigestWorker(BaseWorker):
+    priority = WorkerPriority.DEFAULT
+    max_execution_time_in_seconds = 300
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        batch_size = ConfigService[int].get_value(key="notification.digest.batch_size", default=100)
+
+        # Keep flushing while full batches come back, a backlog of closed windows drains in a single run. Each batch runs
+        # on a thread, its blocking database and provider calls would otherwise stall the worker loop
+        while (
+            await asyncio.to_thread(NotificationService.flush_notification_digests, batch_size=batch_size) >= batch_size
+        ):
+            pass
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
@@ -0,0 +1,35 @@
+import asyncio
+import time
+from typing import Any
+
+from modules.application.types import BaseWorker, WorkerPriority
+from modules.config.config_service import ConfigService
+from modules.notification.notification_service import NotificationService
+
+# The worker is scheduled every minute and drains the outbox for most of it, so there is always a dispatcher polling
+DISPATCH_DURATION_IN_SECONDS = 55
+
+
+class NotificationOutboxDispatcherWorker(BaseWorker):
+    priority = WorkerPriority.CRITICAL
+    max_execution_time_in_seconds = 90
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        batch_size = ConfigService[int].get_value(key="notification.outbox.batch_size", default=100)
+        poll_interval_in_seconds = ConfigService[float].get_value(
+            key="notification.outbox.poll_interval_in_seconds", default=1
+        )
+        deadline = time.monotonic() + DISPATCH_DURATION_IN_SECONDS
+
+        while time.monotonic() < deadline:
+            # Pymongo and the provider clients block, so each batch runs on a thread to keep the worker loop responsive
+            dispatched_count = await asyncio.to_thread(
+                NotificationService.dispatch_pending_notifications, batch_size=batch_size
+            )
+            if dispatched_count < batch_size:
+                await asyncio.sleep(poll_interval_in_seconds)
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
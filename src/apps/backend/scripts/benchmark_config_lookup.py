@@ -0,0 +1,53 @@
+import argparse
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules.config.config_service import ConfigService
+from modules.config.internals.types import AllowedConfigValueTypes, Config
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+BENCHMARK_KEYS = ["accounts.otp_engine", "datadog.log_level", "sms.enabled", "rate_limit.rules.login_by_ip.limit"]
+
+
+def traverse_nested_config(config: Config, key: str) -> Optional[AllowedConfigValueTypes]:
+    # The per-lookup walk ConfigManager did before the flattened index, kept here as the baseline
+    values: AllowedConfigValueTypes = config
+    for part in key.split("."):
+        if not isinstance(values, dict) or part not in values:
+            return None
+        values = values[part]
+    return values
+
+
+def get_lookups(keys: List[str]) -> Dict[str, Callable[[], object]]:
+    config_store = ConfigService.config_manager.config_store
+    return {
+        "nested traversal (before)": lambda: [traverse_nested_config(config_store, key) for key in keys],
+        "ConfigService[str].get_value": lambda: [ConfigService[str].get_value(key=key, default="") for key in keys],
+        "ConfigService.get_str": lambda: [ConfigService.get_str(key=key, default="") for key in keys],
+    }
+
+
+def measure(lookup: Callable[[], object], *, iterations: int, repeat: int, keys_per_call: int) -> Tuple[float, float]:
+    timings = timeit.repeat(lookup, number=iterations, repeat=repeat)
+    per_lookup_in_ns = [timing / (iterations * keys_per_call) * 1e9 for timing in timings]
+    return min(per_lookup_in_ns), sorted(per_lookup_in_ns)[len(per_lookup_in_ns) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the per-lookup cost of ConfigService")
+    parser.add_argument("--iterations", type=int, default=100000, help="Calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per lookup style")
+    args = parser.parse_args()
+
+    LoggerManager.mount_logger()
+    for name, lookup in get_lookups(BENCHMARK_KEYS).items():
+        best, median = measure(
+            lookup, iterations=args.iterations, repeat=args.repeat, keys_per_call=len(BENCHMARK_KEYS)
+        )
+        Logger.info(message=f"{name}: best {best:.0f}ns, median {median:.0f}ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import argparse
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
+from scripts.fake_notification_providers import FakeNotificationProviderServer
+
+BENCHMARK_ACCOUNT_ID = "benchmark"
+
+
+def get_config_overrides(base_url: str) -> Dict[str, Any]:
+    # Sends go straight to the providers so the benchmark measures the provider path, not the outbox insert
+    return {
+        "notification": {"outbox": {"enabled": False}},
+        "sendgrid": {"api_key": "fake-sendgrid-api-key", "base_url": base_url},
+        "sms": {"enabled": True},
+        "twilio": {
+            "account_sid": "ACfake",
+            "auth_token": "fake-twilio-auth-token",
+            "base_url": base_url,
+            "messaging_service_sid": "MGfake",
+        },
+    }
+
+
+def send_notification(channel: str) -> None:
+    if channel == "sms":
+        NotificationService.send_sms_for_account(
+            account_id=BENCHMARK_ACCOUNT_ID,
+            bypass_preferences=True,
+            params=SendSMSParams(
+                message_body="Benchmark message",
+                recipient_phone=PhoneNumber(country_code="+1", phone_number="2124567890"),
+            ),
+        )
+        return
+
+    NotificationService.send_email_for_account(
+        account_id=BENCHMARK_ACCOUNT_ID,
+        bypass_preferences=True,
+        params=SendEmailParams(
+            recipient=EmailRecipient(email="recipient@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Benchmark"),
+            template_id="benchmark-template",
+            template_data={"first_name": "Benchmark"},
+        ),
+    )
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percentile / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive NotificationService against fake providers")
+    parser.add_argument("--channel", choices=["email", "sms"], default="email")
+    parser.add_argument("--rate", type=float, default=100, help="Target sends per second")
+    parser.add_argument("--duration", type=float, default=10, help="Benchmark duration in seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="Sender threads")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Fake provider response latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of provider requests that fail")
+    args = parser.parse_args()
+
+    LoggerManager.mount_logger()
+    fake_server = FakeNotificationProviderServer(
+        latency_in_seconds=args.latency_ms / 1000, error_rate=args.error_rate
+    ).start()
+    ConfigService.config_manager.apply_overrides(get_config_overrides(fake_server.base_url))
+
+    latencies: List[float] = []
+    errors: Counter[str] = Counter()
+    results_lock = threading.Lock()
+
+    def timed_send() -> None:
+        started_at = time.perf_counter()
+        try:
+            send_notification(args.channel)
+        except Exception as err:
+            with results_lock:
+                errors[err.__class__.__name__] += 1
+            return
+        with results_lock:
+            latencies.append(time.perf_counter() - started_at)
+
+    total_sends = int(args.rate * args.duration)
+    Logger.info(
+        message=f"Sending {total_sends} {args.channel} notification(s) at {args.rate}/s with "
+        f"{args.concurrency} thread(s), provider latency {args.latency_ms}ms, error rate {args.error_rate}"
+    )
+
+    # Open loop: sends are scheduled at the target rate whether or not earlier ones have finished
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = []
+        for index in range(total_sends):
+            delay = started_at + index / args.rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(timed_send))
+        wait(futures)
+    elapsed = time.perf_counter() - started_at
+    fake_server.stop()
+
+    sorted_latencies = sorted(latencies)
+    report = [
+        f"Sent {len(latencies)}/{total_sends} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f}/s)",
+        f"Latency ms: p50 {get_percentile(sorted_latencies, 50) * 1000:.1f}, "
+        f"p90 {get_percentile(sorted_latencies, 90) * 1000:.1f}, "
+        f"p99 {get_percentile(sorted_latencies, 99) * 1000:.1f}, "
+        f"max {(sorted_latencies[-1] if sorted_latencies else 0) * 1000:.1f}, "
+        f"mean {(statistics.mean(sorted_latencies) if sorted_latencies else 0) * 1000:.1f}",
+        f"Errors: {dict(errors) or 'none'}",
+        f"Provider requests: {fake_server.request_count}, injected failures: {fake_server.error_count}",
+    ]
+    report.extend(str(stats) for stats in NotificationService.get_notification_provider_call_stats())
+    report.extend(str(stats) for stats in NotificationService.get_notification_http_pool_stats())
+    for line in report:
+        Logger.info(message=line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from modules.config.internals.config_snapshot import ConfigSnapshot
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+
+def main() -> None:
+    LoggerManager.mount_logger()
+    snapshot_path = ConfigSnapshot.build()
+    Logger.info(message=f"Compiled config snapshot written to {snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.notification_service import NotificationService
+
+BATCH_SIZE = 500
+
+
+def main() -> None:
+    LoggerManager.mount_logger()
+    Logger.info(message="Embedding notification preferences in account documents...")
+    migrated_count = NotificationService.embed_account_notification_preferences_in_accounts(batch_size=BATCH_SIZE)
+    Logger.info(
+        message=f"Embedded notification preferences for {migrated_count} account(s). "
+        f"Set notification.preferences_storage to 'embedded' to start reading them."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+FCM_MESSAGES_SEND_PATH_REGEX = re.compile(r"^/v1/projects/(?P<project_id>[^/]+)/messages:send$")
+SENDGRID_MAIL_SEND_PATH = "/v3/mail/send"
+TWILIO_MESSAGES_PATH_REGEX = re.compile(r"^/2010-04-01/Accounts/(?P<account_sid>[^/]+)/Messages\.json$")
+
+
+class FakeProviderHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 resets connections as soon as a burst of senders connects at once
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class FakeNotificationProviderServer:
+    """
+    Stand-in for the SendGrid mail send, Twilio messages and FCM send endpoints, so the notification path can be load
+    tested without calling the paid providers. Every response waits `latency_in_seconds` and fails with
+    `error_status_code` for an `error_rate` share of the requests. FCM tokens starting with `invalid` are answered
+    as unregistered.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_in_seconds: float = 0,
+        error_rate: float = 0,
+        error_status_code: int = 503,
+    ) -> None:
+        self.latency_in_seconds = latency_in_seconds
+        self._host = host
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+        self.request_count = 0
+        self.error_count = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._server = FakeProviderHTTPServer((host, port), self._create_handler())
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self._host}:{self._server.server_port}"
+
+    def start(self) -> "FakeNotificationProviderServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def _record_request(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            should_fail = random.random() < self.error_rate
+            if should_fail:
+                self.error_count += 1
+            return should_fail
+
+    def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+        fake_server = self
+
+        class FakeNotificationProviderHandler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections alive, so the benchmark exercises the pooled transport
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                request_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                should_fail = fake_server._record_request()
+                if fake_server.latency_in_seconds:
+                    time.sleep(fake_server.latency_in_seconds)
+
+                fcm_path_match = FCM_MESSAGES_SEND_PATH_REGEX.match(self.path)
+                twilio_path_match = TWILIO_MESSAGES_PATH_REGEX.match(self.path)
+                if should_fail:
+                    self._send_json(
+                        fake_server.error_status_code,
+                        {
+                            "code": 20500,
+                            "message": "Injected provider failure",
+                            "status": fake_server.error_status_code,
+                        },
+                    )
+                elif self.path == SENDGRID_MAIL_SEND_PATH:
+                    self._send_json(202, None)
+                elif twilio_path_match:
+                    self._send_json(
+                        201,
+                        {
+                            "account_sid": twilio_path_match.group("account_sid"),
+                            "sid": f"SM{uuid.uuid4().hex}",
+                            "status": "accepted",
+                        },
+                    )
+                elif fcm_path_match:
+                    self._send_fcm_response(fcm_path_match.group("project_id"), request_body)
+                else:
+                    self._send_json(404, {"message": f"Unknown path {self.path}"})
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _send_fcm_response(self, project_id: str, request_body: bytes) -> None:
+                token = json.loads(request_body or b"{}").get("message", {}).get("token", "")
+                if token.startswith("invalid"):
+                    self._send_json(
+                        404,
+                        {
+                            "error": {
+                                "code": 404,
+                                "details": [
+                                    {
+                                        "@type": "type.googleapis.com/google.firebase.fcm.v1.FcmError",
+                                        "errorCode": "UNREGISTERED",
+                                    }
+                                ],
+                                "message": "Requested entity was not found.",
+                                "status": "NOT_FOUND",
+                            }
+                        },
+                    )
+                else:
+                    self._send_json(200, {"name": f"projects/{project_id}/messages/{uuid.uuid4().hex}"})
+
+            def _send_json(self, status_code: int, body: Optional[dict]) -> None:
+                encoded_body = json.dumps(body).encode("utf-8") if body is not None else b""
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded_body)))
+                self.end_headers()
+                self.wfile.write(encoded_body)
+
+        return FakeNotificationProviderHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake SendGrid, Twilio and FCM endpoints")
+    parser.add_argument("--port", type=int, default=4010)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status-code", type=int, default=503)
+    args = parser.parse_args()
+
+    LoggerManager.mount_logger()
+    server = FakeNotificationProviderServer(
+        port=args.port,
+        latency_in_seconds=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+        error_status_code=args.error_status_code,
+    )
+    Logger.info(
+        message=f"Fake notification providers listening on {server.base_url}, "
+        f"set SENDGRID_BASE_URL, TWILIO_BASE_URL and PUSH_BASE_URL to it"
+    )
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,15 @@ from modules.account.rest_api.account_rest_api_server import AccountRestApiServe
 from modules.application.application_service import ApplicationService
 from modules.application.errors import AppError, WorkerClientConnectionError
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.notification_service import NotificationService
+from modules.notification.workers.notification_broadcast_worker import NotificationBroadcastWorker
+from modules.notification.workers.notification_digest_worker import NotificationDigestWorker
+from modules.notification.workers.notification_outbox_dispatcher_worker import NotificationOutboxDispatcherWorker
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from scripts.bootstrap_app import BootstrapApp
 
@@ -24,6 +29,15 @@ cors = CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}})
 # Mount deps
 LoggerManager.mount_logger()
 
+# Refuse to start with a config that would let anyone forge OTP codes
+AuthenticationService.validate_otp_config()
+
+# Coalesced emails skip the digest when it has no template to render with
+NotificationService.validate_digest_config()
+
+# Pick up config file edits (and SIGHUP) in place when config reloading is enabled
+ConfigService.start_reload_watcher()
+
 # Run bootstrap tasks
 BootstrapApp().run()
 
@@ -35,6 +49,18 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Deliver queued emails and SMS from the notification outbox
+    if NotificationService.is_notification_outbox_enabled():
+        ApplicationService.schedule_worker_as_cron(cls=NotificationOutboxDispatcherWorker, cron_schedule="* * * * *")
+
+    # Send buffered notifications whose coalescing window has closed as one digest per account and channel
+    if NotificationService.is_notification_digest_enabled():
+        ApplicationService.schedule_worker_as_cron(cls=NotificationDigestWorker, cron_schedule="* * * * *")
+
+    # Stream pending notification broadcasts to their account segments, resuming interrupted ones from a checkpoint
+    if NotificationService.is_notification_broadcast_enabled():
+        ApplicationService.schedule_worker_as_cron(cls=NotificationBroadcastWorker, cron_schedule="* * * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
@@ -4,10 +4,18 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.notification.workers.notification_broadcast_worker import NotificationBroadcastWorker
+from modules.notification.workers.notification_digest_worker import NotificationDigestWorker
+from modules.notification.workers.notification_outbox_dispatcher_worker import NotificationOutboxDispatcherWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [
+        HealthCheckWorker,
+        NotificationBroadcastWorker,
+        NotificationDigestWorker,
+        NotificationOutboxDispatcherWorker,
+    ]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
@@ -18,6 +18,7 @@ async def main() -> None:
     # Mount logger and workers
     LoggerManager.mount_logger()
     TemporalConfig.mount_workers()
+    ConfigService.start_reload_watcher()
 
     server_address = ConfigService[str].get_value(key="temporal.server_address")
 
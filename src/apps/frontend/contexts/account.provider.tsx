@@ -2,7 +2,7 @@ import React, { createContext, PropsWithChildren, useContext } from 'react';
 
 import useAsync from 'frontend/contexts/async.hook';
 import { AccountService } from 'frontend/services';
-import { Account, ApiResponse, AsyncError } from 'frontend/types';
+import { AccessToken, Account, ApiResponse, AsyncError } from 'frontend/types';
 import { Nullable } from 'frontend/types/common-types';
 import { Logger } from 'frontend/utils/logger';
 import { getAccessTokenFromStorage } from 'frontend/utils/storage-util';
@@ -21,8 +21,16 @@ const accountService = new AccountService();
 export const useAccountContext = (): AccountContextType =>
   useContext(AccountContext) as AccountContextType;
 
-const getAccountDetailsFn = async (): Promise<ApiResponse<Account>> => {
+const getActiveAccessToken = async (): Promise<Nullable<AccessToken>> => {
   const accessToken = getAccessTokenFromStorage();
+  if (accessToken && new Date(accessToken.expiresAt) <= new Date()) {
+    return accountService.refreshStoredAccessToken();
+  }
+  return accessToken;
+};
+
+const getAccountDetailsFn = async (): Promise<ApiResponse<Account>> => {
+  const accessToken = await getActiveAccessToken();
   if (accessToken) {
     const accountDetails = await accountService.getAccountDetails(accessToken);
     const accountData = accountDetails.data;
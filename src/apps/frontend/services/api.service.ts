@@ -1,6 +1,25 @@
-import { AxiosInstance } from 'axios';
+import axios, {
+  AxiosError,
+  AxiosInstance,
+  AxiosResponse,
+  InternalAxiosRequestConfig,
+} from 'axios';
 
 import AppService from 'frontend/services/app.service';
+import { AccessToken } from 'frontend/types';
+import { JsonObject, Nullable } from 'frontend/types/common-types';
+import {
+  getAccessTokenFromStorage,
+  removeAccessTokenFromStorage,
+  setAccessTokenToStorage,
+} from 'frontend/utils/storage-util';
+
+type RetryableRequestConfig = InternalAxiosRequestConfig & {
+  isRetryAfterRefresh?: boolean;
+};
+
+// Shared across service instances so that concurrent 401s trigger a single refresh.
+let pendingRefresh: Nullable<Promise<Nullable<AccessToken>>> = null;
 
 export default class APIService extends AppService {
   apiClient: AxiosInstance;
@@ -12,5 +31,66 @@ export default class APIService extends AppService {
     this.apiClient = APIService.getAxiosInstance({
       baseURL: this.apiUrl,
     });
+    this.apiClient.interceptors.response.use(undefined, (error: AxiosError) =>
+      this.retryWithRefreshedAccessToken(error),
+    );
   }
+
+  refreshStoredAccessToken = async (): Promise<Nullable<AccessToken>> => {
+    if (!pendingRefresh) {
+      pendingRefresh = this.requestAccessTokenRefresh().finally(() => {
+        pendingRefresh = null;
+      });
+    }
+    return pendingRefresh;
+  };
+
+  private requestAccessTokenRefresh = async (): Promise<
+    Nullable<AccessToken>
+  > => {
+    const accessToken = getAccessTokenFromStorage();
+    if (
+      !accessToken?.refreshToken ||
+      new Date(accessToken.refreshTokenExpiresAt) <= new Date()
+    ) {
+      removeAccessTokenFromStorage();
+      return null;
+    }
+
+    try {
+      // Plain axios is used so that a failing refresh does not re-enter the interceptor.
+      const response = await axios.post<JsonObject>(
+        `${this.apiUrl}/access-tokens`,
+        { refresh_token: accessToken.refreshToken },
+      );
+      const refreshedAccessToken = new AccessToken(response.data);
+      setAccessTokenToStorage(refreshedAccessToken);
+      return refreshedAccessToken;
+    } catch {
+      removeAccessTokenFromStorage();
+      return null;
+    }
+  };
+
+  private retryWithRefreshedAccessToken = async (
+    error: AxiosError,
+  ): Promise<AxiosResponse> => {
+    const requestConfig = error.config as RetryableRequestConfig | undefined;
+    if (
+      error.response?.status !== 401 ||
+      !requestConfig?.headers?.Authorization ||
+      requestConfig.isRetryAfterRefresh
+    ) {
+      throw error;
+    }
+
+    const refreshedAccessToken = await this.refreshStoredAccessToken();
+    if (!refreshedAccessToken) {
+      throw error;
+    }
+
+    requestConfig.isRetryAfterRefresh = true;
+    requestConfig.headers.Authorization = `Bearer ${refreshedAccessToken.token}`;
+    return this.apiClient.request(requestConfig);
+  };
 }
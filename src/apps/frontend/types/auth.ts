@@ -4,11 +4,15 @@ export class AccessToken {
   accountId: string;
   token: string;
   expiresAt: Date;
+  refreshToken: string;
+  refreshTokenExpiresAt: Date;
 
   constructor(json: JsonObject) {
     this.accountId = json.account_id as string;
     this.token = json.token as string;
     this.expiresAt = json.expires_at as Date;
+    this.refreshToken = json.refresh_token as string;
+    this.refreshTokenExpiresAt = json.refresh_token_expires_at as Date;
   }
 
   toJson(): JsonObject {
@@ -16,6 +20,8 @@ export class AccessToken {
       account_id: this.accountId,
       token: this.token,
       expires_at: this.expiresAt,
+      refresh_token: this.refreshToken,
+      refresh_token_expires_at: this.refreshTokenExpiresAt,
     };
   }
 }
@@ -4,10 +4,15 @@ from typing import Callable
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.token_epoch.store.token_epoch_repository import TokenEpochRepository
 from modules.logger.logger_manager import LoggerManager
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
+from modules.notification.internals.store.device_token_repository import DeviceTokenRepository
+from modules.notification.internals.store.notification_broadcast_repository import NotificationBroadcastRepository
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
 
 
 class BaseTestAccount(unittest.TestCase):
@@ -21,3 +26,8 @@ class BaseTestAccount(unittest.TestCase):
         AccountRepository.collection().delete_many({})
         OTPRepository.collection().delete_many({})
         AccountNotificationPreferencesRepository.collection().delete_many({})
+        TokenEpochRepository.collection().delete_many({})
+        NotificationOutboxRepository.collection().delete_many({})
+        DeviceTokenRepository.collection().delete_many({})
+        NotificationDigestRepository.collection().delete_many({})
+        NotificationBroadcastRepository.collection().delete_many({})
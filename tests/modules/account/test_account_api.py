@@ -11,7 +11,11 @@ from modules.account.types import (
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
+    ResetPasswordParams,
 )
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
 from modules.authentication.types import AccessTokenErrorCode, OTPErrorCode
 from modules.config.config_service import ConfigService
 from modules.notification.sms_service import SMSService
@@ -166,7 +170,7 @@ class TestAccountApi(BaseTestAccount):
         # Create an expired token by setting the expiry to a date in the past using same method as in the
         # access token service
         jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days") - 1)
+        jwt_expiry = timedelta(seconds=ConfigService[int].get_value(key="accounts.access_token_expiry_in_seconds"))
         payload = {"account_id": account.id, "exp": (datetime.now() - jwt_expiry).timestamp()}
         expired_token = jwt.encode(payload, jwt_signing_key, algorithm="HS256")
 
@@ -385,9 +389,10 @@ class TestAccountApi(BaseTestAccount):
                 headers={"Authorization": f"Bearer {access_token_response.json.get('token')}"},
             )
 
-            assert get_response.status_code == 404
+            # Deletion revokes every access token issued to the account
+            assert get_response.status_code == 401
             assert get_response.json
-            assert get_response.json.get("code") == AccountErrorCode.NOT_FOUND
+            assert get_response.json.get("code") == AccessTokenErrorCode.ACCESS_TOKEN_INVALID
 
     def test_deleted_account_cannot_login(self) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -441,3 +446,112 @@ class TestAccountApi(BaseTestAccount):
             )
 
             assert response.status_code == 500
+
+    def test_search_accounts_by_prefix_as_admin(self) -> None:
+        admin_account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="Admin", last_name="User", password="password", username="admin@example.com"
+            )
+        )
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="Alice", last_name="Smith", password="password", username="alice@example.com"
+            )
+        )
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="Bob", last_name="Alston", password="password", username="bob@example.com"
+            )
+        )
+
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["accounts"], {"admin_account_ids": [admin_account.id]}
+        ):
+            with app.test_client() as client:
+                access_token_response = client.post(
+                    "http://127.0.0.1:8080/api/access-tokens",
+                    headers=HEADERS,
+                    data=json.dumps({"username": admin_account.username, "password": "password"}),
+                )
+                response = client.get(
+                    f"{ACCOUNT_URL}/search?q=AL",
+                    headers={"Authorization": f"Bearer {access_token_response.json.get('token')}"},
+                )
+
+        assert response.status_code == 200
+        usernames = [item["username"] for item in response.json["items"]]
+        assert usernames == ["alice@example.com", "bob@example.com"]
+        assert all("hashed_password" not in item for item in response.json["items"])
+
+    def test_search_accounts_by_prefix_as_non_admin(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+            response = client.get(
+                f"{ACCOUNT_URL}/search?q=user",
+                headers={"Authorization": f"Bearer {access_token_response.json.get('token')}"},
+            )
+
+        assert response.status_code == 401
+        assert response.json.get("code") == AccessTokenErrorCode.UNAUTHORIZED_ACCESS
+
+    def test_search_accounts_by_prefix_with_limit_above_max(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["accounts"], {"admin_account_ids": [account.id]}
+        ):
+            with app.test_client() as client:
+                access_token_response = client.post(
+                    "http://127.0.0.1:8080/api/access-tokens",
+                    headers=HEADERS,
+                    data=json.dumps({"username": account.username, "password": "password"}),
+                )
+                response = client.get(
+                    f"{ACCOUNT_URL}/search?q=user&limit=1000",
+                    headers={"Authorization": f"Bearer {access_token_response.json.get('token')}"},
+                )
+
+        assert response.status_code == 400
+        assert response.json.get("code") == AccountErrorCode.BAD_REQUEST
+
+    def test_access_token_is_revoked_after_password_reset(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, token)
+
+        AccountService.reset_account_password(
+            params=ResetPasswordParams(account_id=account.id, new_password="new_password", token=token)
+        )
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{ACCOUNT_URL}/{account.id}", headers={"Authorization": f"Bearer {access_token.token}"}
+            )
+            assert response.status_code == 401
+            assert response.json
+            assert response.json.get("code") == AccessTokenErrorCode.ACCESS_TOKEN_INVALID
+
+            new_access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+            response = client.get(
+                f"{ACCOUNT_URL}/{account.id}", headers={"Authorization": f"Bearer {new_access_token.token}"}
+            )
+            assert response.status_code == 200
@@ -4,9 +4,10 @@ from unittest.mock import patch
 from server import app
 
 from modules.account.account_service import AccountService
-from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError
+from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError, AccountWithUserNameExistsError
 from modules.account.types import (
     AccountErrorCode,
+    AccountPrefixSearchParams,
     AccountSearchByIdParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
@@ -295,3 +296,86 @@ class TestAccountService(BaseTestAccount):
         assert new_account.id != original_account.id
         assert new_account.phone_number.country_code == "+91"
         assert new_account.phone_number.phone_number == "9999999999"
+
+    def test_get_account_by_username_is_case_insensitive(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="User@Example.com"
+            )
+        )
+
+        fetched_account = AccountService.get_account_by_username(username="user@example.COM")
+
+        assert fetched_account.id == account.id
+        assert fetched_account.username == "User@Example.com"
+
+    def test_create_account_with_username_differing_only_in_case(self) -> None:
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="user@example.com"
+            )
+        )
+
+        try:
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username="USER@example.com"
+                )
+            )
+            assert False, "Expected AccountWithUserNameExistsError to be raised"
+        except AccountWithUserNameExistsError as exc:
+            assert exc.code == AccountErrorCode.USERNAME_ALREADY_EXISTS
+
+    def test_search_accounts_by_prefix_matches_username_and_names(self) -> None:
+        for username, first_name, last_name in [
+            ("maria@example.com", "Maria", "Lopez"),
+            ("john@example.com", "Marcus", "Doe"),
+            ("jane@example.com", "Jane", "Marsh"),
+            ("peter@example.com", "Peter", "Parker"),
+        ]:
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name=first_name, last_name=last_name, password="password", username=username
+                )
+            )
+
+        accounts = AccountService.search_accounts_by_prefix(params=AccountPrefixSearchParams(prefix="mar", limit=10))
+
+        assert [account.username for account in accounts] == [
+            "jane@example.com",
+            "john@example.com",
+            "maria@example.com",
+        ]
+
+    def test_search_accounts_by_prefix_sorts_before_limit(self) -> None:
+        for username in ["carol@example.com", "cameron@example.com", "casey@example.com"]:
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username=username
+                )
+            )
+
+        accounts = AccountService.search_accounts_by_prefix(params=AccountPrefixSearchParams(prefix="ca", limit=2))
+
+        assert [account.username for account in accounts] == ["cameron@example.com", "carol@example.com"]
+
+    def test_search_accounts_by_prefix_respects_limit_and_skips_deleted(self) -> None:
+        accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username=f"user{index}"
+                )
+            )
+            for index in range(3)
+        ]
+        AccountService.delete_account(account_id=accounts[0].id)
+
+        limited_accounts = AccountService.search_accounts_by_prefix(
+            params=AccountPrefixSearchParams(prefix="user", limit=1)
+        )
+        all_accounts = AccountService.search_accounts_by_prefix(
+            params=AccountPrefixSearchParams(prefix="user", limit=10)
+        )
+
+        assert [account.username for account in limited_accounts] == ["user1"]
+        assert [account.username for account in all_accounts] == ["user1", "user2"]
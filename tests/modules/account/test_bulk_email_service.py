@@ -0,0 +1,102 @@
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.config.config_service import ConfigService
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    BulkEmailRecipient,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    SendBulkEmailParams,
+)
+
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestBulkEmailService(BaseTestAccount):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name=f"first_name_{index}",
+                    last_name="last_name",
+                    password="password",
+                    username=f"user{index}@example.com",
+                )
+            )
+            for index in range(3)
+        ]
+
+    def _get_bulk_email_params(self) -> SendBulkEmailParams:
+        return SendBulkEmailParams(
+            recipients=[
+                BulkEmailRecipient(
+                    account_id=account.id,
+                    recipient=EmailRecipient(email=account.username),
+                    template_data={"first_name": account.first_name},
+                )
+                for account in self.accounts
+            ],
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="template_id",
+        )
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_send_bulk_email_skips_recipients_with_email_disabled(self, mock_send_bulk_email) -> None:
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=self.accounts[1].id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+        )
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}):
+            sent_count = NotificationService.send_bulk_email(params=self._get_bulk_email_params())
+
+        assert sent_count == 2
+        sent_params = mock_send_bulk_email.call_args.args[0]
+        assert [bulk_recipient.account_id for bulk_recipient in sent_params.recipients] == [
+            self.accounts[0].id,
+            self.accounts[2].id,
+        ]
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_send_bulk_email_with_bypass_preferences_sends_to_everyone(self, mock_send_bulk_email) -> None:
+        for account in self.accounts:
+            NotificationService.create_or_update_account_notification_preferences(
+                account_id=account.id,
+                preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+            )
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}):
+            sent_count = NotificationService.send_bulk_email(
+                bypass_preferences=True, params=self._get_bulk_email_params()
+            )
+
+        assert sent_count == 3
+        assert len(mock_send_bulk_email.call_args.args[0].recipients) == 3
+
+    @mock.patch("modules.notification.email_service.MAX_PERSONALIZATIONS_PER_REQUEST", 2)
+    def test_send_bulk_email_enqueues_one_outbox_message_per_request(self) -> None:
+        NotificationService.send_bulk_email(params=self._get_bulk_email_params())
+
+        outbox_messages = list(NotificationOutboxRepository.collection().find({}))
+        assert len(outbox_messages) == 2
+        assert all(message["channel"] == NotificationChannel.BULK_EMAIL for message in outbox_messages)
+        assert sorted(len(message["payload"]["recipients"]) for message in outbox_messages) == [1, 2]
+
+    @mock.patch.object(SendGridService, "_send_message")
+    def test_send_bulk_email_sends_one_personalization_per_recipient(self, mock_send_message) -> None:
+        SendGridService.send_bulk_email(self._get_bulk_email_params())
+
+        assert mock_send_message.call_count == 1
+        message = mock_send_message.call_args.args[0].get()
+        personalizations = sorted(message["personalizations"], key=lambda item: item["to"][0]["email"])
+        assert [personalization["to"][0]["email"] for personalization in personalizations] == [
+            account.username for account in self.accounts
+        ]
+        assert personalizations[0]["dynamic_template_data"] == {"first_name": "first_name_0"}
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.config.config_service import ConfigService
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import EmailRecipient, EmailSender, NotificationChannel, SendEmailParams
+
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestNotificationDigestService(BaseTestAccount):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name=f"first_name_{index}",
+                    last_name="last_name",
+                    password="password",
+                    username=f"user{index}@example.com",
+                )
+            )
+            for index in range(2)
+        ]
+        self.digest_config_patcher = mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["digest"],
+            {"enabled": True, "email_template_id": "digest_template_id"},
+        )
+        self.digest_config_patcher.start()
+
+    def teardown_method(self, method) -> None:
+        self.digest_config_patcher.stop()
+        super().teardown_method(method)
+
+    def _send_coalesced_email(self, account_index: int, template_id: str) -> None:
+        account = self.accounts[account_index]
+        NotificationService.send_email_for_account(
+            account_id=account.id,
+            coalesce=True,
+            params=SendEmailParams(
+                recipient=EmailRecipient(email=account.username),
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id=template_id,
+            ),
+        )
+
+    def _close_digest_windows(self) -> None:
+        NotificationDigestRepository.collection().update_many(
+            {}, {"$set": {"window_ends_at": datetime.now() - timedelta(seconds=1)}}
+        )
+
+    def test_coalesced_emails_are_buffered_per_account_and_channel(self) -> None:
+        for template_id in ["task_assigned", "task_updated", "task_completed"]:
+            self._send_coalesced_email(0, template_id)
+        self._send_coalesced_email(1, "task_assigned")
+
+        digest = NotificationDigestRepository.collection().find_one(
+            {"account_id": self.accounts[0].id, "channel": NotificationChannel.EMAIL}
+        )
+
+        assert NotificationDigestRepository.collection().count_documents({}) == 2
+        assert digest["total_count"] == 3
+        assert [item["template_id"] for item in digest["items"]] == ["task_assigned", "task_updated", "task_completed"]
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    def test_buffer_keeps_only_latest_items(self) -> None:
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["digest"], {"max_items": 2}):
+            for template_id in ["task_assigned", "task_updated", "task_completed"]:
+                self._send_coalesced_email(0, template_id)
+
+        digest = NotificationDigestRepository.collection().find_one({"account_id": self.accounts[0].id})
+
+        assert digest["total_count"] == 3
+        assert [item["template_id"] for item in digest["items"]] == ["task_updated", "task_completed"]
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_flush_sends_one_digest_per_closed_window(self, mock_send_email) -> None:
+        for template_id in ["task_assigned", "task_updated"]:
+            self._send_coalesced_email(0, template_id)
+        self._send_coalesced_email(1, "task_assigned")
+        self._close_digest_windows()
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}):
+            flushed_count = NotificationService.flush_notification_digests(batch_size=10)
+
+        sent_params_by_email = {call.args[0].recipient.email: call.args[0] for call in mock_send_email.call_args_list}
+        assert flushed_count == 2
+        assert NotificationDigestRepository.collection().count_documents({}) == 0
+        assert sent_params_by_email[self.accounts[0].username].template_id == "digest_template_id"
+        assert sent_params_by_email[self.accounts[0].username].template_data["notification_count"] == 2
+        # A window holding a single notification sends it as it was
+        assert sent_params_by_email[self.accounts[1].username].template_id == "task_assigned"
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_coalesced_email_is_sent_directly_without_digest_template(self, mock_send_email) -> None:
+        digest_config = ConfigService.config_manager.config_store["notification"]["digest"]
+        outbox_config = ConfigService.config_manager.config_store["notification"]["outbox"]
+        with (
+            mock.patch.dict(digest_config, {"email_template_id": ""}),
+            mock.patch.dict(outbox_config, {"enabled": False}),
+        ):
+            self._send_coalesced_email(0, "task_assigned")
+
+        assert NotificationDigestRepository.collection().count_documents({}) == 0
+        assert mock_send_email.call_args.args[0].template_id == "task_assigned"
+
+    def test_flush_hands_digests_to_outbox(self) -> None:
+        for template_id in ["task_assigned", "task_updated"]:
+            self._send_coalesced_email(0, template_id)
+        self._close_digest_windows()
+
+        NotificationService.flush_notification_digests(batch_size=10)
+
+        outbox_message = NotificationOutboxRepository.collection().find_one({"account_id": self.accounts[0].id})
+        assert outbox_message["channel"] == NotificationChannel.EMAIL
+        assert outbox_message["payload"]["template_id"] == "digest_template_id"
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_flush_skips_open_windows(self, mock_send_email) -> None:
+        self._send_coalesced_email(0, "task_assigned")
+
+        flushed_count = NotificationService.flush_notification_digests(batch_size=10)
+
+        assert flushed_count == 0
+        assert NotificationDigestRepository.collection().count_documents({}) == 1
+        mock_send_email.assert_not_called()
+
+    def test_notification_after_flush_opens_new_window(self) -> None:
+        self._send_coalesced_email(0, "task_assigned")
+        self._close_digest_windows()
+        NotificationService.flush_notification_digests(batch_size=10)
+
+        self._send_coalesced_email(0, "task_updated")
+
+        digest = NotificationDigestRepository.collection().find_one({"account_id": self.accounts[0].id})
+        assert digest["total_count"] == 1
+        assert digest["window_ends_at"] > datetime.now()
+
+    @mock.patch.object(SendGridService, "send_email", side_effect=Exception("SendGrid unavailable"))
+    def test_failed_digest_is_kept_and_retried_after_lease(self, mock_send_email) -> None:
+        for template_id in ["task_assigned", "task_updated"]:
+            self._send_coalesced_email(0, template_id)
+        self._close_digest_windows()
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}):
+            NotificationService.flush_notification_digests(batch_size=10)
+            self._send_coalesced_email(0, "task_completed")
+
+            assert NotificationDigestRepository.collection().count_documents({}) == 2
+            claimed_digest = NotificationDigestRepository.collection().find_one({"claim_id": {"$ne": None}})
+            assert claimed_digest["attempts"] == 1
+            assert claimed_digest["total_count"] == 2
+
+            mock_send_email.side_effect = None
+            NotificationDigestRepository.collection().update_one(
+                {"_id": claimed_digest["_id"]}, {"$set": {"window_ends_at": datetime.now() - timedelta(seconds=1)}}
+            )
+            flushed_count = NotificationService.flush_notification_digests(batch_size=10)
+
+        assert flushed_count == 1
+        assert NotificationDigestRepository.collection().count_documents({"_id": claimed_digest["_id"]}) == 0
+        assert (
+            NotificationDigestRepository.collection().find_one({"account_id": self.accounts[0].id})["total_count"] == 1
+        )
@@ -0,0 +1,121 @@
+from datetime import datetime
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.config.config_service import ConfigService
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ValidationError
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationOutboxDeliveryResult,
+    NotificationOutboxStatus,
+    SendEmailParams,
+)
+
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestNotificationOutboxService(BaseTestAccount):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username@example.com"
+            )
+        )
+        self.email_params = SendEmailParams(
+            recipient=EmailRecipient(email="username@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="template_id",
+            template_data={"first_name": "first_name"},
+        )
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_send_email_enqueues_notification_instead_of_sending(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+
+        assert not mock_send_email.called
+        outbox_messages = list(NotificationOutboxRepository.collection().find({"account_id": self.account.id}))
+        assert len(outbox_messages) == 1
+        assert outbox_messages[0]["channel"] == NotificationChannel.EMAIL
+        assert outbox_messages[0]["status"] == NotificationOutboxStatus.PENDING
+        assert outbox_messages[0]["payload"]["template_id"] == "template_id"
+
+    def test_send_email_with_invalid_params_raises_before_enqueueing(self) -> None:
+        invalid_params = SendEmailParams(
+            recipient=EmailRecipient(email="not-an-email"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="template_id",
+        )
+
+        with self.assertRaises(ValidationError):
+            EmailService.send_email_for_account(account_id=self.account.id, params=invalid_params)
+
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_dispatch_pending_notifications_sends_and_marks_notification_as_sent(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+
+        dispatched_count = NotificationService.dispatch_pending_notifications(batch_size=10)
+
+        assert dispatched_count == 1
+        assert mock_send_email.call_args.args[0] == self.email_params
+        outbox_message = NotificationOutboxRepository.collection().find_one({"account_id": self.account.id})
+        assert outbox_message["status"] == NotificationOutboxStatus.SENT
+        assert outbox_message["attempts"] == 1
+        assert outbox_message["sent_at"] is not None
+        assert NotificationService.dispatch_pending_notifications(batch_size=10) == 0
+
+    @mock.patch.object(SendGridService, "send_email", side_effect=Exception("SendGrid unavailable"))
+    def test_dispatch_pending_notifications_reschedules_failed_notification(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+
+        NotificationService.dispatch_pending_notifications(batch_size=10)
+
+        outbox_message = NotificationOutboxRepository.collection().find_one({"account_id": self.account.id})
+        assert outbox_message["status"] == NotificationOutboxStatus.PENDING
+        assert outbox_message["attempts"] == 1
+        assert outbox_message["last_error"] == "SendGrid unavailable"
+        assert outbox_message["next_attempt_at"] > datetime.now()
+        assert NotificationService.dispatch_pending_notifications(batch_size=10) == 0
+
+    @mock.patch.object(SendGridService, "send_email", side_effect=Exception("SendGrid unavailable"))
+    def test_dispatch_pending_notifications_fails_notification_after_max_attempts(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"max_attempts": 1}):
+            NotificationService.dispatch_pending_notifications(batch_size=10)
+
+        outbox_message = NotificationOutboxRepository.collection().find_one({"account_id": self.account.id})
+        assert outbox_message["status"] == NotificationOutboxStatus.FAILED
+        assert outbox_message["attempts"] == 1
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_send_email_without_outbox_sends_directly(self, mock_send_email) -> None:
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}):
+            EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+
+        assert mock_send_email.called
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    def test_delivery_results_of_an_expired_claim_are_ignored(self) -> None:
+        EmailService.send_email_for_account(account_id=self.account.id, params=self.email_params)
+        [stale_message] = NotificationOutboxWriter.claim_pending_notifications(batch_size=10, lease_in_seconds=0)
+        [message] = NotificationOutboxWriter.claim_pending_notifications(batch_size=10, lease_in_seconds=120)
+
+        NotificationOutboxWriter.record_delivery_results(
+            results=[NotificationOutboxDeliveryResult(message=stale_message, error="lease expired")], max_attempts=5
+        )
+
+        outbox_message = NotificationOutboxRepository.collection().find_one({"account_id": self.account.id})
+        assert outbox_message["status"] == NotificationOutboxStatus.PROCESSING
+        assert str(outbox_message["claim_id"]) == message.claim_id
+        assert outbox_message["attempts"] == 0
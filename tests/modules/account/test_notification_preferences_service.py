@@ -1,3 +1,5 @@
+from unittest import mock
+
 from modules.account.account_service import AccountService
 from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
@@ -5,8 +7,16 @@ from modules.account.types import (
     PhoneNumber,
 )
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
 from modules.notification.notification_service import NotificationService
-from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+)
 
 from tests.modules.account.base_test_account import BaseTestAccount
 
@@ -211,3 +221,178 @@ class TestNotificationPreferencesService(BaseTestAccount):
         assert preferences.email_enabled is True
         assert preferences.push_enabled is True
         assert preferences.sms_enabled is True
+
+    @mock.patch.object(AccountNotificationPreferenceUtil, "is_embedded_storage", return_value=True)
+    def test_embedded_storage_creates_preferences_on_account_creation(self, mock_is_embedded_storage) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+
+        assert preferences.account_id == account.id
+        assert preferences.email_enabled is True
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is True
+        assert AccountNotificationPreferencesRepository.collection().count_documents({"account_id": account.id}) == 0
+
+    @mock.patch.object(AccountNotificationPreferenceUtil, "is_embedded_storage", return_value=True)
+    def test_embedded_storage_partial_update_keeps_other_fields(self, mock_is_embedded_storage) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(sms_enabled=False)
+        )
+
+        preferences = NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+
+        assert preferences.email_enabled is False
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is False
+
+    def test_embed_account_notification_preferences_in_accounts(self) -> None:
+        accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username=f"username{index}"
+                )
+            )
+            for index in range(3)
+        ]
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=accounts[0].id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False, push_enabled=False),
+        )
+
+        migrated_count = NotificationService.embed_account_notification_preferences_in_accounts(batch_size=2)
+
+        assert migrated_count == 3
+        with mock.patch.object(AccountNotificationPreferenceUtil, "is_embedded_storage", return_value=True):
+            preferences = NotificationService.get_account_notification_preferences_by_account_id(
+                account_id=accounts[0].id
+            )
+
+        assert preferences.email_enabled is False
+        assert preferences.push_enabled is False
+        assert preferences.sms_enabled is True
+
+    @mock.patch.object(AccountNotificationPreferenceUtil, "is_embedded_storage", return_value=True)
+    def test_embedded_storage_raises_when_preferences_missing(self, mock_is_embedded_storage) -> None:
+        try:
+            NotificationService.get_account_notification_preferences_by_account_id(
+                account_id="5f7b1b7b4f3b9b1b3f3b9b1b"
+            )
+            assert False, "Expected AccountNotificationPreferencesNotFoundError to be raised"
+        except AccountNotificationPreferencesNotFoundError as exc:
+            assert exc.http_code == 404
+
+    def test_get_notification_preferences_is_served_from_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        stats_before = NotificationService.get_account_notification_preferences_cache_stats()
+
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection") as mock_collection:
+            preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+
+        stats_after = NotificationService.get_account_notification_preferences_cache_stats()
+        assert preferences.account_id == account.id
+        assert not mock_collection.called
+        assert stats_after.hits == stats_before.hits + 1
+
+    def test_update_notification_preferences_invalidates_cached_preferences(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        assert NotificationService.get_account_notification_preferences_by_account_id(
+            account_id=account.id
+        ).email_enabled
+
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        assert preferences.email_enabled is False
+
+    def test_read_racing_a_write_is_not_cached(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        read_preferences = AccountNotificationPreferenceReader._get_collection_account_notification_preferences
+
+        def read_preferences_before_write(account_id: str) -> AccountNotificationPreferences:
+            preferences = read_preferences(account_id)
+            NotificationService.create_or_update_account_notification_preferences(
+                account_id=account_id,
+                preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+            )
+            return preferences
+
+        with mock.patch.object(
+            AccountNotificationPreferenceReader,
+            "_get_collection_account_notification_preferences",
+            side_effect=read_preferences_before_write,
+        ):
+            assert NotificationService.get_account_notification_preferences_by_account_id(
+                account_id=account.id
+            ).email_enabled
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        assert preferences.email_enabled is False
+
+    def test_warm_notification_preferences_cache_loads_all_accounts(self) -> None:
+        accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username=f"username{index}"
+                )
+            )
+            for index in range(3)
+        ]
+
+        warmed_count = NotificationService.warm_account_notification_preferences_cache(
+            account_ids=[account.id for account in accounts]
+        )
+
+        assert warmed_count == 3
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection") as mock_collection:
+            for account in accounts:
+                NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        assert not mock_collection.called
+
+    def test_create_or_update_notification_preferences_keeps_a_single_document(self) -> None:
+        account_id = "5f7b1b7b4f3b9b1b3f3b9b1c"
+
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account_id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(sms_enabled=False)
+        )
+        created_at = AccountNotificationPreferencesRepository.collection().find_one({"account_id": account_id})[
+            "created_at"
+        ]
+        preferences = NotificationService.create_or_update_account_notification_preferences(
+            account_id=account_id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+
+        assert preferences.email_enabled is False
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is False
+        preferences_documents = list(
+            AccountNotificationPreferencesRepository.collection().find({"account_id": account_id})
+        )
+        assert len(preferences_documents) == 1
+        assert preferences_documents[0]["created_at"] == created_at
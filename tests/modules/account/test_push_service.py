@@ -0,0 +1,170 @@
+import json
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.config.config_service import ConfigService
+from modules.notification.internals.device_token_reader import DeviceTokenReader
+from modules.notification.internals.fcm_service import FcmService
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    DevicePlatform,
+    RegisterDeviceTokenParams,
+    SendPushParams,
+)
+from server import app
+
+from tests.modules.account.base_test_account import BaseTestAccount
+from tests.modules.notification.fake_notification_provider_server import FakeNotificationProviderServer
+
+ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
+HEADERS = {"Content-Type": "application/json"}
+
+
+class TestPushService(BaseTestAccount):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.fake_server = FakeNotificationProviderServer().start()
+        ProviderCallExecutor._circuit_breakers = {}
+        self.accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name=f"first_name_{index}",
+                    last_name="last_name",
+                    password="password",
+                    username=f"user{index}@example.com",
+                )
+            )
+            for index in range(2)
+        ]
+        self.patchers = [
+            mock.patch.dict(ConfigService.config_manager.config_store["push"], {"enabled": True}),
+            mock.patch.object(FcmService, "_get_headers", return_value={}),
+            mock.patch.object(
+                FcmService,
+                "_get_messages_send_url",
+                return_value=f"{self.fake_server.base_url}/v1/projects/test-project/messages:send",
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self, method) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.fake_server.stop()
+        super().teardown_method(method)
+
+    def _register_device_token(self, account_id: str, token: str) -> None:
+        NotificationService.register_device_token(
+            account_id=account_id, params=RegisterDeviceTokenParams(platform=DevicePlatform.ANDROID, token=token)
+        )
+
+    def test_register_device_token_moves_token_to_latest_account(self) -> None:
+        self._register_device_token(self.accounts[0].id, "token-1")
+        self._register_device_token(self.accounts[1].id, "token-1")
+
+        device_tokens = DeviceTokenReader.get_device_tokens_by_account_ids([account.id for account in self.accounts])
+
+        assert len(device_tokens) == 1
+        assert device_tokens[0].account_id == self.accounts[1].id
+
+    def test_send_push_for_accounts_fans_out_to_every_device(self) -> None:
+        self._register_device_token(self.accounts[0].id, "token-1")
+        self._register_device_token(self.accounts[0].id, "token-2")
+        self._register_device_token(self.accounts[1].id, "token-3")
+
+        result = NotificationService.send_push_for_accounts(
+            account_ids=[account.id for account in self.accounts], params=SendPushParams(body="body", title="title")
+        )
+
+        assert result.sent_count == 3
+        assert result.failed_count == 0
+        assert self.fake_server.request_count == 3
+
+    def test_send_push_for_accounts_skips_accounts_with_push_disabled(self) -> None:
+        self._register_device_token(self.accounts[0].id, "token-1")
+        self._register_device_token(self.accounts[1].id, "token-2")
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=self.accounts[1].id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(push_enabled=False),
+        )
+
+        result = NotificationService.send_push_for_accounts(
+            account_ids=[account.id for account in self.accounts], params=SendPushParams(body="body", title="title")
+        )
+
+        assert result.sent_count == 1
+        assert self.fake_server.request_count == 1
+
+    def test_send_push_for_account_prunes_invalid_tokens(self) -> None:
+        self._register_device_token(self.accounts[0].id, "token-1")
+        self._register_device_token(self.accounts[0].id, "invalid-token")
+
+        result = NotificationService.send_push_for_account(
+            account_id=self.accounts[0].id, params=SendPushParams(body="body", title="title")
+        )
+
+        device_tokens = DeviceTokenReader.get_device_tokens_by_account_ids([self.accounts[0].id])
+        assert result.sent_count == 1
+        assert result.pruned_count == 1
+        assert [device_token.token for device_token in device_tokens] == ["token-1"]
+
+    def test_delete_account_removes_device_tokens(self) -> None:
+        self._register_device_token(self.accounts[0].id, "token-1")
+
+        AccountService.delete_account(account_id=self.accounts[0].id)
+
+        assert DeviceTokenReader.get_device_tokens_by_account_ids([self.accounts[0].id]) == []
+
+    def test_register_and_remove_device_token_api(self) -> None:
+        account = self.accounts[0]
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+            auth_headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {access_token_response.json.get('token')}",
+            }
+
+            response = client.post(
+                f"{ACCOUNT_URL}/{account.id}/device-tokens",
+                headers=auth_headers,
+                data=json.dumps({"platform": DevicePlatform.IOS, "token": "token-1"}),
+            )
+
+            assert response.status_code == 201
+            assert response.json["account_id"] == account.id
+            assert response.json["platform"] == DevicePlatform.IOS
+
+            response = client.delete(f"{ACCOUNT_URL}/{account.id}/device-tokens/token-1", headers=auth_headers)
+
+            assert response.status_code == 204
+            assert DeviceTokenReader.get_device_tokens_by_account_ids([account.id]) == []
+
+    def test_register_device_token_api_rejects_unknown_platform(self) -> None:
+        account = self.accounts[0]
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+
+            response = client.post(
+                f"{ACCOUNT_URL}/{account.id}/device-tokens",
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {access_token_response.json.get('token')}",
+                },
+                data=json.dumps({"platform": "blackberry", "token": "token-1"}),
+            )
+
+            assert response.status_code == 400
@@ -0,0 +1,76 @@
+import time
+
+from modules.application.common.bounded_cache import BoundedTTLCache
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestBoundedTTLCache(BaseTestApplication):
+    def test_get_returns_cached_value_and_counts_hits(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_entry_expires_at_given_timestamp(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=2)
+        cache.set("expired", 1, expires_at=time.time() - 1)
+        cache.set("fresh", 2, expires_at=time.time() + 60)
+
+        assert cache.get("expired") is None
+        assert cache.get("fresh") == 2
+        assert cache.stats().size == 1
+
+    def test_default_ttl_applies_when_no_expiry_given(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=2, ttl_in_seconds=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_resize_evicts_overflow(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=3)
+        for index, key in enumerate(["a", "b", "c"]):
+            cache.set(key, index)
+
+        cache.resize(max_size=1)
+
+        assert cache.stats().size == 1
+        assert cache.get("c") == 2
+
+    def test_get_expired_keys_scans_least_recently_used_entries(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=4)
+        cache.set("expired_1", 1, expires_at=time.time() - 1)
+        cache.set("fresh", 2, expires_at=time.time() + 60)
+        cache.set("expired_2", 3, expires_at=time.time() - 1)
+        cache.set("expired_3", 4, expires_at=time.time() - 1)
+
+        assert cache.get_expired_keys(scan_limit=3) == ["expired_1", "expired_2"]
+        assert cache.stats().size == 4
+
+    def test_resize_keeps_default_ttl_unless_given(self) -> None:
+        cache: BoundedTTLCache[str, int] = BoundedTTLCache(max_size=2, ttl_in_seconds=0)
+
+        cache.resize(max_size=3)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+        cache.resize(max_size=3, ttl_in_seconds=None)
+        cache.set("b", 2)
+        assert cache.get("b") == 2
@@ -3,6 +3,10 @@ from typing import Callable
 
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.otp.store.used_otp_repository import UsedOTPRepository
+from modules.authentication.internals.rate_limit.store.rate_limit_bucket_repository import RateLimitBucketRepository
+from modules.authentication.internals.refresh_token.store.refresh_token_repository import RefreshTokenRepository
+from modules.authentication.internals.token_epoch.store.token_epoch_repository import TokenEpochRepository
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 
 
@@ -15,3 +19,7 @@ class BaseTestAccessToken(unittest.TestCase):
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
         OTPRepository.collection().delete_many({})
+        UsedOTPRepository.collection().delete_many({})
+        RateLimitBucketRepository.collection().delete_many({})
+        RefreshTokenRepository.collection().delete_many({})
+        TokenEpochRepository.collection().delete_many({})
@@ -13,7 +13,7 @@ from modules.account.types import (
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 from modules.authentication.authentication_service import AuthenticationService
-from modules.authentication.types import CreateOTPParams, OTPErrorCode, VerifyOTPParams
+from modules.authentication.types import AccessTokenErrorCode, CreateOTPParams, OTPErrorCode, VerifyOTPParams
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
 API_URL = "http://127.0.0.1:8080/api/access-tokens"
@@ -172,3 +172,29 @@ class TestAccessTokenApi(BaseTestAccessToken):
             assert response.json.get("token")
             assert response.json.get("account_id") == account.id
             assert response.json.get("expires_at")
+
+    def test_get_access_token_by_refresh_token(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+
+        with app.test_client() as client:
+            response = client.post(
+                API_URL, headers=HEADERS, data=json.dumps({"refresh_token": access_token.refresh_token})
+            )
+            assert response.status_code == 201
+            assert response.json
+            assert response.json.get("token")
+            assert response.json.get("account_id") == account.id
+            assert response.json.get("refresh_token")
+            assert response.json.get("refresh_token") != access_token.refresh_token
+
+    def test_get_access_token_with_invalid_refresh_token(self) -> None:
+        with app.test_client() as client:
+            response = client.post(API_URL, headers=HEADERS, data=json.dumps({"refresh_token": "invalid_token"}))
+            assert response.status_code == 401
+            assert response.json
+            assert response.json.get("code") == AccessTokenErrorCode.REFRESH_TOKEN_INVALID
@@ -1,3 +1,9 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import jwt
+from bson.objectid import ObjectId
+
 from modules.account.account_service import AccountService
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -6,7 +12,24 @@ from modules.account.types import (
     PhoneNumber,
 )
 from modules.authentication.authentication_service import AuthenticationService
-from modules.authentication.types import CreateOTPParams, OTPBasedAuthAccessTokenRequestParams
+from modules.authentication.errors import (
+    AccessTokenExpiredError,
+    OTPExpiredError,
+    OTPIncorrectError,
+    RefreshTokenInvalidError,
+)
+from modules.authentication.internals.otp.otp_util import OTPUtil
+from modules.authentication.internals.otp.stateless_otp_util import StatelessOTPUtil
+from modules.authentication.internals.otp.store.otp_repository import OTP_TTL_INDEX_NAME, OTPRepository
+from modules.authentication.types import (
+    CreateOTPParams,
+    OTPBasedAuthAccessTokenRequestParams,
+    OTPStatus,
+    RefreshTokenBasedAuthAccessTokenRequestParams,
+    VerifyOTPParams,
+)
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
 
@@ -22,7 +45,8 @@ class TestAuthenticationService(BaseTestAccessToken):
 
         assert access_token.account_id == account.id
         assert access_token.token
-        assert access_token.expires_at
+        assert datetime.fromisoformat(access_token.expires_at).utcoffset() == timedelta(0)
+        assert datetime.fromisoformat(access_token.refresh_token_expires_at).utcoffset() == timedelta(0)
 
     def test_verify_access_token_by_username_and_password(self) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -76,3 +100,189 @@ class TestAuthenticationService(BaseTestAccessToken):
         verified_access_token = AuthenticationService.verify_access_token(token=access_token.token)
 
         assert verified_access_token.account_id == account.id
+
+    def test_verify_access_token_is_served_from_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+
+        AuthenticationService.verify_access_token(token=access_token.token)
+        stats_before = AuthenticationService.get_verified_access_token_cache_stats()
+        verified_access_token = AuthenticationService.verify_access_token(token=access_token.token)
+        stats_after = AuthenticationService.get_verified_access_token_cache_stats()
+
+        assert verified_access_token.account_id == account.id
+        assert stats_after.hits == stats_before.hits + 1
+        assert stats_after.misses == stats_before.misses
+
+    def test_verify_expired_access_token_is_not_cached(self) -> None:
+        expired_token = jwt.encode(
+            {"account_id": "account_id", "exp": (datetime.now() - timedelta(days=1)).timestamp()},
+            ConfigService[str].get_value(key="accounts.token_signing_key"),
+            algorithm="HS256",
+        )
+
+        for _ in range(2):
+            try:
+                AuthenticationService.verify_access_token(token=expired_token)
+                assert False, "Expected AccessTokenExpiredError to be raised"
+            except AccessTokenExpiredError as exc:
+                assert exc.http_code == 401
+
+    def test_get_access_token_by_refresh_token_rotates_refresh_token(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+
+        refreshed_access_token = AuthenticationService.create_access_token_by_refresh_token(
+            params=RefreshTokenBasedAuthAccessTokenRequestParams(refresh_token=access_token.refresh_token)
+        )
+
+        assert refreshed_access_token.account_id == account.id
+        assert refreshed_access_token.refresh_token != access_token.refresh_token
+        assert AuthenticationService.verify_access_token(token=refreshed_access_token.token).account_id == account.id
+
+    def test_reused_refresh_token_revokes_all_refresh_tokens_of_account(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        refreshed_access_token = AuthenticationService.create_access_token_by_refresh_token(
+            params=RefreshTokenBasedAuthAccessTokenRequestParams(refresh_token=access_token.refresh_token)
+        )
+
+        for refresh_token in [access_token.refresh_token, refreshed_access_token.refresh_token]:
+            try:
+                AuthenticationService.create_access_token_by_refresh_token(
+                    params=RefreshTokenBasedAuthAccessTokenRequestParams(refresh_token=refresh_token)
+                )
+                assert False, "Expected RefreshTokenInvalidError to be raised"
+            except RefreshTokenInvalidError as exc:
+                assert exc.http_code == 401
+
+    def test_create_otp_expires_previous_otps_of_phone_number(self) -> None:
+        phone_number = {"country_code": "+91", "phone_number": "9999999999"}
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=PhoneNumber(**phone_number))
+        )
+        previous_otps = [
+            AuthenticationService.create_otp(
+                params=CreateOTPParams(phone_number=PhoneNumber(**phone_number)), account_id=account.id
+            )
+            for _ in range(2)
+        ]
+
+        latest_otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=PhoneNumber(**phone_number)), account_id=account.id
+        )
+
+        for previous_otp in previous_otps:
+            previous_otp_bson = OTPRepository.collection().find_one({"_id": ObjectId(previous_otp.id)})
+            assert previous_otp_bson["active"] is False
+            assert previous_otp_bson["status"] == OTPStatus.EXPIRED
+        latest_otp_bson = OTPRepository.collection().find_one({"_id": ObjectId(latest_otp.id)})
+        assert latest_otp_bson["active"] is True
+        assert datetime.now() - latest_otp_bson["created_at"] < timedelta(minutes=1)
+
+    def test_changed_otp_ttl_updates_existing_index(self) -> None:
+        collection = OTPRepository.collection()
+        otp_ttl_in_seconds = ConfigService.get_int(key="accounts.otp_ttl_in_seconds")
+
+        try:
+            OTPRepository._ensure_ttl_index(collection, ttl_in_seconds=60)
+            assert collection.index_information()[OTP_TTL_INDEX_NAME]["expireAfterSeconds"] == 60
+        finally:
+            OTPRepository._ensure_ttl_index(collection, ttl_in_seconds=otp_ttl_in_seconds)
+
+    @mock.patch.object(OTPUtil, "is_stateless_otp_engine", return_value=True)
+    def test_stateless_otp_is_verified_without_storing_otp(self, _) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+        )
+        otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=phone_number), account_id=account.id)
+
+        access_token = AuthenticationService.create_access_token_by_phone_number(
+            params=OTPBasedAuthAccessTokenRequestParams(otp_code=otp.otp_code, phone_number=phone_number),
+            account=account,
+        )
+
+        assert access_token.account_id == account.id
+        assert OTPRepository.collection().count_documents({}) == 0
+
+    @mock.patch.object(OTPUtil, "is_stateless_otp_engine", return_value=True)
+    def test_stateless_otp_cannot_be_replayed(self, _) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+        )
+        otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=phone_number), account_id=account.id)
+        AuthenticationService.verify_otp(params=VerifyOTPParams(otp_code=otp.otp_code, phone_number=phone_number))
+
+        with self.assertRaises(OTPExpiredError):
+            AuthenticationService.verify_otp(params=VerifyOTPParams(otp_code=otp.otp_code, phone_number=phone_number))
+
+    @mock.patch.object(OTPUtil, "is_stateless_otp_engine", return_value=True)
+    def test_stateless_otp_requested_again_in_consumed_window_is_rotated(self, _) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+        )
+
+        with mock.patch.object(StatelessOTPUtil, "get_current_time_window", return_value=100):
+            used_otp = AuthenticationService.create_otp(
+                params=CreateOTPParams(phone_number=phone_number), account_id=account.id
+            )
+            AuthenticationService.verify_otp(
+                params=VerifyOTPParams(otp_code=used_otp.otp_code, phone_number=phone_number)
+            )
+            rotated_otp = AuthenticationService.create_otp(
+                params=CreateOTPParams(phone_number=phone_number), account_id=account.id
+            )
+
+        assert rotated_otp.otp_code == StatelessOTPUtil.derive_otp_code(
+            phone_number=phone_number, time_window=100, length=4, sequence=1
+        )
+        # The first code is still within its accepted windows, it stays consumed while the rotated one is accepted
+        with mock.patch.object(StatelessOTPUtil, "get_current_time_window", return_value=101):
+            with self.assertRaises(OTPExpiredError):
+                AuthenticationService.verify_otp(
+                    params=VerifyOTPParams(otp_code=used_otp.otp_code, phone_number=phone_number)
+                )
+            AuthenticationService.verify_otp(
+                params=VerifyOTPParams(otp_code=rotated_otp.otp_code, phone_number=phone_number)
+            )
+
+    @mock.patch.object(OTPUtil, "is_stateless_otp_engine", return_value=True)
+    def test_stateless_otp_engine_requires_signing_key(self, _) -> None:
+        for signing_key in ["", "OTP_SIGNING_KEY"]:
+            with mock.patch.dict(
+                ConfigService.config_manager.config_store["accounts"]["stateless_otp"], {"signing_key": signing_key}
+            ):
+                with self.assertRaises(MissingKeyError):
+                    AuthenticationService.validate_otp_config()
+
+        AuthenticationService.validate_otp_config()
+
+    @mock.patch.object(OTPUtil, "is_stateless_otp_engine", return_value=True)
+    def test_stateless_otp_from_expired_window_is_rejected(self, _) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        expired_otp_code = StatelessOTPUtil.derive_otp_code(phone_number=phone_number, time_window=100, length=4)
+
+        with mock.patch.object(
+            StatelessOTPUtil,
+            "get_current_time_window",
+            return_value=100 + StatelessOTPUtil.get_accepted_previous_windows() + 1,
+        ):
+            with self.assertRaises(OTPIncorrectError):
+                AuthenticationService.verify_otp(
+                    params=VerifyOTPParams(otp_code=expired_otp_code, phone_number=phone_number)
+                )
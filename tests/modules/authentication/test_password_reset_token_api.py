@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest import mock
 
@@ -276,3 +277,19 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
 
         self.assertTrue(mock_send_email.called)
         self.assertTrue(mock_send_email.call_args.kwargs["bypass_preferences"])
+
+    def test_password_reset_token_is_stored_as_sha256_digest(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+
+        password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, token)
+
+        self.assertEqual(password_reset_token.token, hashlib.sha256(token.encode("utf-8")).hexdigest())
+        verified_password_reset_token = AuthenticationService.verify_password_reset_token(
+            account_id=account.id, token=token
+        )
+        self.assertEqual(verified_password_reset_token.id, password_reset_token.id)
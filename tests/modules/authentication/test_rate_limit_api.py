@@ -0,0 +1,85 @@
+import json
+from unittest import mock
+
+from server import app
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.authentication.errors import RateLimitExceededError
+from modules.authentication.internals.rate_limit.rate_limit_writer import RateLimitWriter
+from modules.authentication.internals.rate_limit.store.rate_limit_bucket_repository import RateLimitBucketRepository
+from modules.authentication.types import RateLimitErrorCode, RateLimitRuleName
+from modules.config.config_service import ConfigService
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+ACCESS_TOKEN_URL = "http://127.0.0.1:8080/api/access-tokens"
+ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
+HEADERS = {"Content-Type": "application/json"}
+
+
+class TestRateLimitApi(BaseTestAccessToken):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        RateLimitWriter._in_memory_windows = None
+        self.rate_limit_config = mock.patch.dict(
+            ConfigService.config_manager.config_store["rate_limit"], {"enabled": True, "backend": "memory"}
+        )
+        self.rate_limit_config.start()
+
+    def teardown_method(self, method) -> None:
+        self.rate_limit_config.stop()
+        RateLimitWriter._in_memory_windows = None
+        super().teardown_method(method)
+
+    def test_login_is_rejected_once_username_limit_is_reached(self) -> None:
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        limit = ConfigService[int].get_value(key="rate_limit.rules.login_by_username.limit")
+
+        with app.test_client() as client:
+            for _ in range(limit):
+                response = client.post(
+                    ACCESS_TOKEN_URL,
+                    headers=HEADERS,
+                    data=json.dumps({"username": "username", "password": "invalid_password"}),
+                )
+                assert response.status_code == 401
+
+            response = client.post(
+                ACCESS_TOKEN_URL, headers=HEADERS, data=json.dumps({"username": "USERNAME", "password": "password"})
+            )
+            assert response.status_code == 429
+            assert response.json
+            assert response.json.get("code") == RateLimitErrorCode.RATE_LIMIT_EXCEEDED
+
+    def test_otp_request_is_rejected_before_creating_otp(self) -> None:
+        phone_number = {"country_code": "+91", "phone_number": "9999999999"}
+        limit = ConfigService[int].get_value(key="rate_limit.rules.otp_by_phone_number.limit")
+
+        with app.test_client() as client:
+            for _ in range(limit):
+                response = client.post(ACCOUNT_URL, headers=HEADERS, data=json.dumps({"phone_number": phone_number}))
+                assert response.status_code == 201
+
+            with mock.patch.object(AccountService, "get_or_create_account_by_phone_number") as get_or_create_account:
+                response = client.post(ACCOUNT_URL, headers=HEADERS, data=json.dumps({"phone_number": phone_number}))
+
+            assert response.status_code == 429
+            assert response.json.get("code") == RateLimitErrorCode.RATE_LIMIT_EXCEEDED
+            get_or_create_account.assert_not_called()
+
+    def test_mongo_backend_rejects_over_limit_without_counting_rejection(self) -> None:
+        limit = ConfigService[int].get_value(key="rate_limit.rules.login_by_username.limit")
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["rate_limit"], {"backend": "mongo"}):
+            for _ in range(limit):
+                RateLimitWriter.consume(rule_name=RateLimitRuleName.LOGIN_BY_USERNAME, identifier="username")
+
+            with self.assertRaises(RateLimitExceededError):
+                RateLimitWriter.consume(rule_name=RateLimitRuleName.LOGIN_BY_USERNAME, identifier="username")
+
+        buckets = list(RateLimitBucketRepository.collection().find({}))
+        assert sum(bucket["count"] for bucket in buckets) == limit
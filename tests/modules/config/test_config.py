@@ -1,5 +1,8 @@
 import os
 from typing import List
+from unittest import mock
+
+import pytest
 
 from modules.config.config_service import ConfigService
 from modules.config.errors import MissingKeyError
@@ -26,3 +29,31 @@ class TestConfig(BaseTestConfig):
 
         populated_env = os.environ.get("APP_ENV")
         assert populated_env == "testing" or populated_env == "docker-test"
+
+    def test_typed_accessors_read_flattened_keys(self) -> None:
+        assert ConfigService.get_str(key="mongodb.uri") == ConfigService[str].get_value(key="mongodb.uri")
+        assert ConfigService.get_list(key="logger.transports") == ConfigService[list].get_value(key="logger.transports")
+        assert ConfigService.get_int(key="missing.key", default=7) == 7
+
+        with pytest.raises(MissingKeyError):
+            ConfigService.get_bool(key="missing.key")
+
+    def test_sections_and_leaves_are_indexed(self) -> None:
+        mongodb_config = ConfigService[dict].get_value(key="mongodb")
+        assert mongodb_config["uri"] == ConfigService.get_str(key="mongodb.uri")
+        assert ConfigService.has_value(key="mongodb.uri")
+        assert not ConfigService.has_value(key="mongodb.uri.scheme")
+
+    def test_patched_sections_are_visible_to_lookups(self) -> None:
+        original_uri = ConfigService.get_str(key="mongodb.uri")
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["mongodb"], {"uri": "mongodb://patched/db"}):
+            assert ConfigService.get_str(key="mongodb.uri") == "mongodb://patched/db"
+
+        with mock.patch.dict(ConfigService.config_manager.config_store, {"patched": {"nested": {"enabled": True}}}):
+            assert ConfigService.get_bool(key="patched.nested.enabled") is True
+            ConfigService.config_manager.config_store["patched"]["nested"]["enabled"] = False
+            assert ConfigService.get_bool(key="patched.nested.enabled") is False
+
+        assert ConfigService.get_str(key="mongodb.uri") == original_uri
+        assert not ConfigService.has_value(key="patched.nested.enabled")
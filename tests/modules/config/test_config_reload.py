@@ -0,0 +1,117 @@
+import os
+import shutil
+import signal
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Set
+from unittest import mock
+
+from modules.authentication.internals.rate_limit.rate_limit_writer import RateLimitWriter
+from modules.config.config_service import ConfigService
+from modules.config.internals.config_manager import ConfigManager
+from modules.config.internals.config_snapshot import ConfigSnapshot
+from modules.config.internals.config_utils import ConfigUtil
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class TestConfigReload(BaseTestConfig):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.config_directory = tempfile.TemporaryDirectory()
+        shutil.copytree(ConfigUtil.get_config_directory(), self.config_directory.name, dirs_exist_ok=True)
+        shutil.rmtree(Path(self.config_directory.name) / ConfigSnapshot.DIRECTORY_NAME, ignore_errors=True)
+        self.config_directory_patcher = mock.patch.object(
+            ConfigUtil, "get_config_directory", return_value=Path(self.config_directory.name)
+        )
+        self.config_directory_patcher.start()
+        self.config_manager = ConfigManager()
+        self.app_env_config_path = Path(self.config_directory.name) / f"{os.environ.get('APP_ENV', 'development')}.yml"
+
+    def teardown_method(self, method) -> None:
+        self.config_manager.stop_reload_watcher()
+        self.config_directory_patcher.stop()
+        self.config_directory.cleanup()
+        super().teardown_method(method)
+
+    def _append_to_app_env_config(self, content: str) -> None:
+        with open(self.app_env_config_path, "a", encoding="utf-8") as config_file:
+            config_file.write(content)
+        # Move the mtime forward explicitly, filesystems with coarse timestamps would otherwise hide quick edits
+        stat = os.stat(self.app_env_config_path)
+        os.utime(self.app_env_config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_reload_swaps_config_and_notifies_subscribers(self) -> None:
+        notifications: List[Set[str]] = []
+        self.config_manager.subscribe(notifications.append)
+
+        self._append_to_app_env_config("\nreload_test:\n  value: 1\n")
+        changed_keys = self.config_manager.reload()
+
+        assert self.config_manager.get("reload_test.value") == 1
+        assert changed_keys == {"reload_test", "reload_test.value"}
+        assert notifications == [changed_keys]
+
+    def test_reload_without_changes_notifies_nobody(self) -> None:
+        notifications: List[Set[str]] = []
+        self.config_manager.subscribe(notifications.append)
+
+        assert self.config_manager.reload() == set()
+        assert notifications == []
+
+    def test_invalid_config_keeps_current_config(self) -> None:
+        mongodb_uri = self.config_manager.get("mongodb.uri")
+
+        self._append_to_app_env_config("\nmongodb: [unclosed\n")
+
+        assert self.config_manager.reload() == set()
+        assert self.config_manager.get("mongodb.uri") == mongodb_uri
+
+    def test_failing_subscriber_does_not_block_others(self) -> None:
+        notifications: List[Set[str]] = []
+        self.config_manager.subscribe(mock.Mock(side_effect=RuntimeError("subscriber failed")))
+        self.config_manager.subscribe(notifications.append)
+
+        self._append_to_app_env_config("\nreload_test:\n  value: 2\n")
+        self.config_manager.reload()
+
+        assert notifications == [{"reload_test", "reload_test.value"}]
+
+    def test_watcher_reloads_on_file_change(self) -> None:
+        reloaded = threading.Event()
+        self.config_manager.subscribe(lambda changed_keys: reloaded.set())
+        with mock.patch.object(signal, "signal"):
+            self.config_manager.start_reload_watcher(poll_interval_in_seconds=0.05)
+
+        self._append_to_app_env_config("\nreload_test:\n  value: 3\n")
+
+        assert reloaded.wait(timeout=5)
+        assert self.config_manager.get("reload_test.value") == 3
+
+    def test_watcher_reloads_on_sighup(self) -> None:
+        reloaded = threading.Event()
+        self.config_manager.subscribe(lambda changed_keys: reloaded.set())
+        previous_sighup_handler = signal.getsignal(signal.SIGHUP)
+
+        try:
+            # Polling is effectively off, so only the signal can trigger this reload
+            self.config_manager.start_reload_watcher(poll_interval_in_seconds=60)
+            self._append_to_app_env_config("\nreload_test:\n  value: 4\n")
+            os.kill(os.getpid(), signal.SIGHUP)
+
+            assert reloaded.wait(timeout=5)
+            assert self.config_manager.get("reload_test.value") == 4
+        finally:
+            signal.signal(signal.SIGHUP, previous_sighup_handler)
+
+    def test_rate_limiter_resizes_on_reload(self) -> None:
+        with (
+            mock.patch.object(ConfigService, "config_manager", self.config_manager),
+            mock.patch.object(RateLimitWriter, "_in_memory_windows", None),
+        ):
+            in_memory_windows = RateLimitWriter._get_in_memory_windows()
+
+            self._append_to_app_env_config("\nrate_limit:\n  memory_max_keys: 5\n")
+            self.config_manager.reload()
+
+            assert in_memory_windows.stats().max_size == 5
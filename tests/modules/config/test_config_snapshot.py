@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from modules.config.internals.config_manager import ConfigManager
+from modules.config.internals.config_snapshot import ConfigSnapshot
+from modules.config.internals.config_utils import ConfigUtil
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class TestConfigSnapshot(BaseTestConfig):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.config_directory = tempfile.TemporaryDirectory()
+        shutil.copytree(ConfigUtil.get_config_directory(), self.config_directory.name, dirs_exist_ok=True)
+        shutil.rmtree(Path(self.config_directory.name) / ConfigSnapshot.DIRECTORY_NAME, ignore_errors=True)
+        self.config_directory_patcher = mock.patch.object(
+            ConfigUtil, "get_config_directory", return_value=Path(self.config_directory.name)
+        )
+        self.config_directory_patcher.start()
+
+    def teardown_method(self, method) -> None:
+        self.config_directory_patcher.stop()
+        self.config_directory.cleanup()
+        super().teardown_method(method)
+
+    def _touch_config_file(self, filename: str, content: str) -> None:
+        config_path = Path(self.config_directory.name) / filename
+        with open(config_path, "a", encoding="utf-8") as config_file:
+            config_file.write(content)
+        # Some filesystems have coarse mtimes, so the edit is also made visible through the size
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    def test_snapshot_is_missing_until_built(self) -> None:
+        assert ConfigSnapshot.load() is None
+
+        ConfigSnapshot.build()
+
+        assert ConfigSnapshot.load() is not None
+
+    def test_config_from_snapshot_matches_yaml(self) -> None:
+        yaml_config_store = ConfigManager().config_store
+
+        ConfigSnapshot.build()
+        with mock.patch.object(ConfigUtil, "read_yml_from_config_dir", side_effect=AssertionError("YAML was read")):
+            snapshot_config_store = ConfigManager().config_store
+
+        assert snapshot_config_store == yaml_config_store
+
+    def test_environment_variables_are_resolved_at_load(self) -> None:
+        ConfigSnapshot.build()
+
+        with mock.patch.dict(os.environ, {"MAILER_TRANSPORT": "smtp"}):
+            config_manager = ConfigManager()
+
+        assert config_manager.get("mailer.transport") == "smtp"
+
+    def test_stale_snapshot_falls_back_to_yaml(self) -> None:
+        ConfigSnapshot.build()
+        self._touch_config_file(f"{os.environ.get('APP_ENV', 'development')}.yml", "\nsnapshot_test:\n  stale: true\n")
+
+        assert ConfigSnapshot.load() is None
+        assert ConfigManager().get("snapshot_test.stale") is True
@@ -0,0 +1,109 @@
+import logging
+import threading
+from typing import List
+from unittest import mock
+
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLog
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_handler import DatadogHandler
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class TestDatadogHandler(BaseTestLogger):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.config_patcher = mock.patch.dict(
+            ConfigService.config_manager.config_store,
+            {
+                "datadog": {
+                    "api_key": "fake-datadog-api-key",
+                    "app_name": "backend",
+                    "batch_size": 3,
+                    "flush_interval_in_seconds": 0.05,
+                    "queue_max_size": 5,
+                    "site_name": "datadoghq.com",
+                }
+            },
+        )
+        self.config_patcher.start()
+        self.submitted_batches: List[List[str]] = []
+        self.submit_log_patcher = mock.patch.object(LogsApi, "submit_log", autospec=True, side_effect=self._submit_log)
+        self.submit_log_patcher.start()
+        self.handler = DatadogHandler("flask")
+
+    def teardown_method(self, method) -> None:
+        self.handler.close()
+        self.submit_log_patcher.stop()
+        self.config_patcher.stop()
+        super().teardown_method(method)
+
+    def _submit_log(self, logs_api: LogsApi, body: HTTPLog, **kwargs) -> dict:
+        self.submitted_batches.append([log_item.message for log_item in body.value])
+        return {}
+
+    def _emit(self, message: str, level: int = logging.INFO) -> None:
+        self.handler.emit(logging.LogRecord("test", level, __file__, 1, message, None, None))
+
+    def test_records_are_shipped_in_size_bounded_batches(self) -> None:
+        for index in range(5):
+            self._emit(f"message {index}")
+
+        self.handler.flush()
+
+        assert self.submitted_batches == [["message 0", "message 1", "message 2"], ["message 3", "message 4"]]
+        assert self.handler.get_stats().sent_records == 5
+
+    def test_partial_batch_is_shipped_after_flush_interval(self) -> None:
+        shipped = threading.Event()
+        self.submit_log_patcher.stop()
+        self.submit_log_patcher = mock.patch.object(
+            LogsApi, "submit_log", autospec=True, side_effect=lambda *args, **kwargs: shipped.set()
+        )
+        self.submit_log_patcher.start()
+
+        self._emit("lonely message")
+
+        assert shipped.wait(timeout=5)
+
+    def test_full_queue_drops_records_instead_of_blocking(self) -> None:
+        release_sender = threading.Event()
+
+        def blocked_submit_log(logs_api: LogsApi, body: HTTPLog, **kwargs) -> dict:
+            release_sender.wait(timeout=5)
+            return self._submit_log(logs_api, body, **kwargs)
+
+        self.submit_log_patcher.stop()
+        self.submit_log_patcher = mock.patch.object(
+            LogsApi, "submit_log", autospec=True, side_effect=blocked_submit_log
+        )
+        self.submit_log_patcher.start()
+
+        for index in range(20):
+            self._emit(f"message {index}")
+        dropped_records = self.handler.get_stats().dropped_records
+        release_sender.set()
+        self.handler.flush()
+
+        assert dropped_records > 0
+        assert any("dropped" in message for batch in self.submitted_batches for message in batch)
+
+    def test_failed_batches_are_counted(self) -> None:
+        self.submit_log_patcher.stop()
+        self.submit_log_patcher = mock.patch.object(
+            LogsApi, "submit_log", autospec=True, side_effect=RuntimeError("Datadog is down")
+        )
+        self.submit_log_patcher.start()
+
+        self._emit("message")
+        self.handler.flush()
+
+        assert self.handler.get_stats().failed_batches == 1
+
+    def test_close_ships_pending_records(self) -> None:
+        self._emit("message before shutdown", logging.ERROR)
+
+        self.handler.close()
+
+        assert self.submitted_batches == [["message before shutdown"]]
@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+import uuid
+from typing import List
+
+from modules.logger.internal.log_queue import LogQueue
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self, *, release_event: threading.Event) -> None:
+        super().__init__()
+        self.release_event = release_event
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.release_event.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+class TestLogQueue(BaseTestLogger):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.release_event = threading.Event()
+        self.handler = CollectingHandler(release_event=self.release_event)
+        self.logger = logging.getLogger(f"test_log_queue.{uuid.uuid4()}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def test_records_are_handled_on_the_listener_thread(self) -> None:
+        log_queue = LogQueue(logger=self.logger, max_size=100)
+        self.release_event.set()
+
+        self.logger.info("first")
+        self.logger.info("second")
+        log_queue.stop()
+
+        assert self.handler.messages == ["first", "second"]
+        assert self.logger.handlers != [self.handler]
+
+    def test_full_queue_drops_records_without_blocking(self) -> None:
+        log_queue = LogQueue(logger=self.logger, max_size=2)
+
+        started_at = time.monotonic()
+        for index in range(10):
+            self.logger.info(f"message {index}")
+        elapsed = time.monotonic() - started_at
+
+        stats = log_queue.get_stats()
+        self.release_event.set()
+        log_queue.stop()
+
+        assert elapsed < 1
+        assert stats.dropped_records > 0
+        assert len(self.handler.messages) + stats.dropped_records == 10
+
+    def test_stop_drains_a_full_queue(self) -> None:
+        log_queue = LogQueue(logger=self.logger, max_size=3)
+        for index in range(3):
+            self.logger.info(f"message {index}")
+
+        threading.Timer(0.1, self.release_event.set).start()
+        log_queue.stop()
+
+        assert self.handler.messages[-1] == "message 2"
+        assert log_queue.get_stats().queued_records == 0
+
+    def test_handler_levels_are_respected(self) -> None:
+        self.handler.setLevel(logging.ERROR)
+        log_queue = LogQueue(logger=self.logger, max_size=100)
+        self.release_event.set()
+
+        self.logger.info("ignored")
+        self.logger.error("kept")
+        log_queue.stop()
+
+        assert self.handler.messages == ["kept"]
@@ -0,0 +1,113 @@
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+FCM_MESSAGES_SEND_PATH_REGEX = re.compile(r"^/v1/projects/(?P<project_id>[^/]+)/messages:send$")
+SENDGRID_MAIL_SEND_PATH = "/v3/mail/send"
+TWILIO_MESSAGES_PATH_REGEX = re.compile(r"^/2010-04-01/Accounts/(?P<account_sid>[^/]+)/Messages\.json$")
+
+
+class FakeNotificationProviderServer:
+    """
+    Local stand-in for the SendGrid mail send, Twilio messages and FCM send endpoints. Every request fails with
+    `error_status_code` when it is set. FCM tokens starting with `invalid` are answered as unregistered.
+    """
+
+    def __init__(self) -> None:
+        self.error_status_code: Optional[int] = None
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeNotificationProviderServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _record_request(self) -> None:
+        with self._lock:
+            self.request_count += 1
+
+    def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+        fake_server = self
+
+        class FakeNotificationProviderHandler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections alive, so the tests exercise the pooled transport
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                request_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                fake_server._record_request()
+
+                fcm_path_match = FCM_MESSAGES_SEND_PATH_REGEX.match(self.path)
+                twilio_path_match = TWILIO_MESSAGES_PATH_REGEX.match(self.path)
+                if fake_server.error_status_code is not None:
+                    self._send_json(
+                        fake_server.error_status_code,
+                        {
+                            "code": 20500,
+                            "message": "Injected provider failure",
+                            "status": fake_server.error_status_code,
+                        },
+                    )
+                elif self.path == SENDGRID_MAIL_SEND_PATH:
+                    self._send_json(202, None)
+                elif twilio_path_match:
+                    self._send_json(
+                        201,
+                        {
+                            "account_sid": twilio_path_match.group("account_sid"),
+                            "sid": f"SM{uuid.uuid4().hex}",
+                            "status": "accepted",
+                        },
+                    )
+                elif fcm_path_match:
+                    self._send_fcm_response(fcm_path_match.group("project_id"), request_body)
+                else:
+                    self._send_json(404, {"message": f"Unknown path {self.path}"})
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _send_fcm_response(self, project_id: str, request_body: bytes) -> None:
+                token = json.loads(request_body or b"{}").get("message", {}).get("token", "")
+                if token.startswith("invalid"):
+                    self._send_json(
+                        404,
+                        {
+                            "error": {
+                                "code": 404,
+                                "details": [
+                                    {
+                                        "@type": "type.googleapis.com/google.firebase.fcm.v1.FcmError",
+                                        "errorCode": "UNREGISTERED",
+                                    }
+                                ],
+                                "message": "Requested entity was not found.",
+                                "status": "NOT_FOUND",
+                            }
+                        },
+                    )
+                else:
+                    self._send_json(200, {"name": f"projects/{project_id}/messages/{uuid.uuid4().hex}"})
+
+            def _send_json(self, status_code: int, body: Optional[dict]) -> None:
+                encoded_body = json.dumps(body).encode("utf-8") if body is not None else b""
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded_body)))
+                self.end_headers()
+                self.wfile.write(encoded_body)
+
+        return FakeNotificationProviderHandler
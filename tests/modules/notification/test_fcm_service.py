@@ -0,0 +1,64 @@
+from unittest import mock
+
+from modules.notification.internals.fcm_service import FcmService
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.types import NotificationProvider, PushDeliveryStatus, SendPushParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+from tests.modules.notification.fake_notification_provider_server import FakeNotificationProviderServer
+
+
+class TestFcmService(BaseTestNotification):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.fake_server = FakeNotificationProviderServer().start()
+        self.push_params = SendPushParams(body="body", title="title", data={"screen": "inbox"})
+        # Each test starts with fresh pools and a closed circuit so earlier failures do not leak in
+        NotificationHttpTransport._pid = None
+        ProviderCallExecutor._circuit_breakers = {}
+        self.patchers = [
+            mock.patch.object(FcmService, "_get_headers", return_value={}),
+            mock.patch.object(
+                FcmService,
+                "_get_messages_send_url",
+                return_value=f"{self.fake_server.base_url}/v1/projects/test-project/messages:send",
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self, method) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.fake_server.stop()
+        ProviderCallExecutor._circuit_breakers = {}
+        super().teardown_method(method)
+
+    def test_send_push_batch_fans_out_over_pooled_connections(self) -> None:
+        tokens = [f"token-{index}" for index in range(20)]
+
+        statuses = FcmService.send_push_batch(tokens=tokens, params=self.push_params)
+
+        stats = NotificationHttpTransport.get_pool_stats(provider=NotificationProvider.PUSH)
+        assert statuses == {token: PushDeliveryStatus.SENT for token in tokens}
+        assert self.fake_server.request_count == 20
+        assert stats.requests_sent == 20
+        assert stats.connections_created <= stats.max_pool_size
+
+    def test_send_push_batch_reports_unregistered_tokens_as_invalid(self) -> None:
+        statuses = FcmService.send_push_batch(tokens=["token-1", "invalid-token"], params=self.push_params)
+
+        assert statuses == {"token-1": PushDeliveryStatus.SENT, "invalid-token": PushDeliveryStatus.INVALID_TOKEN}
+        # Invalid tokens are answered once, they are never retried
+        assert self.fake_server.request_count == 2
+
+    def test_send_push_batch_reports_provider_failures_without_raising(self) -> None:
+        self.fake_server.error_status_code = 400
+
+        statuses = FcmService.send_push_batch(tokens=["token-1", "token-2"], params=self.push_params)
+
+        assert statuses == {"token-1": PushDeliveryStatus.FAILED, "token-2": PushDeliveryStatus.FAILED}
+
+    def test_send_push_batch_without_tokens_sends_nothing(self) -> None:
+        assert FcmService.send_push_batch(tokens=[], params=self.push_params) == {}
+        assert self.fake_server.request_count == 0
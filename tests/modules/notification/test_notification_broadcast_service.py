@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+from bson.objectid import ObjectId
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.config.config_service import ConfigService
+from modules.notification.errors import NotificationBroadcastDisabledError, ValidationError
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.store.notification_broadcast_repository import NotificationBroadcastRepository
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    AccountSegment,
+    CreateNotificationBroadcastParams,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailSender,
+    NotificationBroadcastStatus,
+)
+
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestNotificationBroadcastService(BaseTestAccount):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name=f"first_name_{index}",
+                    last_name="last_name",
+                    password="password",
+                    username=f"user{index}@example.com",
+                )
+            )
+            for index in range(3)
+        ]
+        self.outbox_config_patcher = mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}
+        )
+        self.outbox_config_patcher.start()
+
+    def teardown_method(self, method) -> None:
+        self.outbox_config_patcher.stop()
+        super().teardown_method(method)
+
+    def _create_broadcast(self, segment: AccountSegment = AccountSegment()) -> str:
+        broadcast = NotificationService.create_notification_broadcast(
+            params=CreateNotificationBroadcastParams(
+                segment=segment,
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id="announcement",
+                template_data={"headline": "New feature"},
+            )
+        )
+        return broadcast.id
+
+    def _get_sent_emails(self, mock_send_bulk_email) -> list:
+        return [
+            bulk_recipient.recipient.email
+            for call in mock_send_bulk_email.call_args_list
+            for bulk_recipient in call.args[0].recipients
+        ]
+
+    def test_create_broadcast_rejects_invalid_sender(self) -> None:
+        with pytest.raises(ValidationError):
+            NotificationService.create_notification_broadcast(
+                params=CreateNotificationBroadcastParams(
+                    segment=AccountSegment(), sender=EmailSender(email="invalid", name=""), template_id="announcement"
+                )
+            )
+
+    def test_create_broadcast_rejected_when_broadcasts_are_disabled(self) -> None:
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["broadcast"], {"enabled": False}
+        ):
+            with pytest.raises(NotificationBroadcastDisabledError):
+                self._create_broadcast()
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_broadcast_skips_accounts_with_email_disabled(self, mock_send_bulk_email) -> None:
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=self.accounts[1].id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+        )
+        broadcast_id = self._create_broadcast()
+
+        broadcast = NotificationService.run_next_notification_broadcast()
+
+        assert broadcast.id == broadcast_id
+        assert broadcast.status == NotificationBroadcastStatus.COMPLETED
+        assert broadcast.processed_count == 3
+        assert broadcast.sent_count == 2
+        assert broadcast.skipped_count == 1
+        assert self._get_sent_emails(mock_send_bulk_email) == ["user0@example.com", "user2@example.com"]
+        first_recipient = mock_send_bulk_email.call_args.args[0].recipients[0]
+        assert first_recipient.template_data == {
+            "first_name": "first_name_0",
+            "headline": "New feature",
+            "last_name": "last_name",
+        }
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_broadcast_sends_one_bulk_email_per_chunk(self, mock_send_bulk_email) -> None:
+        self._create_broadcast()
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["broadcast"], {"chunk_size": 2}):
+            broadcast = NotificationService.run_next_notification_broadcast()
+
+        assert mock_send_bulk_email.call_count == 2
+        assert broadcast.sent_count == 3
+        assert broadcast.last_account_id == self.accounts[2].id
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_broadcast_only_targets_segment(self, mock_send_bulk_email) -> None:
+        self._create_broadcast(AccountSegment(account_ids=[self.accounts[0].id, self.accounts[2].id]))
+
+        broadcast = NotificationService.run_next_notification_broadcast()
+
+        assert broadcast.processed_count == 2
+        assert self._get_sent_emails(mock_send_bulk_email) == ["user0@example.com", "user2@example.com"]
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_failed_broadcast_resumes_from_checkpoint(self, mock_send_bulk_email) -> None:
+        broadcast_id = self._create_broadcast()
+        mock_send_bulk_email.side_effect = [[], Exception("provider down")]
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["broadcast"], {"chunk_size": 1}):
+            failed_broadcast = NotificationService.run_next_notification_broadcast()
+
+            assert failed_broadcast.status == NotificationBroadcastStatus.PENDING
+            assert failed_broadcast.attempts == 1
+            assert failed_broadcast.last_error == "provider down"
+            assert failed_broadcast.last_account_id == self.accounts[0].id
+            # The retry waits for its backoff before it can be claimed again
+            assert NotificationService.run_next_notification_broadcast() is None
+
+            mock_send_bulk_email.side_effect = None
+            NotificationBroadcastRepository.collection().update_one(
+                {"status": NotificationBroadcastStatus.PENDING},
+                {"$set": {"lease_expires_at": datetime.now() - timedelta(seconds=1)}},
+            )
+            resumed_broadcast = NotificationService.run_next_notification_broadcast()
+
+        assert resumed_broadcast.id == broadcast_id
+        assert resumed_broadcast.status == NotificationBroadcastStatus.COMPLETED
+        assert resumed_broadcast.sent_count == 3
+        # The failed chunk is sent again, the chunk before the checkpoint is not
+        assert self._get_sent_emails(mock_send_bulk_email) == [
+            "user0@example.com",
+            "user1@example.com",
+            "user1@example.com",
+            "user2@example.com",
+        ]
+
+    @mock.patch.object(SendGridService, "send_bulk_email")
+    def test_broadcast_stops_after_losing_its_lease(self, mock_send_bulk_email) -> None:
+        self._create_broadcast()
+
+        def reclaim_broadcast(*args, **kwargs) -> list:
+            # Another worker claims the broadcast while the first chunk is still being sent
+            NotificationBroadcastRepository.collection().update_one({}, {"$set": {"claim_id": ObjectId()}})
+            return []
+
+        mock_send_bulk_email.side_effect = reclaim_broadcast
+        with mock.patch.dict(ConfigService.config_manager.config_store["notification"]["broadcast"], {"chunk_size": 1}):
+            broadcast = NotificationService.run_next_notification_broadcast()
+
+        assert mock_send_bulk_email.call_count == 1
+        assert broadcast.status == NotificationBroadcastStatus.RUNNING
+        assert broadcast.processed_count == 0
+
+    def test_run_next_broadcast_without_pending_broadcasts(self) -> None:
+        assert NotificationService.run_next_notification_broadcast() is None
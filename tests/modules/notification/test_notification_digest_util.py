@@ -0,0 +1,116 @@
+from dataclasses import asdict
+from unittest import mock
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.internals.notification_digest_util import MAX_SMS_BODY_LENGTH, NotificationDigestUtil
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationDigest,
+    SendEmailParams,
+    SendSMSParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+def get_email_payload(index: int) -> dict:
+    return asdict(
+        SendEmailParams(
+            recipient=EmailRecipient(email="recipient@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id=f"template_{index}",
+            template_data={"task": f"task_{index}"},
+        )
+    )
+
+
+def get_sms_payload(message_body: str) -> dict:
+    return asdict(
+        SendSMSParams(
+            message_body=message_body, recipient_phone=PhoneNumber(country_code="+1", phone_number="5555555555")
+        )
+    )
+
+
+class TestNotificationDigestUtil(BaseTestNotification):
+    def test_single_buffered_email_is_sent_unchanged(self) -> None:
+        digest = NotificationDigest(
+            account_id="account_id",
+            channel=NotificationChannel.EMAIL,
+            id="id",
+            items=[get_email_payload(0)],
+            total_count=1,
+        )
+
+        email_params = NotificationDigestUtil.convert_digest_to_send_email_params(digest)
+
+        assert email_params.template_id == "template_0"
+        assert email_params.template_data == {"task": "task_0"}
+
+    def test_buffered_emails_are_combined_with_digest_template(self) -> None:
+        digest = NotificationDigest(
+            account_id="account_id",
+            channel=NotificationChannel.EMAIL,
+            id="id",
+            items=[get_email_payload(index) for index in range(2)],
+            total_count=5,
+        )
+
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["digest"], {"email_template_id": "digest"}
+        ):
+            email_params = NotificationDigestUtil.convert_digest_to_send_email_params(digest)
+
+        assert email_params.template_id == "digest"
+        assert email_params.recipient.email == "recipient@example.com"
+        assert email_params.template_data == {
+            "notification_count": 5,
+            "notifications": [
+                {"template_data": {"task": "task_0"}, "template_id": "template_0"},
+                {"template_data": {"task": "task_1"}, "template_id": "template_1"},
+            ],
+        }
+
+    def test_email_digest_requires_template(self) -> None:
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["digest"],
+            {"email_template_id": "", "enabled": True},
+        ):
+            assert NotificationDigestUtil.is_digest_enabled()
+            assert not NotificationDigestUtil.is_email_digest_enabled()
+
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["digest"],
+            {"email_template_id": "digest", "enabled": True},
+        ):
+            assert NotificationDigestUtil.is_email_digest_enabled()
+
+    def test_buffered_sms_are_combined_into_one_message(self) -> None:
+        digest = NotificationDigest(
+            account_id="account_id",
+            channel=NotificationChannel.SMS,
+            id="id",
+            items=[get_sms_payload("first"), get_sms_payload("second")],
+            total_count=2,
+        )
+
+        sms_params = NotificationDigestUtil.convert_digest_to_send_sms_params(digest)
+
+        assert sms_params.message_body == "You have 2 new notifications:\n- first\n- second"
+        assert sms_params.recipient_phone.phone_number == "5555555555"
+
+    def test_sms_digest_is_truncated_to_provider_limit(self) -> None:
+        digest = NotificationDigest(
+            account_id="account_id",
+            channel=NotificationChannel.SMS,
+            id="id",
+            items=[get_sms_payload("x" * 500) for _ in range(5)],
+            total_count=5,
+        )
+
+        sms_params = NotificationDigestUtil.convert_digest_to_send_sms_params(digest)
+
+        assert len(sms_params.message_body) == MAX_SMS_BODY_LENGTH
+        assert sms_params.message_body.endswith("...")
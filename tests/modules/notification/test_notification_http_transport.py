@@ -0,0 +1,83 @@
+from unittest import mock
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_transport import NotificationHttpTransport
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import EmailRecipient, EmailSender, NotificationProvider, SendEmailParams, SendSMSParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+from tests.modules.notification.fake_notification_provider_server import FakeNotificationProviderServer
+
+
+class TestNotificationHttpTransport(BaseTestNotification):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.fake_server = FakeNotificationProviderServer().start()
+        self.email_params = SendEmailParams(
+            recipient=EmailRecipient(email="recipient@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="template_id",
+        )
+        # Each test starts with fresh pools so the stats only count its own requests
+        NotificationHttpTransport._pid = None
+        self.patchers = [
+            mock.patch.object(SendGridService, "_get_headers", return_value={}),
+            mock.patch.object(
+                SendGridService, "_get_mail_send_url", return_value=f"{self.fake_server.base_url}/v3/mail/send"
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self, method) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.fake_server.stop()
+        super().teardown_method(method)
+
+    def test_get_session_returns_one_session_per_provider(self) -> None:
+        sendgrid_session = NotificationHttpTransport.get_session(provider=NotificationProvider.SENDGRID)
+
+        assert NotificationHttpTransport.get_session(provider=NotificationProvider.SENDGRID) is sendgrid_session
+        assert NotificationHttpTransport.get_session(provider=NotificationProvider.TWILIO) is not sendgrid_session
+
+    def test_requests_reuse_pooled_connection(self) -> None:
+        for _ in range(3):
+            SendGridService.send_email(self.email_params)
+
+        stats = NotificationHttpTransport.get_pool_stats(provider=NotificationProvider.SENDGRID)
+        assert self.fake_server.request_count == 3
+        assert stats.requests_sent == 3
+        assert stats.connections_created == 1
+
+    def test_error_response_raises_service_error_with_response_body(self) -> None:
+        self.fake_server.error_status_code = 400
+
+        with pytest.raises(ServiceError) as exc_info:
+            SendGridService.send_email(self.email_params)
+
+        assert "Injected provider failure" in exc_info.value.message
+        assert exc_info.value.http_status_code == 503
+
+    def test_send_sms_uses_configured_twilio_base_url(self) -> None:
+        twilio_config = {
+            "account_sid": "ACfake",
+            "auth_token": "fake-auth-token",
+            "base_url": self.fake_server.base_url,
+            "messaging_service_sid": "MGfake",
+        }
+
+        with mock.patch.dict(ConfigService.config_manager.config_store["twilio"], twilio_config):
+            with mock.patch.object(TwilioService, "_TwilioService__client", None):
+                TwilioService.send_sms(
+                    SendSMSParams(
+                        message_body="message",
+                        recipient_phone=PhoneNumber(country_code="+1", phone_number="2124567890"),
+                    )
+                )
+
+        assert self.fake_server.request_count == 1
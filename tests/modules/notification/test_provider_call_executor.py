@@ -0,0 +1,138 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ProviderUnavailableError, ServiceError
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.types import CircuitBreakerState
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+TEST_PROVIDER = "test_provider"
+
+
+def get_http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+class TestProviderCircuitBreaker(BaseTestNotification):
+    def test_circuit_opens_after_failure_threshold(self) -> None:
+        circuit_breaker = ProviderCircuitBreaker(
+            provider=TEST_PROVIDER, failure_threshold=2, reset_timeout_in_seconds=30, half_open_max_calls=1
+        )
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == CircuitBreakerState.CLOSED
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        assert circuit_breaker.allow_call() is False
+        assert circuit_breaker.rejected_count == 1
+
+    def test_half_open_circuit_allows_limited_trial_calls(self) -> None:
+        circuit_breaker = ProviderCircuitBreaker(
+            provider=TEST_PROVIDER, failure_threshold=1, reset_timeout_in_seconds=0, half_open_max_calls=1
+        )
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.allow_call() is True
+        assert circuit_breaker.state == CircuitBreakerState.HALF_OPEN
+        assert circuit_breaker.allow_call() is False
+
+        circuit_breaker.record_success()
+        assert circuit_breaker.state == CircuitBreakerState.CLOSED
+        assert circuit_breaker.allow_call() is True
+
+    def test_failed_trial_call_reopens_circuit(self) -> None:
+        circuit_breaker = ProviderCircuitBreaker(
+            provider=TEST_PROVIDER, failure_threshold=1, reset_timeout_in_seconds=0, half_open_max_calls=1
+        )
+        circuit_breaker.record_failure()
+        circuit_breaker.allow_call()
+
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        assert circuit_breaker.opened_count == 2
+
+
+@mock.patch("modules.notification.internals.provider_call_executor.time.sleep")
+class TestProviderCallExecutor(BaseTestNotification):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        ProviderCallExecutor._circuit_breakers.pop(TEST_PROVIDER, None)
+        ProviderCallExecutor._retry_counts.pop(TEST_PROVIDER, None)
+
+    def test_execute_retries_transient_failures(self, mock_sleep) -> None:
+        call = mock.Mock(side_effect=[requests.ConnectionError("connection reset"), get_http_error(503), "sent"])
+
+        assert ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call) == "sent"
+
+        assert call.call_count == 3
+        assert mock_sleep.call_count == 2
+        stats = ProviderCallExecutor.get_call_stats(provider=TEST_PROVIDER)
+        assert stats.retry_count == 2
+        assert stats.consecutive_failures == 0
+
+    def test_execute_does_not_retry_rejected_requests(self, mock_sleep) -> None:
+        call = mock.Mock(side_effect=get_http_error(400))
+
+        with pytest.raises(ServiceError):
+            ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call)
+
+        assert call.call_count == 1
+        assert not mock_sleep.called
+
+    def test_execute_stops_retrying_when_time_budget_is_spent(self, mock_sleep) -> None:
+        call = mock.Mock(side_effect=requests.Timeout("read timed out"))
+
+        with mock.patch.object(ProviderCallExecutor, "_get_retry_delay", return_value=10):
+            with pytest.raises(ServiceError):
+                ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call)
+
+        assert call.call_count == 1
+
+    def test_execute_fails_fast_while_circuit_is_open(self, mock_sleep) -> None:
+        call = mock.Mock(side_effect=requests.ConnectionError("connection refused"))
+        for _ in range(2):
+            with pytest.raises(ServiceError):
+                ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call)
+        call_count = call.call_count
+
+        with pytest.raises(ProviderUnavailableError) as exc_info:
+            ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call)
+
+        assert call.call_count == call_count
+        assert TEST_PROVIDER in exc_info.value.message
+        stats = ProviderCallExecutor.get_call_stats(provider=TEST_PROVIDER)
+        assert stats.circuit_state == CircuitBreakerState.OPEN
+        assert stats.rejected_count >= 1
+
+    def test_execute_passes_remaining_time_budget_to_each_attempt(self, mock_sleep) -> None:
+        call = mock.Mock(side_effect=[requests.Timeout("read timed out"), "sent"])
+
+        with mock.patch.dict(
+            ConfigService.config_manager.config_store["notification"]["retry"], {"time_budget_in_seconds": 4}
+        ):
+            ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=call)
+
+        timeouts = [call_args.args[0] for call_args in call.call_args_list]
+        assert all(0 < timeout_in_seconds <= 4 for timeout_in_seconds in timeouts)
+        assert timeouts[1] <= timeouts[0]
+
+    def test_execute_releases_trial_slot_on_unexpected_error(self, mock_sleep) -> None:
+        circuit_breaker = ProviderCircuitBreaker(
+            provider=TEST_PROVIDER, failure_threshold=1, reset_timeout_in_seconds=0, half_open_max_calls=1
+        )
+        circuit_breaker.record_failure()
+        ProviderCallExecutor._circuit_breakers[TEST_PROVIDER] = circuit_breaker
+
+        with pytest.raises(ValueError):
+            ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=mock.Mock(side_effect=ValueError("bad payload")))
+
+        assert ProviderCallExecutor.execute(provider=TEST_PROVIDER, call=mock.Mock(return_value="sent")) == "sent"
+        assert circuit_breaker.state == CircuitBreakerState.CLOSED
@@ -0,0 +1,252 @@
+import os
+import socket
+import tempfile
+from email import message_from_bytes
+from unittest import mock
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult, LoginPassword
+
+from modules.authentication.authentication_service import AuthenticationService
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ServiceError, ValidationError
+from modules.notification.internals.email_template_renderer import (
+    DEFAULT_EMAIL_TEMPLATES_DIRECTORY,
+    EmailTemplateRenderer,
+)
+from modules.notification.internals.email_transport import EmailTransport
+from modules.notification.internals.provider_call_executor import ProviderCallExecutor
+from modules.notification.internals.smtp_service import SmtpService
+from modules.notification.types import (
+    BulkEmailRecipient,
+    EmailRecipient,
+    EmailSender,
+    SendBulkEmailParams,
+    SendEmailParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SMTP_USERNAME = "mailer"
+SMTP_PASSWORD = "mailer-password"
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.messages: list = []
+        self.sessions: set = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options) -> str:
+        if address.startswith("rejected"):
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.sessions.add(id(session))
+        self.messages.append(message_from_bytes(envelope.content))
+        return "250 Message accepted for delivery"
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def authenticate(server, session, envelope, mechanism, auth_data) -> AuthResult:
+    is_valid = (
+        isinstance(auth_data, LoginPassword)
+        and auth_data.login.decode() == SMTP_USERNAME
+        and auth_data.password.decode() == SMTP_PASSWORD
+    )
+    # aiosmtpd only answers 535 itself when the rejection is marked as unhandled
+    return AuthResult(success=is_valid, handled=False)
+
+
+class TestSmtpService(BaseTestNotification):
+    def setup_method(self, method) -> None:
+        super().setup_method(method)
+        self.handler = RecordingHandler()
+        self.smtp_port = get_free_port()
+        self.controller = Controller(
+            self.handler, hostname="127.0.0.1", port=self.smtp_port, authenticator=authenticate, auth_require_tls=False
+        )
+        self.controller.start()
+
+        self.templates_directory = tempfile.TemporaryDirectory()
+        self._write_template("welcome", "subject.txt", "Welcome {{ first_name }}\n")
+        self._write_template("welcome", "body.html", "<p>Hello {{ first_name }}</p>")
+        self._write_template("welcome", "body.txt", "Hello {{ first_name }}")
+
+        self.config_patchers = [
+            mock.patch.dict(
+                ConfigService.config_manager.config_store,
+                {
+                    "smtp": {
+                        "host": "127.0.0.1",
+                        "password": SMTP_PASSWORD,
+                        "pool_max_size": 2,
+                        "port": self.smtp_port,
+                        "templates_directory": self.templates_directory.name,
+                        "use_tls": False,
+                        "username": SMTP_USERNAME,
+                    }
+                },
+            ),
+            mock.patch.dict(ConfigService.config_manager.config_store["mailer"], {"transport": "smtp"}),
+        ]
+        for patcher in self.config_patchers:
+            patcher.start()
+
+        # Each test gets its own pool, template cache and circuit, so nothing leaks between tests
+        SmtpService._pool = None
+        EmailTemplateRenderer._environment = None
+        ProviderCallExecutor._circuit_breakers = {}
+
+    def teardown_method(self, method) -> None:
+        if SmtpService._pool is not None:
+            SmtpService._pool.close()
+        SmtpService._pool = None
+        EmailTemplateRenderer._environment = None
+        ProviderCallExecutor._circuit_breakers = {}
+        for patcher in self.config_patchers:
+            patcher.stop()
+        self.controller.stop()
+        self.templates_directory.cleanup()
+        super().teardown_method(method)
+
+    def _write_template(self, template_id: str, filename: str, content: str) -> None:
+        os.makedirs(os.path.join(self.templates_directory.name, template_id), exist_ok=True)
+        with open(os.path.join(self.templates_directory.name, template_id, filename), "w") as template_file:
+            template_file.write(content)
+
+    def _get_email_params(self, template_id: str = "welcome") -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(email="recipient@example.com"),
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id=template_id,
+            template_data={"first_name": "Ada"},
+        )
+
+    def test_send_email_renders_local_template(self) -> None:
+        EmailTransport.send_email(self._get_email_params())
+
+        assert len(self.handler.messages) == 1
+        message = self.handler.messages[0]
+        assert message["Subject"] == "Welcome Ada"
+        assert message["To"] == "recipient@example.com"
+        assert message["From"] == "Sender <sender@example.com>"
+        assert [part.get_content_type() for part in message.get_payload()] == ["text/plain", "text/html"]
+        assert "<p>Hello Ada</p>" in message.get_payload()[1].get_payload()
+
+    def test_messages_reuse_pooled_authenticated_connection(self) -> None:
+        for _ in range(5):
+            SmtpService.send_email(self._get_email_params())
+
+        stats = SmtpService.get_pool_stats()
+        assert len(self.handler.messages) == 5
+        assert len(self.handler.sessions) == 1
+        assert stats.connections_created == 1
+        assert stats.messages_sent == 5
+        assert stats.idle_connections == 1
+
+    def test_connection_is_recycled_after_max_messages(self) -> None:
+        with mock.patch.dict(ConfigService.config_manager.config_store["smtp"], {"max_messages_per_connection": 2}):
+            for _ in range(5):
+                SmtpService.send_email(self._get_email_params())
+
+        assert SmtpService.get_pool_stats().connections_created == 3
+
+    def test_send_bulk_email_renders_template_per_recipient(self) -> None:
+        SmtpService.send_bulk_email(
+            SendBulkEmailParams(
+                recipients=[
+                    BulkEmailRecipient(
+                        account_id=f"account_{index}",
+                        recipient=EmailRecipient(email=f"user{index}@example.com"),
+                        template_data={"first_name": f"User {index}"},
+                    )
+                    for index in range(6)
+                ],
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id="welcome",
+            )
+        )
+
+        assert sorted(message["Subject"] for message in self.handler.messages) == [
+            f"Welcome User {index}" for index in range(6)
+        ]
+        assert SmtpService.get_pool_stats().connections_created <= 2
+
+    def test_send_bulk_email_reports_failed_recipients(self) -> None:
+        failures = SmtpService.send_bulk_email(
+            SendBulkEmailParams(
+                recipients=[
+                    BulkEmailRecipient(
+                        account_id=f"account_{index}",
+                        recipient=EmailRecipient(email=email),
+                        template_data={"first_name": f"User {index}"},
+                    )
+                    for index, email in enumerate(["user0@example.com", "rejected@example.com", "user2@example.com"])
+                ],
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id="welcome",
+            )
+        )
+
+        assert len(self.handler.messages) == 2
+        assert [(failure.account_id, failure.email) for failure in failures] == [("account_1", "rejected@example.com")]
+
+    def test_connection_checkout_times_out_when_pool_is_exhausted(self) -> None:
+        with mock.patch.dict(ConfigService.config_manager.config_store["smtp"], {"pool_max_size": 1}):
+            pool = SmtpService._get_pool()
+
+        with pool.connection():
+            with pytest.raises(ServiceError):
+                with pool.connection(timeout_in_seconds=0.1):
+                    pass
+
+    def test_templates_are_compiled_once(self) -> None:
+        for _ in range(3):
+            SmtpService.send_email(self._get_email_params())
+
+        os.remove(os.path.join(self.templates_directory.name, "welcome", "body.html"))
+        SmtpService.send_email(self._get_email_params())
+
+        assert len(self.handler.messages) == 4
+
+    def test_password_reset_email_renders_shipped_template(self) -> None:
+        with (
+            mock.patch.dict(
+                ConfigService.config_manager.config_store["smtp"],
+                {"templates_directory": DEFAULT_EMAIL_TEMPLATES_DIRECTORY},
+            ),
+            mock.patch.dict(
+                ConfigService.config_manager.config_store["mailer"], {"default_email": "no-reply@example.com"}
+            ),
+            mock.patch.dict(ConfigService.config_manager.config_store["notification"]["outbox"], {"enabled": False}),
+        ):
+            AuthenticationService.send_password_reset_email(
+                account_id="account_id", first_name="Ada", username="ada@example.com", password_reset_token="token"
+            )
+
+        assert len(self.handler.messages) == 1
+        message = self.handler.messages[0]
+        assert message["Subject"] == "Reset your password"
+        assert message["To"] == "ada@example.com"
+        assert (
+            "/accounts/account_id/reset_password?token=token"
+            in message.get_payload()[0].get_payload(decode=True).decode()
+        )
+
+    def test_unknown_template_raises_validation_error(self) -> None:
+        with pytest.raises(ValidationError):
+            SmtpService.send_email(self._get_email_params(template_id="missing"))
+
+    def test_invalid_credentials_raise_service_error(self) -> None:
+        with mock.patch.dict(ConfigService.config_manager.config_store["smtp"], {"password": "wrong"}):
+            with pytest.raises(ServiceError):
+                SmtpService.send_email(self._get_email_params())
+
+        assert len(self.handler.messages) == 0